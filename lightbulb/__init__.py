@@ -20,13 +20,19 @@
 # SOFTWARE.
 """A simple, elegant, and powerful command handler for Hikari."""
 
+from lightbulb import admission
+from lightbulb import autodefer
 from lightbulb import components
 from lightbulb import config
 from lightbulb import di
 from lightbulb import exceptions
 from lightbulb import features
 from lightbulb import internal
+from lightbulb import metrics
+from lightbulb import offload
 from lightbulb import prefab
+from lightbulb import stalls
+from lightbulb import tracing
 from lightbulb import utils
 from lightbulb.client import *
 from lightbulb.commands import *
@@ -37,6 +43,7 @@ from lightbulb.tasks import *
 
 __all__ = [
     "DEFAULT_EXECUTION_STEP_ORDER",
+    "AutocompleteCache",
     "AutocompleteContext",
     "Choice",
     "Client",
@@ -60,7 +67,9 @@ __all__ = [
     "Task",
     "TaskExecutionData",
     "UserCommand",
+    "admission",
     "attachment",
+    "autodefer",
     "boolean",
     "channel",
     "client_from_app",
@@ -76,10 +85,14 @@ __all__ = [
     "invoke",
     "localization_unsupported",
     "mentionable",
+    "metrics",
     "number",
+    "offload",
     "prefab",
     "role",
+    "stalls",
     "string",
+    "tracing",
     "uniformtrigger",
     "user",
     "utils",
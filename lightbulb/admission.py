@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Admission control for incoming interactions. An :obj:`~AdmissionController` can be passed to the client to limit
+the number of interactions of each kind that are processed concurrently, and to reject interactions that would
+otherwise be queued for longer than Discord allows before an initial response must be sent.
+
+.. dropdown:: Example
+
+    .. code-block:: python
+
+        import lightbulb
+
+        client = lightbulb.client_from_app(
+            bot,
+            admission_controller=lightbulb.admission.AdmissionController(
+                {lightbulb.admission.Lane.COMMAND: lightbulb.admission.LaneLimits(max_concurrency=16, max_queued=64)},
+                busy_message="The bot is busy right now, please try again in a few seconds.",
+            ),
+        )
+"""
+
+from __future__ import annotations
+
+__all__ = ["DEFAULT_LANE_LIMITS", "AdmissionController", "Lane", "LaneLimits", "LaneStats"]
+
+import asyncio
+import dataclasses
+import enum
+import logging
+import typing as t
+
+import async_timeout
+import hikari
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Lane(enum.Enum):
+    """Enum representing the lanes that interactions are separated into by an admission controller."""
+
+    AUTOCOMPLETE = enum.auto()
+    """Lane for autocomplete interactions."""
+    COMMAND = enum.auto()
+    """Lane for application command interactions."""
+    COMPONENT = enum.auto()
+    """Lane for component interactions."""
+    MODAL = enum.auto()
+    """Lane for modal interactions."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class LaneLimits:
+    """Dataclass representing the limits for a single admission controller lane."""
+
+    max_concurrency: int
+    """The maximum number of interactions in this lane that can be processed concurrently."""
+    max_queued: int
+    """The maximum number of interactions in this lane that can be waiting to be processed."""
+
+
+@dataclasses.dataclass(slots=True)
+class LaneStats:
+    """Dataclass containing the counters for a single admission controller lane."""
+
+    running: int = 0
+    """The number of interactions currently being processed."""
+    queued: int = 0
+    """The number of interactions currently waiting to be processed."""
+    admitted: int = 0
+    """The total number of interactions that have been admitted."""
+    shed: int = 0
+    """The total number of interactions that have been rejected."""
+    average_service_time: float = 0.0
+    """
+    The moving average of the time, in seconds, that each interaction held its slot for. This includes any work
+    done after the initial response was sent.
+    """
+
+
+DEFAULT_LANE_LIMITS: Mapping[Lane, LaneLimits] = {
+    Lane.AUTOCOMPLETE: LaneLimits(max_concurrency=32, max_queued=64),
+    Lane.COMMAND: LaneLimits(max_concurrency=64, max_queued=256),
+    Lane.COMPONENT: LaneLimits(max_concurrency=32, max_queued=128),
+    Lane.MODAL: LaneLimits(max_concurrency=16, max_queued=64),
+}
+"""The lane limits that will be used by an admission controller if you don't specify your own."""
+
+
+class _LaneState:
+    __slots__ = ("limits", "semaphore", "stats")
+
+    def __init__(self, limits: LaneLimits) -> None:
+        self.limits = limits
+        self.semaphore = asyncio.Semaphore(limits.max_concurrency)
+        self.stats = LaneStats()
+
+
+class AdmissionController:
+    """
+    Class limiting the number of interactions processed concurrently by the client. Interactions are split into
+    separate lanes - so that, for example, slow commands cannot starve autocomplete interactions - each with their
+    own concurrency limit and bounded queue.
+
+    An interaction is rejected ("shed") if its lane's queue is full, or if the time it would likely spend waiting -
+    estimated from the number of interactions ahead of it and the lane's average service time - would exceed the
+    maximum queue wait. Queued interactions are rejected once they have waited for ``deadline - response_margin``
+    seconds, leaving time for the rejection response to be sent before the deadline passes.
+
+    An interaction holds its slot until it has been handled completely, not just until its initial response has
+    been sent, so that the concurrency limit applies to all the work done for it. The average service time used
+    for the estimate is therefore the time that slots are held for.
+
+    Args:
+        limits: The limits to use for each lane. Any lanes not specified will use the
+            limits from :obj:`~DEFAULT_LANE_LIMITS`.
+        deadline: The number of seconds that an initial response must be sent within.
+            Defaults to ``3`` - the time Discord allows for an initial response to be sent.
+        response_margin: The number of seconds before the deadline that a queued interaction is rejected at, so
+            that the rejection response can still be sent in time. Defaults to ``0.5``.
+        busy_message: The content of the ephemeral response to send when rejecting command, component or modal
+            interactions. If :obj:`None`, no response will be sent. Rejected autocomplete interactions will
+            always be responded to with no choices.
+        smoothing: The smoothing factor to use when updating each lane's average service time. Must be
+            between ``0`` and ``1`` - higher values favour recent measurements.
+    """
+
+    __slots__ = ("_lanes", "busy_message", "deadline", "response_margin", "smoothing")
+
+    def __init__(
+        self,
+        limits: Mapping[Lane, LaneLimits] | None = None,
+        *,
+        deadline: float = 3,
+        response_margin: float = 0.5,
+        busy_message: str | None = None,
+        smoothing: float = 0.2,
+    ) -> None:
+        if not 0 < smoothing <= 1:
+            raise ValueError("'smoothing' must be greater than 0 and less than or equal to 1")
+
+        self.deadline: float = deadline
+        """The number of seconds that an initial response must be sent within."""
+        self.response_margin: float = response_margin
+        """The number of seconds before the deadline that a queued interaction is rejected at."""
+        self.busy_message: str | None = busy_message
+        """The content of the ephemeral response sent when rejecting an interaction."""
+        self.smoothing: float = smoothing
+        """The smoothing factor used when updating each lane's average service time."""
+
+        self._lanes: dict[Lane, _LaneState] = {
+            lane: _LaneState((limits or {}).get(lane, DEFAULT_LANE_LIMITS[lane])) for lane in Lane
+        }
+
+    @property
+    def stats(self) -> Mapping[Lane, LaneStats]:
+        """A snapshot of the counters for each lane."""
+        return {lane: dataclasses.replace(state.stats) for lane, state in self._lanes.items()}
+
+    @staticmethod
+    def lane_for(interaction: hikari.PartialInteraction) -> Lane | None:
+        """
+        Get the lane that the given interaction should be processed in.
+
+        Args:
+            interaction: The interaction to get the lane for.
+
+        Returns:
+            The lane for the interaction, or :obj:`None` if the interaction is of an unrecognised type.
+        """
+        if isinstance(interaction, hikari.AutocompleteInteraction):
+            return Lane.AUTOCOMPLETE
+        if isinstance(interaction, hikari.CommandInteraction):
+            return Lane.COMMAND
+        if isinstance(interaction, hikari.ComponentInteraction):
+            return Lane.COMPONENT
+        if isinstance(interaction, hikari.ModalInteraction):
+            return Lane.MODAL
+        return None
+
+    @property
+    def max_queue_wait(self) -> float:
+        """The maximum number of seconds an interaction may wait to be processed before it is rejected."""
+        return max(self.deadline - self.response_margin, 0.0)
+
+    def estimated_wait(self, lane: Lane) -> float:
+        """
+        Estimate the number of seconds that a new interaction would wait before it is processed in the given lane.
+
+        Args:
+            lane: The lane to estimate the wait time for.
+
+        Returns:
+            The estimated wait time.
+        """
+        state = self._lanes[lane]
+        if not state.semaphore.locked() and not state.stats.queued:
+            return 0.0
+
+        # Every 'max_concurrency' interactions ahead of us in the queue is one more full service time to wait
+        return (state.stats.queued // state.limits.max_concurrency + 1) * state.stats.average_service_time
+
+    async def acquire(self, lane: Lane) -> bool:
+        """
+        Wait for a slot in the given lane to become available. If the interaction should be rejected instead,
+        returns :obj:`False` immediately, or once the interaction has waited for :obj:`~max_queue_wait` seconds.
+
+        If this method returns :obj:`True`, you **must** call :meth:`~AdmissionController.release` once
+        processing is complete.
+
+        Args:
+            lane: The lane to acquire a slot in.
+
+        Returns:
+            Whether a slot was acquired.
+        """
+        state, max_wait = self._lanes[lane], self.max_queue_wait
+        if (state.semaphore.locked() or state.stats.queued) and (
+            state.stats.queued >= state.limits.max_queued or self.estimated_wait(lane) > max_wait
+        ):
+            state.stats.shed += 1
+            return False
+
+        state.stats.queued += 1
+        try:
+            async with async_timeout.timeout(max_wait):
+                await state.semaphore.acquire()
+        except asyncio.TimeoutError:
+            state.stats.shed += 1
+            return False
+        finally:
+            state.stats.queued -= 1
+
+        state.stats.running += 1
+        state.stats.admitted += 1
+        return True
+
+    def release(self, lane: Lane, service_time: float) -> None:
+        """
+        Release a slot previously acquired in the given lane.
+
+        Args:
+            lane: The lane to release the slot in.
+            service_time: The number of seconds that the slot was held for. Used to update the lane's average
+                service time.
+
+        Returns:
+            :obj:`None`
+        """
+        state = self._lanes[lane]
+        state.stats.running -= 1
+        state.stats.average_service_time += self.smoothing * (service_time - state.stats.average_service_time)
+        state.semaphore.release()
+
+    async def reject(self, interaction: hikari.PartialInteraction, initial_response_sent: asyncio.Event) -> None:
+        """
+        Send the appropriate response for an interaction that was not admitted.
+
+        Args:
+            interaction: The interaction that was not admitted.
+            initial_response_sent: Asyncio event that will be set if a response is sent.
+
+        Returns:
+            :obj:`None`
+        """
+        try:
+            if isinstance(interaction, hikari.AutocompleteInteraction):
+                await interaction.create_response(())
+            elif self.busy_message is not None and isinstance(
+                interaction, (hikari.CommandInteraction, hikari.ComponentInteraction, hikari.ModalInteraction)
+            ):
+                await interaction.create_initial_response(
+                    hikari.ResponseType.MESSAGE_CREATE, self.busy_message, flags=hikari.MessageFlag.EPHEMERAL
+                )
+            else:
+                return
+        except hikari.HikariError as e:
+            LOGGER.warning("failed to respond to rejected interaction", exc_info=(type(e), e, e.__traceback__))
+            return
+
+        initial_response_sent.set()
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Automatic deferral of command responses. An :obj:`~AutoDeferrer` can be passed to the client to defer the initial
+response of commands that are likely to take longer than Discord allows to respond, without adding the overhead of
+an extra request to commands that reliably respond quickly.
+
+.. dropdown:: Example
+
+    .. code-block:: python
+
+        import lightbulb
+
+        client = lightbulb.client_from_app(bot, auto_deferrer=lightbulb.autodefer.AutoDeferrer(threshold=1.5))
+"""
+
+from __future__ import annotations
+
+__all__ = ["AutoDeferrer", "LatencyEstimate"]
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import time
+import typing as t
+
+from lightbulb.internal import responses
+
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from collections.abc import Collection
+    from collections.abc import Mapping
+
+    from lightbulb import context as context_
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True)
+class LatencyEstimate:
+    """Dataclass containing the rolling latency estimate for a single command."""
+
+    average: float = 0.0
+    """The moving average of the command's latency, in seconds."""
+    samples: int = 0
+    """The number of invocations the estimate is based on."""
+
+
+class AutoDeferrer:
+    """
+    Class that automatically defers the initial response for command invocations. A moving average of the
+    time taken for each command to send its initial response is kept, keyed by the command's qualified name.
+    For invocations that were deferred automatically, the time taken to run the whole execution pipeline is
+    used instead, as the command's own response time is not known.
+
+    An invocation is deferred as soon as it starts if its command's predicted latency exceeds the threshold.
+    Otherwise, a timer is started and the invocation is deferred if no initial response has been sent when the
+    timer expires. Deferral uses :meth:`~lightbulb.context.Context.defer`, so will do nothing if an initial
+    response has already been sent.
+
+    Args:
+        threshold: The predicted latency, in seconds, above which invocations will be deferred immediately.
+        timeout: The number of seconds after which an invocation will be deferred if no initial response
+            has been sent. Should be less than the three seconds that Discord allows, to account for network latency.
+        min_samples: The number of invocations of a command that must be recorded before its predicted latency
+            is used to defer immediately.
+        smoothing: The smoothing factor to use when updating latency estimates. Must be between ``0`` and ``1`` -
+            higher values favour recent measurements.
+        ephemeral: Whether deferred responses should be ephemeral.
+        exclude: The qualified names of commands that should never be deferred automatically - for example
+            commands that respond with a modal.
+    """
+
+    __slots__ = ("_estimates", "ephemeral", "exclude", "min_samples", "smoothing", "threshold", "timeout")
+
+    def __init__(
+        self,
+        threshold: float = 2,
+        timeout: float = 2.5,
+        *,
+        min_samples: int = 3,
+        smoothing: float = 0.2,
+        ephemeral: bool = False,
+        exclude: Collection[str] = (),
+    ) -> None:
+        if not 0 < smoothing <= 1:
+            raise ValueError("'smoothing' must be greater than 0 and less than or equal to 1")
+
+        self.threshold: float = threshold
+        """The predicted latency above which invocations will be deferred immediately."""
+        self.timeout: float = timeout
+        """The number of seconds after which an invocation will be deferred if no initial response has been sent."""
+        self.min_samples: int = min_samples
+        """The number of invocations of a command required before its predicted latency is used."""
+        self.smoothing: float = smoothing
+        """The smoothing factor used when updating latency estimates."""
+        self.ephemeral: bool = ephemeral
+        """Whether deferred responses will be ephemeral."""
+        self.exclude: frozenset[str] = frozenset(exclude)
+        """The qualified names of commands that will never be deferred automatically."""
+
+        self._estimates: dict[str, LatencyEstimate] = {}
+
+    @property
+    def estimates(self) -> Mapping[str, LatencyEstimate]:
+        """A snapshot of the latency estimate for each command, keyed by the command's qualified name."""
+        return {name: dataclasses.replace(estimate) for name, estimate in self._estimates.items()}
+
+    def predicted_latency(self, command: str) -> float | None:
+        """
+        Get the predicted latency for the command with the given qualified name.
+
+        Args:
+            command: The qualified name of the command.
+
+        Returns:
+            The predicted latency in seconds, or :obj:`None` if not enough invocations have been recorded.
+        """
+        estimate = self._estimates.get(command)
+        if estimate is None or estimate.samples < self.min_samples:
+            return None
+        return estimate.average
+
+    def record(self, command: str, latency: float) -> None:
+        """
+        Update the latency estimate for the command with the given qualified name.
+
+        Args:
+            command: The qualified name of the command.
+            latency: The measured latency of an invocation, in seconds.
+
+        Returns:
+            :obj:`None`
+        """
+        estimate = self._estimates.get(command)
+        if estimate is None:
+            self._estimates[command] = LatencyEstimate(latency, 1)
+            return
+
+        estimate.average += self.smoothing * (latency - estimate.average)
+        estimate.samples += 1
+
+    async def _defer(self, context: context_.Context) -> None:
+        try:
+            await context.defer(ephemeral=self.ephemeral)
+        except Exception as e:
+            LOGGER.warning(
+                "failed to automatically defer invocation of command %r",
+                context.command_data.qualified_name,
+                exc_info=(type(e), e, e.__traceback__),
+            )
+
+    @contextlib.asynccontextmanager
+    async def watch(self, context: context_.Context) -> AsyncGenerator[None, None]:
+        """
+        Async context manager that defers the given context when required, and records the time taken for the
+        initial response to be sent within the block against the context's command. If the context was deferred
+        automatically, or no initial response was sent, the time taken to run the whole block is recorded instead.
+        Commands that send their own response before the timer expires are never deferred by it, so the time taken
+        for that response is recorded even if the block keeps running past the timeout.
+
+        Args:
+            context: The context for the command invocation.
+
+        Example:
+
+            .. code-block:: python
+
+                async with deferrer.watch(context):
+                    await pipeline._run()
+        """
+        name = context.command_data.qualified_name
+        if name in self.exclude:
+            yield
+            return
+
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+
+        deferred = False
+
+        def on_timeout() -> None:
+            nonlocal deferred
+            # The command has already sent its own response - the time it took is what should be recorded
+            if context.initial_response_sent.is_set():
+                return
+
+            deferred = True
+            context.client.safe_create_task(self._defer(context))
+
+        handle: asyncio.TimerHandle | None = None
+        if (predicted := self.predicted_latency(name)) is not None and predicted > self.threshold:
+            LOGGER.debug("deferring invocation of command %r - predicted latency %.3fs", name, predicted)
+            deferred = True
+            await self._defer(context)
+        else:
+            handle = loop.call_later(self.timeout, on_timeout)
+
+        try:
+            yield
+        finally:
+            if handle is not None:
+                handle.cancel()
+
+            latency = None if deferred else responses.response_delay(context.initial_response_sent, started)
+            self.record(name, time.monotonic() - started if latency is None else latency)
@@ -25,27 +25,41 @@ __all__ = ["DEFAULT_EXECUTION_STEP_ORDER", "Client", "GatewayEnabledClient", "Re
 import abc
 import asyncio
 import collections
+import contextlib
+import functools
 import importlib
 import logging
 import pathlib
 import sys
+import time
 import typing as t
 
 import async_timeout
 import hikari
 import linkd
 
+from lightbulb import admission
+from lightbulb import autodefer
 from lightbulb import context as context_
 from lightbulb import di as di_
 from lightbulb import exceptions
+from lightbulb import features as features_
 from lightbulb import loaders
 from lightbulb import localization
+from lightbulb import metrics
+from lightbulb import offload
 from lightbulb import tasks
+from lightbulb import tracing
 from lightbulb import utils
 from lightbulb.commands import commands
 from lightbulb.commands import execution
 from lightbulb.commands import groups
+from lightbulb.components import menus
+from lightbulb.components import routes
 from lightbulb.internal import constants
+from lightbulb.internal import di as i_di
+from lightbulb.internal import responses
+from lightbulb.internal import routing
 from lightbulb.internal import sync
 from lightbulb.internal import types as lb_types
 from lightbulb.internal import utils as i_utils
@@ -53,20 +67,24 @@ from lightbulb.internal import utils as i_utils
 if t.TYPE_CHECKING:
     import types
     from collections.abc import AsyncGenerator
+    from collections.abc import Awaitable
     from collections.abc import Callable
     from collections.abc import Collection
     from collections.abc import Coroutine
+    from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Mapping
+    from collections.abc import MutableSequence
     from collections.abc import Sequence
 
-    from lightbulb import features as features_
+    from lightbulb import stalls
     from lightbulb.commands import options as options_
-    from lightbulb.components import menus
+    from lightbulb.components import stores
 
 T = t.TypeVar("T")
 CommandOrGroupT = t.TypeVar("CommandOrGroupT", bound=lb_types.CommandOrGroup)
 ErrorHandlerT = t.TypeVar("ErrorHandlerT", bound=lb_types.ErrorHandler)
-OptionT = t.TypeVar("OptionT", bound=hikari.CommandInteractionOption)
+ComponentHandlerT = t.TypeVar("ComponentHandlerT", bound=lb_types.ComponentHandler)
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_EXECUTION_STEP_ORDER = (
@@ -80,6 +98,45 @@ DEFAULT_EXECUTION_STEP_ORDER = (
 """The order that execution steps will be run in if you don't specify your own order."""
 
 
+class _PlanInvalidatingList(list[T]):
+    """List which clears a client's cached execution plans whenever it is modified in place."""
+
+    __slots__ = ("_plans",)
+
+    def __init__(self, items: Iterable[T], plans: dict[t.Any, t.Any]) -> None:
+        super().__init__(items)
+        self._plans = plans
+
+
+def _clears_plans(name: str) -> Callable[..., t.Any]:
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self: _PlanInvalidatingList[t.Any], *args: t.Any, **kwargs: t.Any) -> t.Any:
+        result = method(self, *args, **kwargs)
+        self._plans.clear()
+        return result
+
+    return wrapper
+
+
+for _name in (
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(_PlanInvalidatingList, _name, _clears_plans(_name))
+
+
 @t.runtime_checkable
 class GatewayClientAppT(hikari.EventManagerAware, hikari.RESTAware, t.Protocol):
     """Protocol indicating an application supports gateway events."""
@@ -110,6 +167,26 @@ class Client(abc.ABC):
             dynamically created in guilds, for example enabled on a per-guild basis using feature flags.
         hooks: Execution hooks that should be applied to all commands. These hooks will always run **before**
             all other hooks registered for the same step are executed.
+        sync_commands: Whether to sync commands that are registered to the client before starting.
+        features: Experimental features to enable for this client.
+        menu_store: The store to use to persist menus attached with ``persist=True``, allowing them to be rebuilt
+            after a restart.
+        max_rehydrated_menus: The maximum number of menus rebuilt from the menu store that will be kept attached
+            to the client. When exceeded, the least recently used menu will be detached - it will be rebuilt again
+            from the store if another interaction for it is received.
+        admission_controller: The admission controller to use to limit the number of interactions processed
+            concurrently.
+        auto_deferrer: The auto-deferrer to use to automatically defer the initial response of slow commands.
+        fail_fast: Whether command execution should stop at the first hook or invocation failure by default.
+            Can be overridden on a per-command basis.
+        metrics_sink: The sink to send timings for option resolution, each hook and each command invocation to.
+        tracer: The tracer to use to record spans covering the handling of each interaction.
+        offloader: The offloader to use to run blocking or CPU-bound work away from the event loop. It will
+            be started and closed along with the client, and registered as a dependency.
+        stall_detector: The stall detector to use to record which commands, hooks, listeners, tasks and menus block
+            the event loop. Its loop lag sampler will be started and stopped along with the client.
+        validate_dependencies: Whether to check that the dependencies of all commands, hooks, error handlers,
+            autocomplete providers, listeners and tasks can be provided when the client is started.
     """
 
     __slots__ = (
@@ -117,28 +194,52 @@ class Client(abc.ABC):
         "_asyncio_tasks",
         "_attached_menus",
         "_attached_modals",
+        "_autocomplete_cancellations",
+        "_autocomplete_tasks",
         "_command_invocation_mapping",
+        "_command_routes",
+        "_component_router",
         "_created_commands",
         "_current_extension_being_loaded",
+        "_dependency_warmup_timings",
         "_di",
+        "_error_handler_chain",
+        "_error_handler_dispatch_cache",
+        "_error_handler_filters",
         "_error_handlers",
+        "_execution_plans",
+        "_execution_step_order",
         "_extensions",
+        "_fail_fast",
         "_features",
+        "_hooks",
+        "_listeners",
         "_localization",
         "_menu_queues",
+        "_menu_writes",
         "_owner_ids",
         "_registered_commands",
+        "_rehydrated_menus",
+        "_runtime_dependencies",
         "_started",
         "_tasks",
+        "_warmup_dependencies",
+        "admission_controller",
+        "auto_deferrer",
         "default_enabled_guilds",
         "default_locale",
         "deferred_registration_callback",
         "delete_unknown_commands",
-        "execution_step_order",
-        "hooks",
         "localization_provider",
+        "max_rehydrated_menus",
+        "menu_store",
+        "metrics_sink",
+        "offloader",
         "rest",
+        "stall_detector",
         "sync_commands",
+        "tracer",
+        "validate_dependencies",
     )
 
     def __init__(
@@ -154,20 +255,52 @@ class Client(abc.ABC):
         sync_commands: bool,
         *,
         features: Sequence[features_.Feature],
+        menu_store: stores.MenuStore | None,
+        max_rehydrated_menus: int,
+        admission_controller: admission.AdmissionController | None,
+        auto_deferrer: autodefer.AutoDeferrer | None,
+        fail_fast: bool,
+        metrics_sink: metrics.MetricsSink | None,
+        tracer: tracing.Tracer | None,
+        offloader: offload.Offloader | None,
+        stall_detector: stalls.StallDetector | None,
+        validate_dependencies: bool,
     ) -> None:
         super().__init__()
 
         self.rest: hikari.api.RESTClient = rest
         self.default_enabled_guilds: Sequence[hikari.Snowflakeish] = default_enabled_guilds
-        self.execution_step_order: Sequence[execution.ExecutionStep] = execution_step_order
+        self._execution_plans: dict[
+            type[commands.CommandBase],
+            tuple[Sequence[execution.ExecutionHook], bool | None, execution.ExecutionPlan],
+        ] = {}
+        self._execution_step_order: MutableSequence[execution.ExecutionStep] = _PlanInvalidatingList(
+            execution_step_order, self._execution_plans
+        )
         self.default_locale: hikari.Locale = default_locale
         self.localization_provider: localization.LocalizationProvider = localization_provider
         self.delete_unknown_commands: bool = delete_unknown_commands
         self.deferred_registration_callback: lb_types.DeferredRegistrationCallback | None = (
             deferred_registration_callback
         )
-        self.hooks: Sequence[execution.ExecutionHook] = hooks
+        self._hooks: MutableSequence[execution.ExecutionHook] = _PlanInvalidatingList(hooks, self._execution_plans)
+        self._fail_fast: bool = fail_fast
         self.sync_commands: bool = sync_commands
+        self.menu_store: stores.MenuStore | None = menu_store
+        self.max_rehydrated_menus: int = max_rehydrated_menus
+        self.admission_controller: admission.AdmissionController | None = admission_controller
+        self.auto_deferrer: autodefer.AutoDeferrer | None = auto_deferrer
+        self.metrics_sink: metrics.MetricsSink | None = metrics_sink
+        self.tracer: tracing.Tracer | None = tracer
+        self.offloader: offload.Offloader | None = offloader
+        self.stall_detector: stalls.StallDetector | None = stall_detector
+        self.validate_dependencies: bool = validate_dependencies
+        # Values added to the containers by the client when entering each context
+        self._runtime_dependencies: i_di.RuntimeDependencies = {}
+        i_di.provided_at_runtime(
+            self._runtime_dependencies, di_.Contexts.COMMAND, context_.Context, execution.ExecutionPipeline
+        )
+        i_di.provided_at_runtime(self._runtime_dependencies, di_.Contexts.AUTOCOMPLETE, context_.AutocompleteContext)
 
         self._features = set(features)
         self._di = linkd.DependencyInjectionManager()
@@ -178,23 +311,44 @@ class Client(abc.ABC):
         self._command_invocation_mapping: dict[
             hikari.Snowflakeish, dict[tuple[str, ...], i_utils.CommandCollection]
         ] = collections.defaultdict(lambda: collections.defaultdict(i_utils.CommandCollection))
+        self._command_routes: routing.CommandRoutes = {}
         self._created_commands: dict[hikari.Snowflakeish, Collection[hikari.PartialCommand]] = {}
 
         self._error_handlers: dict[int, list[lb_types.ErrorHandler]] = {}
+        self._error_handler_filters: dict[lb_types.ErrorHandler, tuple[type[Exception], ...]] = {}
+        self._error_handler_chain: tuple[tuple[lb_types.ErrorHandler, tuple[type[Exception], ...]], ...] = ()
+        self._error_handler_dispatch_cache: dict[tuple[type[Exception], ...], tuple[lb_types.ErrorHandler, ...]] = {}
         self._application: hikari.Application | None = None
 
         self._extensions: set[str] = set()
         self._current_extension_being_loaded: str | None = None
 
         self._tasks: set[tasks.Task] = set()
+        self._listeners: set[Callable[..., Awaitable[t.Any]]] = set()
 
-        self._attached_menus: set[menus._MenuInteractionHandlerContainer] = set()
+        self._warmup_dependencies: list[t.Any] = []
+        self._dependency_warmup_timings: dict[str, float] = {}
+
+        # Menus attached for each custom ID, in the order they were attached - the last one receives interactions
+        self._attached_menus: dict[str, list[menus._MenuInteractionHandlerContainer]] = {}
         self._attached_modals: dict[str, Callable[[hikari.ModalInteraction, asyncio.Event], t.Awaitable[None]]] = {}
+        self._component_router: routes.ComponentRouter = routes.ComponentRouter()
+        self._rehydrated_menus: collections.OrderedDict[str, menus._MenuInteractionHandlerContainer] = (
+            collections.OrderedDict()
+        )
+        # The most recently scheduled write to the menu store for each persisted menu - writes for the same
+        # menu are chained so that they are applied in the order they were made
+        self._menu_writes: dict[str, asyncio.Task[None]] = {}
 
         self._asyncio_tasks: set[asyncio.Task[t.Any]] = set()
 
+        self._autocomplete_tasks: dict[tuple[hikari.Snowflake, str, str], asyncio.Task[None]] = {}
+        self._autocomplete_cancellations: int = 0
+
         self.di.registry_for(di_.Contexts.DEFAULT).register_value(hikari.api.RESTClient, self.rest)
         self.di.registry_for(di_.Contexts.DEFAULT).register_value(Client, self)
+        if offloader is not None:
+            self.di.registry_for(di_.Contexts.DEFAULT).register_value(offload.Offloader, offloader)
 
         self._started = False
 
@@ -223,6 +377,131 @@ class Client(abc.ABC):
     def app(self) -> hikari.RESTAware:
         """The app that this client was created from."""
 
+    @property
+    def autocomplete_cancellations(self) -> int:
+        """
+        The number of autocomplete provider invocations that have been cancelled because a newer autocomplete
+        interaction for the same user, command and option was received before they completed.
+        """
+        return self._autocomplete_cancellations
+
+    @property
+    def execution_step_order(self) -> MutableSequence[execution.ExecutionStep]:
+        """
+        The order that execution steps will be run in upon command processing. This can be modified in place
+        or replaced.
+        """
+        return self._execution_step_order
+
+    @execution_step_order.setter
+    def execution_step_order(self, value: Sequence[execution.ExecutionStep]) -> None:
+        self._execution_step_order = _PlanInvalidatingList(value, self._execution_plans)
+        self._execution_plans.clear()
+
+    @property
+    def hooks(self) -> MutableSequence[execution.ExecutionHook]:
+        """
+        Execution hooks that are applied to all commands. These hooks will always run **before**
+        all other hooks registered for the same step are executed. This can be modified in place or replaced.
+        """
+        return self._hooks
+
+    @hooks.setter
+    def hooks(self, value: Sequence[execution.ExecutionHook]) -> None:
+        self._hooks = _PlanInvalidatingList(value, self._execution_plans)
+        self._execution_plans.clear()
+
+    @property
+    def fail_fast(self) -> bool:
+        """
+        Whether command execution stops at the first hook or invocation failure by default, skipping all
+        remaining hooks apart from those marked ``always_run``.
+        """
+        return self._fail_fast
+
+    @fail_fast.setter
+    def fail_fast(self, value: bool) -> None:
+        self._fail_fast = value
+        self._execution_plans.clear()
+
+    def _execution_plan_for(self, command: type[commands.CommandBase]) -> execution.ExecutionPlan:
+        command_hooks, command_fail_fast = command._command_data.hooks, command._command_data.fail_fast
+        if (
+            (cached := self._execution_plans.get(command)) is not None
+            and cached[0] is command_hooks
+            and cached[1] is command_fail_fast
+        ):
+            return cached[2]
+
+        # The context is injected instead of being passed to the invoke method when the feature is enabled
+        n_invoke_args = 1 if features_.COMMAND_INJECT_CONTEXT in self._features else 2
+        plan = execution._compile_execution_plan(
+            self._execution_step_order,
+            [*self._hooks, *command_hooks],
+            features_.HOOK_INJECT_ALL_PARAMS in self._features,
+            self._fail_fast if command_fail_fast is None else command_fail_fast,
+            i_di.direct_callable(getattr(command, command._command_data.invoke_method), n_invoke_args),
+        )
+        self._execution_plans[command] = (command_hooks, command_fail_fast, plan)
+        return plan
+
+    def _dependents(self) -> Iterator[i_di.Dependent]:
+        all_commands: list[type[commands.CommandBase]] = []
+        for command_or_group in self._registered_commands:
+            if not isinstance(command_or_group, groups.Group):
+                all_commands.append(command_or_group)
+                continue
+
+            for subcommand_or_subgroup in command_or_group.subcommands.values():
+                if isinstance(subcommand_or_subgroup, groups.SubGroup):
+                    all_commands.extend(subcommand_or_subgroup.subcommands.values())
+                else:
+                    all_commands.append(subcommand_or_subgroup)
+
+        n_hook_args = 0 if features_.HOOK_INJECT_ALL_PARAMS in self._features else 2
+        # Invoke methods are counted as taking 'self'
+        n_invoke_args = 1 if features_.COMMAND_INJECT_CONTEXT in self._features else 2
+
+        seen_hooks: set[execution.ExecutionHook] = set()
+        for hook in self._hooks:
+            seen_hooks.add(hook)
+            yield di_.Contexts.COMMAND, f"hook {hook.name!r}", hook.func, n_hook_args
+
+        for command in all_commands:
+            data = command._command_data
+            yield (
+                di_.Contexts.COMMAND,
+                f"command {data.qualified_name!r}",
+                getattr(command, data.invoke_method),
+                n_invoke_args,
+            )
+
+            for hook in data.hooks:
+                if hook in seen_hooks:
+                    continue
+                seen_hooks.add(hook)
+                yield di_.Contexts.COMMAND, f"hook {hook.name!r}", hook.func, n_hook_args
+
+            for option in data.options.values():
+                if option.autocomplete_provider is hikari.UNDEFINED:
+                    continue
+                yield (
+                    di_.Contexts.AUTOCOMPLETE,
+                    f"autocomplete provider for option {option.name!r} of command {data.qualified_name!r}",
+                    option.autocomplete_provider,
+                    1,
+                )
+
+        for handlers in self._error_handlers.values():
+            for handler in handlers:
+                yield di_.Contexts.COMMAND, f"error handler {handler.__name__!r}", handler, 1
+
+        for listener in self._listeners:
+            yield di_.Contexts.LISTENER, f"listener {listener.__name__!r}", listener, 1
+
+        for task in self._tasks:
+            yield di_.Contexts.TASK, f"task {task._func.__name__!r}", task._func, 0
+
     @property
     def di(self) -> linkd.DependencyInjectionManager:
         """The dependency injection manager used by this client."""
@@ -306,26 +585,118 @@ class Client(abc.ABC):
     async def start(self, *_: t.Any) -> None:
         """
         Starts the client. Ensures that commands are registered properly with the client, and that
-        commands have been synced with discord. Also starts any tasks that were created with `auto_start` set to
-        :obj:`True`.
+        commands have been synced with discord. Also creates any dependencies declared using :meth:`~Client.warm_up`,
+        and starts any tasks that were created with `auto_start` set to :obj:`True`.
 
         Returns:
             :obj:`None`
 
         Raises:
             :obj:`RuntimeError`: If the client has already been started.
+            :obj:`~lightbulb.di.DependencyNotSatisfiableException`: If dependency validation is enabled and
+                any dependencies cannot be provided.
+            :obj:`~lightbulb.di.CircularDependencyException`: If dependency validation is enabled and any
+                dependencies depend on themselves.
+            :obj:`~lightbulb.di.DependencyNotSatisfiableException`: If any of the dependencies being warmed
+                up could not be created. Any that were created are torn down, and the offloader and stall
+                detector are closed if they were started by this call.
         """
         if self._started:
             raise RuntimeError("cannot start already-started client")
 
+        if di_.DI_ENABLED:
+            dependents = list(self._dependents())
+            if self.validate_dependencies:
+                i_di.validate_dependencies(self.di, dependents, self._runtime_dependencies)
+            for dependent in dependents:
+                i_di.cache_resolution_plan(dependent[2])
+
         await self.sync_application_commands()
 
+        # Dependency factories may offload work, so the offloader must be started before warming up
+        offloader = self.offloader if self.offloader is not None and not self.offloader.started else None
+        if offloader is not None:
+            offloader.start()
+
+        stall_detector = (
+            self.stall_detector if self.stall_detector is not None and not self.stall_detector.running else None
+        )
+        if stall_detector is not None:
+            stall_detector.start()
+
+        if self._warmup_dependencies and di_.DI_ENABLED:
+            try:
+                await self._warm_up_dependencies()
+            except Exception:
+                # The client is not started, so stop() would not close what was started above
+                if offloader is not None:
+                    await offloader.close()
+                if stall_detector is not None:
+                    await stall_detector.close()
+                raise
+
         self._started = True
 
         for task in self._tasks:
             if task._auto_start:
                 task.start()
 
+    async def _warm_up_dependencies(self) -> None:
+        try:
+            timings = await i_di.warm_up(self.di, self._warmup_dependencies)
+        except Exception:
+            await self.di.close()
+            raise
+
+        for dependency_id, duration_ns in timings.items():
+            self._dependency_warmup_timings[dependency_id] = duration_ns / 1e9
+            LOGGER.debug("created dependency %r in %.3fs", dependency_id, duration_ns / 1e9)
+            if self.metrics_sink is not None:
+                self.metrics_sink.record(metrics.DEPENDENCY_WARMUP_DURATION, duration_ns, {"dependency": dependency_id})
+
+    def warm_up(self, *types: t.Any) -> None:
+        """
+        Declare singleton dependencies registered for the ``DEFAULT`` context that should be created while the
+        client is starting, instead of the first time they are requested. Any singleton dependencies that their
+        factories require will also be created.
+
+        Dependencies are created concurrently, with each only being created once all the dependencies it requires
+        have been. They are torn down in the reverse order when the client is stopped. The time taken to create
+        each dependency is available from :attr:`~Client.dependency_warmup_timings`, and is recorded to the
+        metrics sink, if one is set.
+
+        Args:
+            *types: The types of the dependencies to create.
+
+        Returns:
+            :obj:`None`
+
+        Raises:
+            :obj:`RuntimeError`: If the client has already been started.
+
+        Example:
+
+            .. code-block:: python
+
+                registry = client.di.registry_for(lightbulb.di.Contexts.DEFAULT)
+                registry.register_factory(asyncpg.Pool, create_pool, teardown=close_pool)
+                registry.register_factory(aiohttp.ClientSession, aiohttp.ClientSession, teardown=close_session)
+
+                client.warm_up(asyncpg.Pool, aiohttp.ClientSession)
+        """
+        if self._started:
+            raise RuntimeError("cannot declare dependencies to warm up after the client has been started")
+
+        self._warmup_dependencies.extend(typ for typ in types if typ not in self._warmup_dependencies)
+
+    @property
+    def dependency_warmup_timings(self) -> Mapping[str, float]:
+        """
+        Mapping of dependency ID to the time in seconds taken to create each dependency that was warmed up when the
+        client was started. This does not include time spent waiting for the dependencies it requires to be created.
+        """
+        return self._dependency_warmup_timings
+
     async def stop(self, *_: t.Any) -> None:
         """
         Stops the client. Cancelling any tasks that are running, and closing the default DI container - causing teardown
@@ -340,8 +711,22 @@ class Client(abc.ABC):
         for task in self._tasks:
             task.cancel()
 
+        if self.menu_store is not None:
+            if self._menu_writes:
+                await asyncio.wait(list(self._menu_writes.values()))
+            await self.menu_store.close()
+
         await self.di.close()
 
+        if self.offloader is not None:
+            await self.offloader.close()
+
+        if self.stall_detector is not None:
+            await self.stall_detector.close()
+
+        if self.tracer is not None:
+            self.tracer.close()
+
     @t.overload
     def task(
         self, trigger: tasks.Trigger, /, auto_start: bool = True, max_failures: int = 1, max_invocations: int = -1
@@ -430,13 +815,25 @@ class Client(abc.ABC):
         self._tasks.remove(task)
 
     @t.overload
-    def error_handler(self, *, priority: int = 0) -> Callable[[ErrorHandlerT], ErrorHandlerT]: ...
+    def error_handler(
+        self, *, priority: int = 0, on: type[Exception] | Sequence[type[Exception]] | None = None
+    ) -> Callable[[ErrorHandlerT], ErrorHandlerT]: ...
 
     @t.overload
-    def error_handler(self, func: ErrorHandlerT, *, priority: int = 0) -> ErrorHandlerT: ...
+    def error_handler(
+        self,
+        func: ErrorHandlerT,
+        *,
+        priority: int = 0,
+        on: type[Exception] | Sequence[type[Exception]] | None = None,
+    ) -> ErrorHandlerT: ...
 
     def error_handler(
-        self, func: ErrorHandlerT | None = None, *, priority: int = 0
+        self,
+        func: ErrorHandlerT | None = None,
+        *,
+        priority: int = 0,
+        on: type[Exception] | Sequence[type[Exception]] | None = None,
     ) -> ErrorHandlerT | Callable[[ErrorHandlerT], ErrorHandlerT]:
         """
         Register an error handler function to call when an :obj:`~lightbulb.commands.execution.ExecutionPipeline` fails.
@@ -450,6 +847,9 @@ class Client(abc.ABC):
             func: The function to register as a command error handler.
             priority: The priority that this handler should be registered at. Higher priority handlers
                 will be executed first.
+            on: The exception type, or sequence of exception types, that this handler handles. If specified, the
+                handler will only be called when one of the exception's ``causes`` is an instance of one of the
+                given types. If unspecified, the handler will be called for all failures.
         """
         if func is not None:
             wrapped = di_.with_di(func)
@@ -461,10 +861,14 @@ class Client(abc.ABC):
             sorted_handlers = sorted(self._error_handlers.items(), key=lambda item: item[0], reverse=True)
             self._error_handlers = {k: v for k, v in sorted_handlers}
 
+            if on is not None:
+                self._error_handler_filters[wrapped] = (on,) if isinstance(on, type) else tuple(on)  # type: ignore[reportArgumentType]
+            self._rebuild_error_handler_chain()
+
             return t.cast("ErrorHandlerT", wrapped)
 
         def _inner(func_: ErrorHandlerT) -> ErrorHandlerT:
-            return self.error_handler(func_, priority=priority)
+            return self.error_handler(func_, priority=priority, on=on)
 
         return _inner
 
@@ -490,6 +894,78 @@ class Client(abc.ABC):
 
         sorted_handlers = sorted(new_handlers.items(), key=lambda item: item[0], reverse=True)
         self._error_handlers = {k: v for k, v in sorted_handlers}
+        self._rebuild_error_handler_chain()
+
+    def _rebuild_error_handler_chain(self) -> None:
+        chain = tuple(
+            (handler, self._error_handler_filters.get(handler, ()))
+            for handlers in self._error_handlers.values()
+            for handler in handlers
+        )
+        self._error_handler_filters = {handler: filters for handler, filters in chain if filters}
+        self._error_handler_chain = chain
+        self._error_handler_dispatch_cache.clear()
+
+    def _error_handlers_for(self, exc: exceptions.ExecutionPipelineFailedException) -> Sequence[lb_types.ErrorHandler]:
+        key = tuple(type(cause) for cause in exc.causes)
+        if (handlers := self._error_handler_dispatch_cache.get(key)) is not None:
+            return handlers
+
+        handlers = self._error_handler_dispatch_cache[key] = tuple(
+            handler
+            for handler, filters in self._error_handler_chain
+            if not filters or any(issubclass(cause_type, filters) for cause_type in key)
+        )
+        return handlers
+
+    def component_handler(self, pattern: str) -> Callable[[ComponentHandlerT], ComponentHandlerT]:
+        """
+        Second order decorator to register a persistent handler for component interactions with a custom ID
+        matching the given pattern. Also enables dependency injection for the handler function.
+
+        Patterns are made up of segments separated by ``:``. Each segment is either a literal, which must be matched
+        exactly, or a parameter in the form ``{name}``, which will match any single segment. The values of any
+        parameters will be passed to the handler function as keyword arguments, along with the
+        :obj:`~lightbulb.components.routes.ComponentContext` as the first argument.
+
+        Handlers registered this way are only used for component interactions that are not handled by an
+        attached menu. If multiple patterns match a custom ID, literal segments will take precedence over parameters.
+
+        Args:
+            pattern: The custom ID pattern to register the handler for.
+
+        Example:
+
+            .. code-block:: python
+
+                @client.component_handler("ticket:close:{ticket_id}")
+                async def close_ticket(ctx: lightbulb.components.ComponentContext, ticket_id: str) -> None:
+                    await ctx.respond(f"Closing ticket {ticket_id}", edit=True)
+
+        Raises:
+            :obj:`ValueError`: If the pattern is invalid, or a handler is already registered for an
+                equivalent pattern.
+        """
+
+        def _inner(func: ComponentHandlerT) -> ComponentHandlerT:
+            wrapped = di_.with_di(func)
+            self._component_router.add(pattern, wrapped)  # type: ignore[reportArgumentType]
+            return t.cast("ComponentHandlerT", wrapped)
+
+        return _inner
+
+    def remove_component_handler(self, pattern: str) -> None:
+        """
+        Unregister the component handler for the given pattern from the client. If no handler is registered
+        for the pattern, this will do nothing.
+
+        Args:
+            pattern: The custom ID pattern to unregister the handler for.
+
+        Returns:
+            :obj:`None`
+        """
+        self._component_router.remove(pattern)
 
     @t.overload
     def register(
@@ -661,6 +1137,7 @@ class Client(abc.ABC):
                     collection.remove(command)
 
         self._registered_commands.pop(command, None)
+        self._command_routes = routing.build_command_routes(self._command_invocation_mapping)
 
     async def load_extensions(self, *import_paths: str) -> None:
         """
@@ -935,21 +1412,14 @@ class Client(abc.ABC):
                 for command_path, actual_command in all_commands.items():
                     self._command_invocation_mapping[snowflake][command_path].put(actual_command)
 
+        self._command_routes = routing.build_command_routes(self._command_invocation_mapping)
+
         if _force_no_api_call:
             return
 
         if self.sync_commands:
             await sync.sync_application_commands(self)
 
-    @staticmethod
-    def _get_subcommand(
-        options: Sequence[OptionT],
-    ) -> OptionT | None:
-        subcommand = filter(
-            lambda o: o.type in (hikari.OptionType.SUB_COMMAND, hikari.OptionType.SUB_COMMAND_GROUP), options
-        )
-        return next(subcommand, None)
-
     @t.overload
     def _resolve_options_and_command(
         self, interaction: hikari.AutocompleteInteraction
@@ -969,37 +1439,21 @@ class Client(abc.ABC):
         ]
         | None
     ):
-        command_path = [interaction.command_name]
-
-        subcommand: hikari.CommandInteractionOption | hikari.AutocompleteInteractionOption | None
-        options: Sequence[hikari.CommandInteractionOption] = interaction.options or []
-        while (subcommand := self._get_subcommand(options)) is not None:
-            command_path.append(subcommand.name)
-            options = subcommand.options or []
-
-        global_commands = self._command_invocation_mapping.get(constants.GLOBAL_COMMAND_KEY, {}).get(
-            tuple(command_path)
-        )
-        guild_commands = self._command_invocation_mapping.get(
-            interaction.registered_guild_id or constants.GLOBAL_COMMAND_KEY, {}
-        ).get(tuple(command_path))
+        with tracing.span("lightbulb.routing", command_name=interaction.command_name) as span:
+            out = routing.resolve_command_route(
+                self._command_routes,
+                interaction.registered_guild_id or constants.GLOBAL_COMMAND_KEY,
+                interaction.command_type,
+                interaction.command_name,
+                interaction.options,
+            )
+            if span is not None:
+                span.attributes["resolved"] = out is not None
 
-        root_commands = guild_commands if interaction.registered_guild_id is not None else global_commands
-        if root_commands is None:
+        if out is None:
             LOGGER.debug("ignoring interaction received for unknown command - %r", interaction.command_name)
-            return None
-
-        command = {
-            int(hikari.CommandType.SLASH): root_commands.slash,
-            int(hikari.CommandType.USER): root_commands.user,
-            int(hikari.CommandType.MESSAGE): root_commands.message,
-        }[int(interaction.command_type)]
-
-        if command is None:
-            LOGGER.debug("ignoring interaction received for unknown command - %r", " ".join(command_path))
-            return None
 
-        return options, command
+        return out
 
     def build_autocomplete_context(
         self,
@@ -1031,14 +1485,14 @@ class Client(abc.ABC):
     async def _execute_autocomplete_context(
         self, context: context_.AutocompleteContext[t.Any], autocomplete_provider: options_.AutocompleteProvider[t.Any]
     ) -> None:
-        async with (
-            self.di.enter_context(di_.Contexts.DEFAULT),
-            self.di.enter_context(di_.Contexts.AUTOCOMPLETE) as container,
-        ):
-            container.add_value(context_.AutocompleteContext, context)
-
+        async with i_di.lazy_context(self.di, di_.Contexts.AUTOCOMPLETE, (context_.AutocompleteContext, context)):
             try:
-                await autocomplete_provider(context)
+                if self.stall_detector is None:
+                    await autocomplete_provider(context)
+                else:
+                    await self.stall_detector.monitor(
+                        autocomplete_provider(context), "autocomplete", context.command._command_data.qualified_name
+                    )
             except Exception as e:
                 LOGGER.error(
                     "error encountered during invocation of autocomplete for command %r",
@@ -1064,18 +1518,61 @@ class Client(abc.ABC):
 
         context = self.build_autocomplete_context(interaction, options, command, initial_response_sent)
 
-        option = next(
-            filter(lambda opt: opt._localized_name == context.focused.name, command._command_data.options.values()),
-            None,
-        )
+        option = command._command_data._options_by_localized_name.get(context.focused.name)
         if option is None or not option.autocomplete:
             LOGGER.debug("interaction appears to refer to option that has autocomplete disabled - ignoring")
             return
 
-        LOGGER.debug("%r - invoking autocomplete", command._command_data.qualified_name)
+        with tracing.span(
+            "lightbulb.autocomplete", command=command._command_data.qualified_name, option=option.name
+        ) as span:
+            # Any in-flight autocomplete for the same user and option is now stale - its response would never be shown
+            task_key = (interaction.user.id, command._command_data.qualified_name, option.name)
+            if (previous := self._autocomplete_tasks.pop(task_key, None)) is not None and not previous.done():
+                previous.cancel()
+                self._autocomplete_cancellations += 1
+
+            cache = option.autocomplete_cache
+            key = cache._key(context, option) if cache is not None else None
+            if cache is not None and (choices := cache._get(key)) is not None:
+                if span is not None:
+                    span.attributes["cached"] = True
+
+                LOGGER.debug("%r - responding to autocomplete from cache", command._command_data.qualified_name)
+                await interaction.create_response(choices)
+                initial_response_sent.set()
+                return
+
+            LOGGER.debug("%r - invoking autocomplete", command._command_data.qualified_name)
+
+            assert option._autocomplete_callable is not None
+            task = asyncio.create_task(self._execute_autocomplete_context(context, option._autocomplete_callable))
+            self._autocomplete_tasks[task_key] = task
+            try:
+                # Use 'wait' instead of awaiting the task directly so that we can tell whether the task was cancelled
+                # because it was superseded, or because this coroutine was cancelled
+                await asyncio.wait((task,))
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            finally:
+                if self._autocomplete_tasks.get(task_key) is task:
+                    del self._autocomplete_tasks[task_key]
+
+            if task.cancelled():
+                if span is not None:
+                    span.attributes["superseded"] = True
 
-        assert option.autocomplete_provider is not hikari.UNDEFINED
-        await self._execute_autocomplete_context(context, option.autocomplete_provider)
+                LOGGER.debug(
+                    "%r - autocomplete superseded by a newer interaction", command._command_data.qualified_name
+                )
+                # No response will ever be sent for this interaction - release anything waiting for one, such as
+                # the REST interaction handler, instead of leaving it to time out
+                initial_response_sent.set()
+                return
+
+            if cache is not None and context._response is not None:
+                cache._put(key, context._response)
 
     def build_command_context(
         self,
@@ -1105,23 +1602,31 @@ class Client(abc.ABC):
         )
 
     async def _execute_command_context(self, context: context_.Context) -> None:
-        pipeline = execution.ExecutionPipeline(context, self.execution_step_order)
+        with tracing.span("lightbulb.command", command=context.command_data.qualified_name):
+            await self._execute_command_pipeline(context)
 
+    async def _execute_command_pipeline(self, context: context_.Context) -> None:
+        pipeline = execution.ExecutionPipeline(
+            context, self._execution_step_order, plan=self._execution_plan_for(type(context.command))
+        )
+
+        # Containers are only created if a dependency is requested
         async with (
-            self.di.enter_context(di_.Contexts.DEFAULT),
-            self.di.enter_context(di_.Contexts.COMMAND) as container,
+            i_di.lazy_context(
+                self.di,
+                di_.Contexts.COMMAND,
+                (context_.Context, context),
+                (execution.ExecutionPipeline, pipeline),
+            ),
+            self.auto_deferrer.watch(context) if self.auto_deferrer is not None else contextlib.nullcontext(),
         ):
-            container.add_value(context_.Context, context)
-            container.add_value(execution.ExecutionPipeline, pipeline)
-
             try:
                 await pipeline._run()
             except exceptions.ExecutionPipelineFailedException as ex:
-                all_handlers = [handler for handlers in self._error_handlers.values() for handler in handlers]
-
                 handled = False
-                while all_handlers and not handled:
-                    handled = await utils.maybe_await((all_handlers.pop(0))(ex))
+                for handler in self._error_handlers_for(ex):
+                    if handled := await utils.maybe_await(handler(ex)):
+                        break
 
                 if not handled:
                     LOGGER.error(
@@ -1153,11 +1658,89 @@ class Client(abc.ABC):
             LOGGER.debug("ignoring component interaction received before the client was started")
             return
 
-        menu = next((m for m in self._attached_menus if interaction.custom_id in m.custom_ids), None)
+        menu = self._attached_menu(interaction.custom_id)
+        if menu is None:
+            route = self._component_router.resolve(interaction.custom_id)
+            if route is not None:
+                await self._invoke_component_handler(interaction, initial_response_sent, *route)
+                return
+
+            if self.menu_store is None:
+                return
+
+            menu = await self._rehydrate_menu(interaction.custom_id)
+
         if menu is None or menu.on_interaction is None:
             return
 
-        await menu.on_interaction(interaction, initial_response_sent)
+        if menu._menu_id in self._rehydrated_menus:
+            self._rehydrated_menus.move_to_end(menu._menu_id)
+
+        with tracing.span("lightbulb.menu", custom_id=interaction.custom_id, menu_id=menu._menu_id):
+            if self.stall_detector is None:
+                await menu.on_interaction(interaction, initial_response_sent)
+            else:
+                await self.stall_detector.monitor(
+                    menu.on_interaction(interaction, initial_response_sent), "menu", type(menu._menu).__name__
+                )
+
+    def _attached_menu(self, custom_id: str) -> menus._MenuInteractionHandlerContainer | None:
+        attached = self._attached_menus.get(custom_id)
+        return attached[-1] if attached else None
+
+    async def _rehydrate_menu(self, custom_id: str) -> menus._MenuInteractionHandlerContainer | None:
+        assert self.menu_store is not None
+
+        record = await self.menu_store.get(custom_id)
+        if record is None:
+            return None
+
+        # Another interaction may have caused the menu to be rebuilt while we were waiting for the store
+        if (existing := self._attached_menu(custom_id)) is not None:
+            return existing
+
+        try:
+            menu = menus._MenuInteractionHandlerContainer._rehydrate(self, record)
+        except Exception as e:
+            LOGGER.error(
+                "failed to rebuild persisted menu %r of type %r",
+                record.menu_id,
+                record.menu_type,
+                exc_info=(type(e), e, e.__traceback__),
+            )
+            return None
+
+        LOGGER.debug("rebuilt persisted menu %r of type %r", record.menu_id, record.menu_type)
+        menu._attach()
+        self._rehydrated_menus[record.menu_id] = menu
+        while len(self._rehydrated_menus) > self.max_rehydrated_menus:
+            _, evicted = self._rehydrated_menus.popitem(last=False)
+            evicted._detach()
+
+        return menu
+
+    async def _invoke_component_handler(
+        self,
+        interaction: hikari.ComponentInteraction,
+        initial_response_sent: asyncio.Event,
+        handler: lb_types.ComponentHandler,
+        pattern: str,
+        params: Mapping[str, str],
+    ) -> None:
+        context = routes.ComponentContext(self, interaction, pattern, initial_response_sent)
+        async with i_di.lazy_context(self.di, di_.Contexts.DEFAULT):
+            try:
+                with tracing.span("lightbulb.component_handler", pattern=pattern):
+                    if self.stall_detector is None:
+                        await handler(context, **params)
+                    else:
+                        await self.stall_detector.monitor(handler(context, **params), "component_handler", pattern)
+            except Exception as e:
+                LOGGER.error(
+                    "error encountered during invocation of component handler %r",
+                    pattern,
+                    exc_info=(type(e), e, e.__traceback__),
+                )
 
     async def handle_modal_interaction(
         self, interaction: hikari.ModalInteraction, initial_response_sent: asyncio.Event
@@ -1170,13 +1753,50 @@ class Client(abc.ABC):
         if handler is None:
             return
 
-        await handler(interaction, initial_response_sent)
+        with tracing.span("lightbulb.modal", custom_id=interaction.custom_id):
+            await handler(interaction, initial_response_sent)
 
     async def handle_interaction_create(
         self, interaction: hikari.PartialInteraction, initial_response_sent_event: asyncio.Event | None = None
     ) -> None:
-        initial_response_sent_event = initial_response_sent_event or asyncio.Event()
+        initial_response_sent_event = initial_response_sent_event or responses.ResponseEvent()
 
+        if self.tracer is None:
+            await self._admit_interaction(interaction, initial_response_sent_event)
+            return
+
+        with self.tracer.span(
+            "lightbulb.interaction", interaction_type=interaction.type.name, interaction_id=str(interaction.id)
+        ):
+            await self._admit_interaction(interaction, initial_response_sent_event)
+
+    async def _admit_interaction(
+        self, interaction: hikari.PartialInteraction, initial_response_sent_event: asyncio.Event
+    ) -> None:
+        controller = self.admission_controller
+        if controller is None or (lane := controller.lane_for(interaction)) is None:
+            await self._dispatch_interaction(interaction, initial_response_sent_event)
+            return
+
+        if not await controller.acquire(lane):
+            LOGGER.debug("rejecting %s interaction - admission controller lane is saturated", lane.name.lower())
+            if (span := tracing.current_span()) is not None:
+                span.attributes["rejected"] = True
+            await controller.reject(interaction, initial_response_sent_event)
+            return
+
+        # The slot is held until the interaction has been handled - including any work done after the initial
+        # response - so the service time is the whole time the slot was held for, which is what queued
+        # interactions actually wait on
+        started = time.monotonic()
+        try:
+            await self._dispatch_interaction(interaction, initial_response_sent_event)
+        finally:
+            controller.release(lane, time.monotonic() - started)
+
+    async def _dispatch_interaction(
+        self, interaction: hikari.PartialInteraction, initial_response_sent_event: asyncio.Event
+    ) -> None:
         if isinstance(interaction, hikari.AutocompleteInteraction):
             await self.handle_autocomplete_interaction(interaction, initial_response_sent_event)
         elif isinstance(interaction, hikari.CommandInteraction):
@@ -1273,7 +1893,7 @@ class RestEnabledClient(Client):
         return self._app
 
     async def handle_rest_interaction(self, interaction: hikari.PartialInteraction) -> AsyncGenerator[None, None]:
-        task = self.safe_create_task(self.handle_interaction_create(interaction, (ir := asyncio.Event())))
+        task = self.safe_create_task(self.handle_interaction_create(interaction, (ir := responses.ResponseEvent())))
         try:
             async with async_timeout.timeout(5):
                 await ir.wait()
@@ -1297,6 +1917,16 @@ def client_from_app(
     sync_commands: bool = True,
     *,
     features: Sequence[features_.Feature] = (),
+    menu_store: stores.MenuStore | None = None,
+    max_rehydrated_menus: int = 1000,
+    admission_controller: admission.AdmissionController | None = None,
+    auto_deferrer: autodefer.AutoDeferrer | None = None,
+    fail_fast: bool = False,
+    metrics_sink: metrics.MetricsSink | None = None,
+    tracer: tracing.Tracer | None = None,
+    offloader: offload.Offloader | None = None,
+    stall_detector: stalls.StallDetector | None = None,
+    validate_dependencies: bool = False,
 ) -> GatewayEnabledClient: ...
 @t.overload
 def client_from_app(
@@ -1311,6 +1941,16 @@ def client_from_app(
     sync_commands: bool = True,
     *,
     features: Sequence[features_.Feature] = (),
+    menu_store: stores.MenuStore | None = None,
+    max_rehydrated_menus: int = 1000,
+    admission_controller: admission.AdmissionController | None = None,
+    auto_deferrer: autodefer.AutoDeferrer | None = None,
+    fail_fast: bool = False,
+    metrics_sink: metrics.MetricsSink | None = None,
+    tracer: tracing.Tracer | None = None,
+    offloader: offload.Offloader | None = None,
+    stall_detector: stalls.StallDetector | None = None,
+    validate_dependencies: bool = False,
 ) -> RestEnabledClient: ...
 def client_from_app(
     app: GatewayClientAppT | RestClientAppT,
@@ -1324,6 +1964,16 @@ def client_from_app(
     sync_commands: bool = True,
     *,
     features: Sequence[features_.Feature] = (),
+    menu_store: stores.MenuStore | None = None,
+    max_rehydrated_menus: int = 1000,
+    admission_controller: admission.AdmissionController | None = None,
+    auto_deferrer: autodefer.AutoDeferrer | None = None,
+    fail_fast: bool = False,
+    metrics_sink: metrics.MetricsSink | None = None,
+    tracer: tracing.Tracer | None = None,
+    offloader: offload.Offloader | None = None,
+    stall_detector: stalls.StallDetector | None = None,
+    validate_dependencies: bool = False,
 ) -> Client:
     """
     Create and return the appropriate client implementation from the given application.
@@ -1350,6 +2000,32 @@ def client_from_app(
         sync_commands: Whether to sync commands that are registered to the client before starting. Defaults
             to :obj:`True`.
         features: Experimental features to enable for this client.
+        menu_store: The store to use to persist menus attached with ``persist=True``, allowing them to be rebuilt
+            after a restart. Defaults to :obj:`None` - menus cannot be persisted.
+        max_rehydrated_menus: The maximum number of menus rebuilt from the menu store that will be kept attached
+            to the client. Defaults to ``1000``.
+        admission_controller: The admission controller to use to limit the number of interactions processed
+            concurrently. Defaults to :obj:`None` - no limits are applied.
+        auto_deferrer: The auto-deferrer to use to automatically defer the initial response of slow commands.
+            Defaults to :obj:`None` - commands are never deferred automatically.
+        fail_fast: Whether command execution should stop at the first hook or invocation failure by default,
+            skipping all remaining hooks apart from those marked ``always_run``. Can be overridden on a per-command
+            basis. Defaults to :obj:`False`.
+        metrics_sink: The sink to send timings for option resolution, each hook and each command invocation to.
+            Defaults to :obj:`None` - no timings are recorded.
+        tracer: The tracer to use to record spans covering the handling of each interaction. Defaults to
+            :obj:`None` - no spans are recorded.
+        offloader: The offloader to use to run blocking or CPU-bound work away from the event loop. It will be
+            started and closed along with the client, and registered as a dependency. Defaults to :obj:`None` -
+            work cannot be offloaded.
+        stall_detector: The stall detector to use to record which commands, hooks, listeners, tasks and menus block
+            the event loop. Its loop lag sampler will be started and stopped along with the client. Defaults to
+            :obj:`None` - stalls are not detected.
+        validate_dependencies: Whether to check that the dependencies of all commands, hooks, error handlers,
+            autocomplete providers, listeners and tasks can be provided when the client is started, raising an
+            error if any cannot. Values added to a container while it is in use - for example by your own hooks -
+            are not known to the check, so you should not enable it if you depend on any. Defaults to
+            :obj:`False`.
 
     Returns:
         :obj:`~Client`: The created client instance.
@@ -1382,4 +2058,14 @@ def client_from_app(
         hooks,
         sync_commands,
         features=features,
+        menu_store=menu_store,
+        max_rehydrated_menus=max_rehydrated_menus,
+        admission_controller=admission_controller,
+        auto_deferrer=auto_deferrer,
+        fail_fast=fail_fast,
+        metrics_sink=metrics_sink,
+        tracer=tracer,
+        offloader=offloader,
+        stall_detector=stall_detector,
+        validate_dependencies=validate_dependencies,
     )
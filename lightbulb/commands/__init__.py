@@ -24,12 +24,14 @@ from lightbulb.commands.groups import *
 from lightbulb.commands.options import *
 
 __all__ = [
+    "AutocompleteCache",
     "Choice",
     "CommandBase",
     "CommandData",
     "CommandMeta",
     "ExecutionHook",
     "ExecutionPipeline",
+    "ExecutionPlan",
     "ExecutionStep",
     "ExecutionSteps",
     "Group",
@@ -20,12 +20,14 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import copy
 import dataclasses
+import inspect
 import logging
+import types
 import typing as t
 from collections.abc import Iterable
 from collections.abc import Mapping
-from collections.abc import MutableMapping
 from collections.abc import Sequence
 
 import hikari
@@ -38,6 +40,8 @@ from lightbulb.commands import utils
 from lightbulb.internal import constants
 
 if t.TYPE_CHECKING:
+    import typing_extensions as t_ex
+
     from lightbulb import context as context_
     from lightbulb import localization
     from lightbulb.commands import groups
@@ -94,6 +98,16 @@ class CommandData:
     """Map of option name to option data for the command options."""
     invoke_method: str = dataclasses.field(hash=False, repr=False)
     """The attribute name of the invoke method for the command."""
+    fail_fast: bool | None = dataclasses.field(hash=False, repr=False, default=None)
+    """
+    Whether execution of the command should stop at the first failure. If :obj:`None`, the client's
+    default is used.
+    """
+    lazy_options: bool = dataclasses.field(hash=False, repr=False, default=False)
+    """
+    Whether the converters of the command's options should only be called when each option's value is first
+    accessed, instead of before the command is invoked. Options which set ``lazy`` themselves override this.
+    """
 
     parent: groups.Group | groups.SubGroup | None = dataclasses.field(init=False, repr=False, default=None)
     """The group that the command belongs to, or :obj:`None` if not applicable."""
@@ -106,7 +120,20 @@ class CommandData:
         extension from the parent group instead.
     """
 
+    _options_by_localized_name: Mapping[str, options_.OptionData[t.Any, t.Any]] = dataclasses.field(
+        init=False, repr=False, hash=False, compare=False, default=types.MappingProxyType({})
+    )
+    _option_positions: Mapping[str, int] = dataclasses.field(
+        init=False, repr=False, hash=False, compare=False, default=types.MappingProxyType({})
+    )
+    _option_slots: Mapping[str, int] = dataclasses.field(
+        init=False, repr=False, hash=False, compare=False, default=types.MappingProxyType({})
+    )
+
     def __post_init__(self) -> None:
+        # The slot each option's resolved value is stored in - the position of the option in the command's options
+        self._option_slots = types.MappingProxyType({name: i for i, name in enumerate(self.options)})
+
         if not self.localize:
             if len(self.name) < 1 or len(self.name) > 32:
                 raise ValueError("'name' - must be 1-32 characters")
@@ -133,6 +160,21 @@ class CommandData:
 
         return " ".join(names[::-1])
 
+    def _index_options(self) -> None:
+        """
+        Build the lookup tables mapping the localized name of each option to its data and declaration position.
+        Must be called after the options' localized names have been resolved.
+
+        Returns:
+            :obj:`None`
+        """
+        self._options_by_localized_name = types.MappingProxyType(
+            {option._localized_name: option for option in self.options.values()}
+        )
+        self._option_positions = types.MappingProxyType(
+            {option._localized_name: i for i, option in enumerate(self.options.values())}
+        )
+
     async def as_command_builder(
         self, default_locale: hikari.Locale, localization_provider: localization.LocalizationProvider
     ) -> hikari.api.CommandBuilder:
@@ -168,6 +210,7 @@ class CommandData:
             for option in self.options.values():
                 bld.add_option(await option.to_command_option(default_locale, localization_provider))
 
+            self._index_options()
             return bld
 
         return (
@@ -205,16 +248,18 @@ class CommandData:
                 description_localizations,
             ) = await utils.localize_name_and_description(name, description, default_locale, localization_provider)
 
+        options = [
+            await option.to_command_option(default_locale, localization_provider) for option in self.options.values()
+        ]
+        self._index_options()
+
         return hikari.CommandOption(
             type=hikari.OptionType.SUB_COMMAND,
             name=name,
             name_localizations=name_localizations,  # type: ignore[reportArgumentType]
             description=description,
             description_localizations=description_localizations,  # type: ignore[reportArgumentType]
-            options=[
-                await option.to_command_option(default_locale, localization_provider)
-                for option in self.options.values()
-            ],
+            options=options,
         )
 
 
@@ -243,6 +288,12 @@ class CommandMeta(type):
             guild member to use the command. If unspecified, all users can use the command by default. Set to
             ``hikari.Permissions.NONE`` to disable for everyone apart from admins.
         hooks: The hooks to run before the command invocation function is executed. Defaults to an empty set.
+        fail_fast: Whether execution of the command should stop at the first hook or invocation failure, skipping
+            all remaining hooks apart from those marked ``always_run``. If unspecified, the client's default
+            is used.
+        lazy_options: Whether the converters of the command's options should only be called when each option's
+            value is first accessed, instead of before the command is invoked. Options which set ``lazy``
+            themselves override this. Defaults to :obj:`False`.
     """
 
     __command_types: t.ClassVar[dict[type, hikari.CommandType]] = {}
@@ -284,6 +335,9 @@ class CommandMeta(type):
             "default_member_permissions", hikari.UNDEFINED
         )
 
+        fail_fast: bool | None = kwargs.pop("fail_fast", None)
+        lazy_options: bool = kwargs.pop("lazy_options", False)
+
         raw_hooks: t.Any = kwargs.pop("hooks", None)
         if raw_hooks is not None and not isinstance(raw_hooks, Iterable):
             raise TypeError("'hooks' must be an iterable")
@@ -299,11 +353,13 @@ class CommandMeta(type):
             raise TypeError("all hooks must be an instance of ExecutionHook")
 
         options: dict[str, options_.OptionData[t.Any, t.Any]] = {}
+        option_attrs: list[tuple[str, options_.Option[t.Any, t.Any]]] = []
         invoke_method: str | None = None
         # Iterate through new class attributes to find options and invoke method
         for name, item in attrs.items():
             if cls._is_option(item):
                 options[item._data.name] = item._data
+                option_attrs.append((name, item))
             elif hasattr(item, constants.COMMAND_INVOKE_METHOD_MARKER):
                 invoke_method = name
 
@@ -311,7 +367,7 @@ class CommandMeta(type):
         if invoke_method is None:
             raise TypeError("'invoke' registered method is required but could not be found")
 
-        attrs["_command_data"] = CommandData(
+        command_data = attrs["_command_data"] = CommandData(
             type=cmd_type,
             name=cmd_name,
             description=description,
@@ -320,30 +376,57 @@ class CommandMeta(type):
             integration_types=integration_types,
             contexts=contexts,
             default_member_permissions=default_member_permissions,
-            hooks=hooks,
+            hooks=tuple(hooks),
             options=options,
             invoke_method=invoke_method,
+            fail_fast=fail_fast,
+            lazy_options=lazy_options,
         )
 
+        # Give each option the slot its resolved value is stored in. Descriptors shared with another
+        # command at a different position are copied
+        slots = command_data._option_slots
+        for name, item in option_attrs:
+            if item._index not in (-1, (slot := slots[item._data.name])):
+                item = attrs[name] = copy.copy(item)
+            item._index = slot
+
+        # Classify each converter once, so that lazy options never need to call one to find out whether it is async
+        for option in options.values():
+            converter = option.converter
+            option._converter_is_async = converter is not None and (
+                inspect.iscoroutinefunction(converter)
+                or inspect.iscoroutinefunction(getattr(converter, "__call__", None))
+            )
+
         return super().__new__(cls, cls_name, bases, attrs, **kwargs)
 
 
+def _async_converter_error(option: options_.OptionData[t.Any, t.Any]) -> RuntimeError:
+    return RuntimeError(
+        f"option {option.name!r} has an asynchronous converter - use "
+        f"'await command.resolve({option.name!r})' to access its value"
+    )
+
+
 class CommandBase:
     """
     Base class that all commands should inherit from. Contains meta information about the
     command, execution information for each created instance, and various utility methods.
     """
 
-    __slots__ = ("_current_context", "_resolved_option_cache")
+    __slots__ = ("_current_context", "_resolved_options")
 
     _command_data: t.ClassVar[CommandData]
     _current_context: context_.Context | None
-    _resolved_option_cache: MutableMapping[str, t.Any]
+    # The resolved option values, stored in the slot given by each option's index. None until a context is set,
+    # and empty until the options for that context have been resolved
+    _resolved_options: Sequence[t.Any] | None
 
-    def __new__(cls, *args: t.Any, **kwargs: t.Any) -> CommandBase:
+    def __new__(cls, *args: t.Any, **kwargs: t.Any) -> t_ex.Self:
         new = super().__new__(cls, *args, **kwargs)
         new._current_context = None
-        new._resolved_option_cache = {}
+        new._resolved_options = None
         return new
 
     def __repr__(self) -> str:
@@ -351,7 +434,7 @@ class CommandBase:
 
     def _set_context(self, context: context_.Context) -> None:
         """
-        Convenience method to set the current execution context and clear the resolved option cache.
+        Convenience method to set the current execution context and clear the resolved option values.
 
         Args:
             context: The context being used for the current execution.
@@ -360,7 +443,7 @@ class CommandBase:
             :obj:`None`
         """
         self._current_context = context
-        self._resolved_option_cache = {}
+        self._resolved_options = ()
 
     async def _convert_option(
         self, option: options_.OptionData[OptionDefaultT, ConverterReturnT], value: t.Any
@@ -376,10 +459,80 @@ class CommandBase:
         except Exception as e:
             raise exceptions.ConversionFailedException(option, value) from e
 
+    def _convert_lazy_option(self, slot: int, option: options_.OptionData[t.Any, t.Any], value: t.Any) -> t.Any:
+        assert self._current_context is not None and option.converter is not None
+
+        if option._converter_is_async:
+            raise _async_converter_error(option)
+
+        try:
+            converted = option.converter(self._current_context, value)
+        except Exception as e:
+            raise exceptions.ConversionFailedException(option, value) from e
+
+        # Synchronous callables can still return an awaitable - for example a lambda or partial wrapping an
+        # async function - which cannot be awaited here. Later accesses raise without calling the converter
+        if inspect.isawaitable(converted):
+            if inspect.iscoroutine(converted):
+                converted.close()
+            option._converter_is_async = True
+            raise _async_converter_error(option)
+
+        t.cast("list[t.Any]", self._resolved_options)[slot] = converted
+        return converted
+
+    async def resolve(self, name: str) -> t.Any:
+        """
+        Get the value of the option with the given name for the current execution, calling its converter if
+        the option is lazy and has not yet been converted. The converted value is stored, so the converter is
+        called at most once per execution.
+
+        This must be used to access the value of a lazy option with an asynchronous converter - such options
+        cannot be converted when accessed through the option's attribute.
+
+        Args:
+            name: The name of the option, as passed when defining the option.
+
+        Returns:
+            The value of the option.
+
+        Raises:
+            :obj:`KeyError`: If the command has no option with the given name.
+            :obj:`RuntimeError`: If the options have not yet been resolved for the current execution.
+            :obj:`~lightbulb.exceptions.ConversionFailedException`: If the option's converter raised an exception.
+
+        Example:
+
+            .. code-block:: python
+
+                class Ban(
+                    lightbulb.SlashCommand,
+                    name="ban",
+                    description="ban a member",
+                ):
+                    member = lightbulb.user("member", "the member to ban")
+                    # 'fetch_case' is an async function which loads the case from a database
+                    case = lightbulb.integer("case", "the case to ban for", converter=fetch_case, lazy=True)
+
+                    @lightbulb.invoke
+                    async def invoke(self, ctx: lightbulb.Context) -> None:
+                        case = await self.resolve("case")
+        """
+        if (option := self._command_data.options.get(name)) is None:
+            raise KeyError(f"command has no option named {name!r}")
+
+        if not (values := self._resolved_options):
+            raise RuntimeError("cannot resolve an option before the command's options have been resolved")
+
+        slot = self._command_data._option_slots[name]
+        if type(value := values[slot]) is options_._Unconverted:
+            value = t.cast("list[t.Any]", values)[slot] = await self._convert_option(option, value.value)
+        return value
+
     async def _resolve_options(self) -> None:
         """
         Resolves the actual option values for the command's current
-        execution context. The values will be then stored in the cache.
+        execution context. The values will be then stored in the slot for each option.
 
         Returns:
             :obj:`None`
@@ -388,25 +541,39 @@ class CommandBase:
         if context is None:
             raise RuntimeError("cannot resolve options if no context is available")
 
-        named_interaction_options = {opt.name: opt for opt in context.options}
-        resolved = context.interaction.resolved
-
-        for option in self._command_data.options.values():
-            interaction_option = named_interaction_options.get(name := option._localized_name)
+        # Place each provided option at the position of its definition, so that no per-invocation
+        # lookup table is needed when iterating over the command's options below
+        if len(self._command_data._option_positions) != len(self._command_data.options):
+            self._command_data._index_options()
+
+        positions = self._command_data._option_positions
+        provided: list[hikari.CommandInteractionOption | None] = [None] * len(positions)
+        for opt in context.options:
+            if (position := positions.get(opt.name)) is not None:
+                provided[position] = opt
+
+        # Options are resolved in the order they were defined in, so each value is appended at its option's slot
+        values: list[t.Any] = []
+        resolved, lazy_options = context.interaction.resolved, self._command_data.lazy_options
+        for option, interaction_option in zip(self._command_data.options.values(), provided):
             if interaction_option is None or (option.type not in _PRIMITIVE_OPTION_TYPES and resolved is None):
                 if option.default is hikari.UNDEFINED:
-                    raise ValueError(f"no option resolved and no default provided for option: {name}")
+                    raise ValueError(f"no option resolved and no default provided for option: {option._localized_name}")
 
-                self._resolved_option_cache[name] = option.default
+                values.append(option.default)
                 continue
 
             value = interaction_option.value
             option_type = option.type
 
             if option_type in _PRIMITIVE_OPTION_TYPES:
-                self._resolved_option_cache[name] = (
-                    value if option.converter is None else await self._convert_option(option, value)
-                )
+                if option.converter is None:
+                    values.append(value)
+                elif lazy_options if option.lazy is None else option.lazy:
+                    # Conversion is deferred until the option is accessed, or resolved explicitly
+                    values.append(options_._Unconverted(value))
+                else:
+                    values.append(await self._convert_option(option, value))
                 continue
 
             assert isinstance(value, hikari.Snowflake)
@@ -424,9 +591,14 @@ class CommandBase:
             else:
                 raise TypeError("unsupported option type passed")
 
-            self._resolved_option_cache[name] = (
-                resolved_option if option.converter is None else await self._convert_option(option, resolved_option)
-            )
+            if option.converter is None:
+                values.append(resolved_option)
+            elif lazy_options if option.lazy is None else option.lazy:
+                values.append(options_._Unconverted(resolved_option))
+            else:
+                values.append(await self._convert_option(option, resolved_option))
+
+        self._resolved_options = values
 
     @classmethod
     async def as_command_builder(
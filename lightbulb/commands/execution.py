@@ -20,8 +20,11 @@
 # SOFTWARE.
 from __future__ import annotations
 
+import asyncio
 import collections
 import dataclasses
+import inspect
+import time
 import typing as t
 from collections.abc import Awaitable
 from collections.abc import Callable
@@ -29,16 +32,28 @@ from collections.abc import Callable
 from lightbulb import di
 from lightbulb import exceptions
 from lightbulb import features
-from lightbulb import utils
+from lightbulb import metrics
+from lightbulb import tracing
 from lightbulb.internal import constants
+from lightbulb.internal import di as i_di
 from lightbulb.internal import types
 
 if t.TYPE_CHECKING:
+    from collections.abc import Iterable
     from collections.abc import Sequence
 
     from lightbulb import context as context_
-
-__all__ = ["ExecutionHook", "ExecutionPipeline", "ExecutionStep", "ExecutionSteps", "hook", "invoke"]
+    from lightbulb import stalls
+
+__all__ = [
+    "ExecutionHook",
+    "ExecutionPipeline",
+    "ExecutionPlan",
+    "ExecutionStep",
+    "ExecutionSteps",
+    "hook",
+    "invoke",
+]
 
 ExecutionHookFunc: t.TypeAlias = t.Callable[..., types.MaybeAwaitable[None]]
 InvokeFuncT = t.TypeVar("InvokeFuncT", bound=Callable[..., Awaitable[t.Any]])
@@ -85,17 +100,29 @@ class ExecutionSteps:
     """Step for post-invocation logic."""
 
 
+def _awaitable_or_none(result: t.Any) -> Awaitable[t.Any] | None:
+    return result if inspect.isawaitable(result) else None
+
+
 @dataclasses.dataclass(frozen=True, slots=True, eq=True)
 class ExecutionHook:
     """
     Dataclass representing a command execution hook executed before the invocation method is called.
 
+    Whether the hook function is synchronous, and whether it has any parameters that need to be dependency
+    injected, is determined when the hook is created. Hooks with nothing to inject are called directly instead
+    of through the dependency injection wrapper. Synchronous hooks are only awaited if they return an awaitable
+    (for example, a synchronous wrapper around an asynchronous function) - any other value they return is ignored.
+
     Args:
         step: The step that this hook should be run during.
         skip_when_failed: Whether this hook should be skipped if the pipeline has already failed.
         func: The function that this hook executes. May either be synchronous or asynchronous, and **must** take
             (at least) two arguments - and instance of :obj:`~ExecutionPipeline` and :obj:`~lightbulb.context.Context`
             respectively.
+        concurrent: Whether this hook can be run concurrently with the other concurrent hooks registered for
+            the same step.
+        always_run: Whether this hook should still be run after a failure when the pipeline is failing fast.
     """
 
     step: ExecutionStep
@@ -106,12 +133,109 @@ class ExecutionHook:
     """The name of this hook."""
     func: ExecutionHookFunc
     """The function that this hook executes."""
+    concurrent: bool = False
+    """
+    Whether this hook can be run concurrently with the other concurrent hooks registered for the same step.
+    Consecutive concurrent hooks are run together - a hook that is not concurrent, or that is skipped when the
+    pipeline has failed, waits for all hooks before it to complete.
+    """
+    always_run: bool = False
+    """
+    Whether this hook should still be run after a failure when the pipeline is failing fast. Has no effect
+    if ``skip_when_failed`` is :obj:`True`.
+    """
+
+    _func: Callable[..., t.Any] = dataclasses.field(init=False, repr=False, compare=False)
+    _is_async: bool = dataclasses.field(init=False, repr=False, compare=False)
+    _requires_injection: bool = dataclasses.field(init=False, repr=False, compare=False)
+    _requires_injection_all_params: bool = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        func: Callable[..., t.Any] = getattr(self.func, "_func", self.func)
+        wrapped = func is not self.func
+
+        object.__setattr__(self, "_func", func)
+        object.__setattr__(
+            self,
+            "_is_async",
+            inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(getattr(func, "__call__", None)),
+        )
+        object.__setattr__(self, "_requires_injection", wrapped and i_di.requires_injection(func, 2))
+        object.__setattr__(self, "_requires_injection_all_params", wrapped and i_di.requires_injection(func, 0))
+
+    def _call(
+        self, pipeline: ExecutionPipeline, context: context_.Context, inject_all_params: bool
+    ) -> Awaitable[t.Any] | None:
+        if inject_all_params:
+            if self._requires_injection_all_params:
+                return self.func()
+            if self._is_async:
+                return self._func()
+            return _awaitable_or_none(self._func())
+
+        if self._requires_injection:
+            return self.func(pipeline, context)
+        if self._is_async:
+            return self._func(pipeline, context)
+        return _awaitable_or_none(self._func(pipeline, context))
 
     async def __call__(self, pipeline: ExecutionPipeline, context: context_.Context) -> None:
-        if features.HOOK_INJECT_ALL_PARAMS in context.client._features:
-            await utils.maybe_await(self.func())
-        else:
-            await utils.maybe_await(self.func(pipeline, context))
+        if (
+            awaitable := self._call(pipeline, context, features.HOOK_INJECT_ALL_PARAMS in context.client._features)
+        ) is not None:
+            await awaitable
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ExecutionPlan:
+    """
+    Dataclass representing the compiled, immutable set of hooks that an :obj:`~ExecutionPipeline` will run
+    for each execution step.
+    """
+
+    steps: tuple[tuple[ExecutionStep, tuple[ExecutionHook, ...]], ...]
+    """Ordered collection of ``(step, hooks)`` pairs."""
+    inject_all_params: bool
+    """Whether all hook parameters should be dependency injected."""
+    fail_fast: bool = False
+    """Whether execution should stop at the first failure, only running hooks marked ``always_run`` afterwards."""
+    invoke_func: Callable[..., Awaitable[t.Any]] | None = None
+    """
+    The command's invoke method, called directly with the command instance because it has no parameters
+    to inject. :obj:`None` if the invoke method must be called through its dependency injection wrapper.
+    """
+
+
+def _compile_execution_plan(
+    order: Sequence[ExecutionStep],
+    hooks: Iterable[ExecutionHook],
+    inject_all_params: bool = False,
+    fail_fast: bool = False,
+    invoke_func: Callable[..., Awaitable[t.Any]] | None = None,
+) -> ExecutionPlan:
+    """
+    Compile the given execution step order and hooks into an :obj:`~ExecutionPlan`. Hooks are grouped
+    by the step they run during, preserving the order they were given in. Hooks for steps that do not
+    appear in the step order are discarded.
+
+    Args:
+        order: The order that execution steps should be run in.
+        hooks: The hooks to include in the plan.
+        inject_all_params: Whether all hook parameters should be dependency injected, as
+            per :obj:`~lightbulb.features.HOOK_INJECT_ALL_PARAMS`.
+        fail_fast: Whether execution should stop at the first failure.
+        invoke_func: The command's invoke method, if it can be called without injecting any dependencies.
+
+    Returns:
+        :obj:`~ExecutionPlan`: The compiled execution plan.
+    """
+    hooks_by_step: dict[ExecutionStep, list[ExecutionHook]] = collections.defaultdict(list)
+    for hook in hooks:
+        hooks_by_step[hook.step].append(hook)
+
+    return ExecutionPlan(
+        tuple((step, tuple(hooks_by_step.get(step, ()))) for step in order), inject_all_params, fail_fast, invoke_func
+    )
 
 
 class ExecutionPipeline:
@@ -121,7 +245,8 @@ class ExecutionPipeline:
     all hooks succeed.
 
     Warning:
-        A single hook failure **will not** prevent future hooks from being executed. If a hook should not
+        A single hook failure **will not** prevent future hooks from being executed unless the pipeline is
+        failing fast - see the ``fail_fast`` client and command parameters. If a hook should not
         be executed if previous ones have failed you can set the `skip_when_failed` parameter to prevent this from
         happening.
 
@@ -151,25 +276,39 @@ class ExecutionPipeline:
         "_context",
         "_current_hook",
         "_current_step",
+        "_cursor",
         "_hook_failures",
-        "_hooks",
         "_invocation_failure",
-        "_remaining",
+        "_invocation_skipped",
+        "_metrics_sink",
+        "_plan",
+        "_stall_detector",
     )
 
-    def __init__(self, context: context_.Context, order: Sequence[ExecutionStep]) -> None:
+    def __init__(
+        self, context: context_.Context, order: Sequence[ExecutionStep], *, plan: ExecutionPlan | None = None
+    ) -> None:
         self._context = context
-        self._remaining = list(order)
-
-        self._hooks: dict[ExecutionStep, list[ExecutionHook]] = collections.defaultdict(list)
-        for hook in [*context.client.hooks, *context.command_data.hooks]:
-            self._hooks[hook.step].append(hook)
+        self._plan: ExecutionPlan = (
+            plan
+            if plan is not None
+            else _compile_execution_plan(
+                order,
+                [*context.client.hooks, *context.command_data.hooks],
+                features.HOOK_INJECT_ALL_PARAMS in context.client._features,
+                context.client.fail_fast if context.command_data.fail_fast is None else context.command_data.fail_fast,
+            )
+        )
+        self._cursor: int = 0
+        self._metrics_sink: metrics.MetricsSink | None = context.client.metrics_sink
+        self._stall_detector: stalls.StallDetector | None = context.client.stall_detector
 
         self._current_step: ExecutionStep | None = None
         self._current_hook: ExecutionHook | None = None
 
         self._hook_failures: list[tuple[ExecutionHook, Exception]] = []
         self._invocation_failure: Exception | None = None
+        self._invocation_skipped: bool = False
 
     @property
     def failed(self) -> bool:
@@ -202,24 +341,189 @@ class ExecutionPipeline:
         """Whether the command invocation function threw an exception."""
         return self._invocation_failure is not None
 
-    def _next_step(self) -> ExecutionStep | None:
+    @property
+    def invocation_skipped(self) -> bool:
+        """Whether the command invocation function was skipped using :meth:`~ExecutionPipeline.skip_invocation`."""
+        return self._invocation_skipped
+
+    def skip_invocation(self) -> None:
+        """
+        Prevent the command invocation function from being called. Hooks registered for the remaining execution
+        steps will still be run. Has no effect if the ``INVOKE`` step has already been run.
+
+        This can be used by hooks that are able to create the response for the command themselves - for example,
+        by replaying a previously cached response.
+
+        Returns:
+            :obj:`None`
         """
-        Return the next execution step to run, or :obj:`None` if the remaining execution steps
-        have been exhausted.
+        self._invocation_skipped = True
+
+    def _next_step(self) -> tuple[ExecutionStep, tuple[ExecutionHook, ...]] | None:
+        """
+        Return the next execution step to run along with its hooks, or :obj:`None` if the remaining
+        execution steps have been exhausted.
 
         Returns:
-            :obj:`~ExecutionStep` | :obj:`None`: The new execution step, or :obj:`None` if there
-                are none remaining
+            :obj:`tuple` [ :obj:`~ExecutionStep`, :obj:`tuple` [ :obj:`~ExecutionHook`, ... ]] | :obj:`None`: The
+                new execution step and its hooks, or :obj:`None` if there are none remaining
         """
-        if self._remaining:
-            return self._remaining.pop(0)
+        if self._cursor < len(self._plan.steps):
+            self._cursor += 1
+            return self._plan.steps[self._cursor - 1]
         return None
 
-    def _fail(self, exc: Exception) -> None:
+    def _fail(self, exc: Exception, hook: ExecutionHook | None = None) -> None:
         assert self._current_step is not None
-        assert self._current_hook is not None
 
-        self._hook_failures.append((self._current_hook, exc))
+        hook = hook or self._current_hook
+        assert hook is not None
+
+        self._hook_failures.append((hook, exc))
+
+    def _should_skip(self, hook: ExecutionHook) -> bool:
+        return self.failed and (hook.skip_when_failed or (self._plan.fail_fast and not hook.always_run))
+
+    def _record_hook(self, sink: metrics.MetricsSink, hook: ExecutionHook, start: int) -> None:
+        sink.record(
+            metrics.HOOK_DURATION,
+            time.perf_counter_ns() - start,
+            {"command": self._context.command_data.qualified_name, "step": hook.step.name, "hook": hook.name},
+        )
+
+    async def _timed(
+        self, sink: metrics.MetricsSink, hook: ExecutionHook, awaitable: Awaitable[t.Any], start: int
+    ) -> t.Any:
+        try:
+            return await awaitable
+        finally:
+            self._record_hook(sink, hook, start)
+
+    async def _invoke_with_metrics(self, sink: metrics.MetricsSink, invoke_args: tuple[t.Any, ...]) -> None:
+        labels = {"command": self._context.command_data.qualified_name}
+
+        start = time.perf_counter_ns()
+        try:
+            await self._context.command._resolve_options()
+        finally:
+            sink.record(metrics.OPTION_RESOLUTION_DURATION, time.perf_counter_ns() - start, labels)
+
+        start = time.perf_counter_ns()
+        try:
+            await self._call_invoke_method(invoke_args)
+        finally:
+            sink.record(metrics.INVOKE_DURATION, time.perf_counter_ns() - start, labels)
+
+    def _call_hook(self, hook: ExecutionHook) -> Awaitable[t.Any] | None:
+        if (detector := self._stall_detector) is None:
+            return hook._call(self, self._context, self._plan.inject_all_params)
+
+        # Synchronous hooks run entirely within the call, async hooks are timed for each step when awaited
+        with detector.section("hook", hook.name):
+            awaitable = hook._call(self, self._context, self._plan.inject_all_params)
+        return detector.monitor(awaitable, "hook", hook.name) if awaitable is not None else None
+
+    def _call_invoke_method(self, invoke_args: tuple[t.Any, ...]) -> Awaitable[t.Any]:
+        if (func := self._plan.invoke_func) is not None:
+            return func(self._context.command, *invoke_args)
+        return getattr(self._context.command, self._context.command_data.invoke_method)(*invoke_args)
+
+    async def _invoke(self, invoke_args: tuple[t.Any, ...]) -> None:
+        # Converters of lazy options are not called here - only once the option is accessed during invocation
+        await self._context.command._resolve_options()
+
+        await self._call_invoke_method(invoke_args)
+
+    async def _run_concurrently(self, hooks: Sequence[ExecutionHook]) -> None:
+        if self.failed:
+            hooks = [hook for hook in hooks if not self._should_skip(hook)]
+
+        sink = self._metrics_sink
+        outcomes: list[t.Any] = []
+        awaitables: list[Awaitable[t.Any]] = []
+        for hook in hooks:
+            start = time.perf_counter_ns() if sink is not None else 0
+            awaitable: Awaitable[t.Any] | None = None
+            try:
+                awaitable = self._call_hook(hook)
+            except Exception as e:
+                outcomes.append(e)
+                continue
+            finally:
+                if sink is not None and awaitable is None:
+                    self._record_hook(sink, hook, start)
+
+            if awaitable is not None and sink is not None:
+                awaitable = self._timed(sink, hook, awaitable, start)
+
+            outcomes.append(awaitable)
+            if awaitable is not None:
+                awaitables.append(awaitable)
+
+        results = iter(await asyncio.gather(*awaitables, return_exceptions=True))
+        for hook, outcome in zip(hooks, outcomes):
+            if outcome is not None and not isinstance(outcome, Exception):
+                outcome = next(results)
+
+            if isinstance(outcome, Exception):
+                self._fail(outcome, hook)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+
+    async def _run_step(
+        self,
+        step_hooks: Sequence[ExecutionHook],
+        command_invoke_args: tuple[t.Any, ...],
+        sink: metrics.MetricsSink | None,
+    ) -> None:
+        if self._current_step == ExecutionSteps.INVOKE:
+            if not self.failed and not self._invocation_skipped:
+                invocation = (
+                    self._invoke(command_invoke_args)
+                    if sink is None
+                    else self._invoke_with_metrics(sink, command_invoke_args)
+                )
+                if self._stall_detector is not None:
+                    invocation = self._stall_detector.monitor(
+                        invocation, "command", self._context.command_data.qualified_name
+                    )
+
+                try:
+                    await invocation
+                except Exception as e:
+                    self._invocation_failure = e
+
+            return
+
+        i, n_hooks = 0, len(step_hooks)
+        while i < n_hooks:
+            self._current_hook = step_hooks[i]
+            i += 1
+
+            if self._current_hook.concurrent:
+                # Collect the following hooks that can run alongside this one - hooks that are skipped
+                # when the pipeline has failed need the result of all previous hooks, so start a new batch
+                start = i - 1
+                while i < n_hooks and step_hooks[i].concurrent and not step_hooks[i].skip_when_failed:
+                    i += 1
+
+                if i - start > 1:
+                    await self._run_concurrently(step_hooks[start:i])
+                    continue
+
+            if self._should_skip(self._current_hook):
+                continue
+
+            start = time.perf_counter_ns() if sink is not None else 0
+            try:
+                awaitable = self._call_hook(self._current_hook)
+                if awaitable is not None:
+                    await awaitable
+            except Exception as e:
+                self._fail(e)
+
+            if sink is not None:
+                self._record_hook(sink, self._current_hook, start)
 
     async def _run(self) -> None:
         """
@@ -236,34 +540,25 @@ class ExecutionPipeline:
         command_invoke_args: tuple[t.Any, ...] = (
             () if features.COMMAND_INJECT_CONTEXT in self._context.client._features else (self._context,)
         )
+        sink = self._metrics_sink
+        traced = tracing.current_span() is not None
 
-        self._current_step = self._next_step()
-        while self._current_step is not None:
-            if self._current_step == ExecutionSteps.INVOKE and not self.failed:
-                try:
-                    # TODO - allow users to choose when this is done?
-                    await self._context.command._resolve_options()
-
-                    await getattr(self._context.command, self._context.command_data.invoke_method)(*command_invoke_args)
-                    self._current_step = self._next_step()
-                except Exception as e:
-                    self._invocation_failure = e
+        while (next_step := self._next_step()) is not None:
+            self._current_step, step_hooks = next_step
 
+            if not traced:
+                await self._run_step(step_hooks, command_invoke_args, sink)
                 continue
 
-            step_hooks = list(self._hooks.get(self._current_step, []))
-            while step_hooks:
-                self._current_hook = step_hooks.pop(0)
-
-                if self.failed and self._current_hook.skip_when_failed:
-                    continue
-
-                try:
-                    await self._current_hook(self, self._context)
-                except Exception as e:
-                    self._fail(e)
+            n_failures = len(self._hook_failures)
+            with tracing.span("lightbulb.execution_step", step=self._current_step.name, hooks=len(step_hooks)) as span:
+                await self._run_step(step_hooks, command_invoke_args, sink)
 
-            self._current_step = self._next_step()
+                assert span is not None
+                if len(self._hook_failures) > n_failures:
+                    span.error = type(self._hook_failures[n_failures][1]).__name__
+                elif self._current_step == ExecutionSteps.INVOKE and self._invocation_failure is not None:
+                    span.error = type(self._invocation_failure).__name__
 
         if self.failed:
             raise exceptions.ExecutionPipelineFailedException(
@@ -275,7 +570,11 @@ class ExecutionPipeline:
 
 
 def hook(
-    step: ExecutionStep, skip_when_failed: bool = False, name: str = ""
+    step: ExecutionStep,
+    skip_when_failed: bool = False,
+    name: str = "",
+    concurrent: bool = False,
+    always_run: bool = False,
 ) -> Callable[[ExecutionHookFunc], ExecutionHook]:
     """
     Second order decorator to convert a function into an execution hook for the given
@@ -298,6 +597,11 @@ def hook(
             has already failed due to a different hook or command invocation exception. Defaults to :obj:`False`.
         name: The name of the hook. If not specified (an empty string), this will be set to the name of the
             hook function.
+        concurrent: Whether the hook can be run concurrently with the other concurrent hooks for the same step.
+            Consecutive concurrent hooks are run together, with any failures still being reported in the order
+            the hooks were registered. Defaults to :obj:`False`.
+        always_run: Whether the hook should still be run after a failure when the pipeline is failing fast. Use
+            this for cleanup hooks that must always be executed. Defaults to :obj:`False`.
 
     Returns:
         :obj:`~ExecutionHook`: The created execution hook.
@@ -322,7 +626,7 @@ def hook(
         raise ValueError("hooks cannot be registered for the 'INVOKE' execution step")
 
     def inner(func: ExecutionHookFunc) -> ExecutionHook:
-        return ExecutionHook(step, skip_when_failed, name or func.__name__, di.with_di(func))  # type: ignore[reportArgumentType]
+        return ExecutionHook(step, skip_when_failed, name or func.__name__, di.with_di(func), concurrent, always_run)  # type: ignore[reportArgumentType]
 
     return inner
 
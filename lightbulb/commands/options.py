@@ -21,6 +21,7 @@
 from __future__ import annotations
 
 __all__ = [
+    "AutocompleteCache",
     "Choice",
     "Option",
     "OptionData",
@@ -35,7 +36,9 @@ __all__ = [
     "user",
 ]
 
+import collections
 import dataclasses
+import time
 import typing as t
 
 import hikari
@@ -43,14 +46,18 @@ import hikari
 from lightbulb import di
 from lightbulb import utils
 from lightbulb.commands import utils as cmd_utils
+from lightbulb.internal import di as i_di
 from lightbulb.internal.utils import non_undefined_or
 
 if t.TYPE_CHECKING:
     from collections.abc import Awaitable
     from collections.abc import Callable
+    from collections.abc import Hashable
     from collections.abc import Mapping
     from collections.abc import Sequence
 
+    from hikari.api import special_endpoints
+
     from lightbulb import commands
     from lightbulb import context
     from lightbulb import localization
@@ -76,6 +83,86 @@ class Choice(t.Generic[T]):
     """Whether the name of the choice should be interpreted as a localization key."""
 
 
+class AutocompleteCache:
+    """
+    Cache for the responses of an option's autocomplete provider. Responses are keyed by the command, the option,
+    and the value currently entered for the option - and optionally the guild and locale the interaction was
+    created in. When a cached response is available, it is sent without calling the autocomplete provider, and
+    without creating any dependency injection containers.
+
+    Args:
+        ttl: The number of seconds that a cached response remains valid for.
+        max_size: The maximum number of responses to cache. When exceeded, the least recently used
+            response will be removed.
+        per_guild: Whether responses should be cached separately for each guild.
+        per_locale: Whether responses should be cached separately for each locale.
+
+    Warning:
+        You should only cache responses for autocomplete providers which depend solely on the value entered for
+        the focused option (and the guild or locale, if enabled). Values entered for other options are **not**
+        included in the cache key.
+    """
+
+    __slots__ = ("_entries", "hits", "max_size", "misses", "per_guild", "per_locale", "ttl")
+
+    def __init__(
+        self, ttl: float = 30, max_size: int = 1000, *, per_guild: bool = False, per_locale: bool = False
+    ) -> None:
+        self.ttl: float = ttl
+        """The number of seconds that a cached response remains valid for."""
+        self.max_size: int = max_size
+        """The maximum number of responses to cache."""
+        self.per_guild: bool = per_guild
+        """Whether responses are cached separately for each guild."""
+        self.per_locale: bool = per_locale
+        """Whether responses are cached separately for each locale."""
+
+        self.hits: int = 0
+        """The number of autocomplete interactions that have been responded to from the cache."""
+        self.misses: int = 0
+        """The number of autocomplete interactions that required the provider to be called."""
+
+        self._entries: collections.OrderedDict[
+            Hashable, tuple[float, Sequence[special_endpoints.AutocompleteChoiceBuilder]]
+        ] = collections.OrderedDict()
+
+    def _key(self, ctx: context.AutocompleteContext[t.Any], option: OptionData[t.Any, t.Any]) -> Hashable:
+        return (
+            ctx.command._command_data.qualified_name,
+            option.name,
+            ctx.focused.value,
+            ctx.interaction.guild_id if self.per_guild else None,
+            ctx.interaction.locale if self.per_locale else None,
+        )
+
+    def _get(self, key: Hashable) -> Sequence[special_endpoints.AutocompleteChoiceBuilder] | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def _put(self, key: Hashable, choices: Sequence[special_endpoints.AutocompleteChoiceBuilder]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, choices)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all responses from the cache.
+
+        Returns:
+            :obj:`None`
+        """
+        self._entries.clear()
+
+
 @dataclasses.dataclass(slots=True)
 class OptionData(t.Generic[DefaultT, ConvertedT]):
     """
@@ -115,6 +202,8 @@ class OptionData(t.Generic[DefaultT, ConvertedT]):
     """Whether autocomplete is enabled for the option."""
     autocomplete_provider: hikari.UndefinedOr[AutocompleteProvider[t.Any]] = hikari.UNDEFINED
     """The provider to use to resolve autocomplete interactions for this option."""
+    autocomplete_cache: AutocompleteCache | None = None
+    """The cache to use for the responses of the autocomplete provider for this option."""
 
     converter: t.Callable[[context.Context, t.Any], ConvertedT] | None = None
     """
@@ -122,9 +211,18 @@ class OptionData(t.Generic[DefaultT, ConvertedT]):
 
     .. versionadded:: 3.1.0
     """
+    lazy: bool | None = None
+    """
+    Whether the converter should only be called when the option's value is first accessed during an invocation,
+    instead of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
+    """
 
     _localized_name: str = dataclasses.field(init=False, default="")
     _localized_description: str = dataclasses.field(init=False, default="")
+    _autocomplete_callable: AutocompleteProvider[t.Any] | None = dataclasses.field(
+        init=False, default=None, repr=False, compare=False
+    )
+    _converter_is_async: bool = dataclasses.field(init=False, default=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.localize and (len(self.name) < 1 or len(self.name) > 32):
@@ -150,6 +248,10 @@ class OptionData(t.Generic[DefaultT, ConvertedT]):
 
         if self.autocomplete_provider is not hikari.UNDEFINED:
             self.autocomplete_provider = di.with_di(self.autocomplete_provider)
+            # Providers that only take the context are called directly, without resolving any dependencies
+            self._autocomplete_callable = (
+                i_di.direct_callable(self.autocomplete_provider, 1) or self.autocomplete_provider
+            )
 
     async def to_command_option(
         self, default_locale: hikari.Locale, localization_provider: localization.LocalizationProvider
@@ -210,6 +312,15 @@ class OptionData(t.Generic[DefaultT, ConvertedT]):
         )
 
 
+class _Unconverted:
+    """Wrapper for the value of a lazily converted option whose converter has not yet been called."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: t.Any) -> None:
+        self.value = value
+
+
 class Option(t.Generic[DefaultT, ConvertedT]):
     """
     Descriptor class representing a command option.
@@ -234,7 +345,7 @@ class Option(t.Generic[DefaultT, ConvertedT]):
         :meth:`~attachment`
     """
 
-    __slots__ = ("_data", "_unbound_default")
+    __slots__ = ("_data", "_index", "_unbound_default")
 
     def __init__(
         self,
@@ -243,17 +354,30 @@ class Option(t.Generic[DefaultT, ConvertedT]):
     ) -> None:
         self._data = data
         self._unbound_default = default_when_not_bound
+        # The slot that the resolved value is stored in on command instances - assigned when the command class
+        # is created, from the position of this option in the command's options
+        self._index: int = -1
 
     def __get__(
         self, instance: commands.CommandBase | None, owner: type[commands.CommandBase]
     ) -> DefaultT | ConvertedT:
-        if instance is None or getattr(instance, "_current_context", None) is None:
+        if instance is None or (resolved := instance._resolved_options) is None:
             return self._unbound_default
 
-        if self._data._localized_name not in instance._resolved_option_cache:
-            raise RuntimeError(f"Tried to access option {self._data._localized_name} before resolving options.")
+        # Options that were not defined on the command class itself - for example on a mixin - are not given a slot
+        if (index := self._index) < 0:
+            raise RuntimeError(f"Option {self._data._localized_name} is not an option of the command being invoked.")
+
+        try:
+            value = resolved[index]
+        except IndexError:
+            raise RuntimeError(
+                f"Tried to access option {self._data._localized_name} before resolving options."
+            ) from None
 
-        return t.cast("DefaultT", instance._resolved_option_cache[self._data._localized_name])
+        if type(value) is _Unconverted:
+            value = instance._convert_lazy_option(index, self._data, value.value)
+        return t.cast("DefaultT", value)
 
 
 class ContextMenuOption(Option[CtxMenuOptionReturn, CtxMenuOptionReturn]):
@@ -292,7 +416,7 @@ class ContextMenuOption(Option[CtxMenuOptionReturn, CtxMenuOptionReturn]):
     ) -> hikari.Message: ...
 
     def __get__(self, instance: commands.CommandBase | None, owner: type[commands.CommandBase]) -> CtxMenuOptionReturn:
-        if instance is None or getattr(instance, "_current_context", None) is None:
+        if instance is None or instance._current_context is None:
             return self._unbound_default
 
         assert instance._current_context is not None
@@ -323,6 +447,7 @@ def string(
     min_length: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     max_length: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[str]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> str | DefaultT: ...
 
 
@@ -333,12 +458,14 @@ def string(
     /,
     *,
     converter: t.Callable[[context.Context, str], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
     choices: hikari.UndefinedOr[Sequence[Choice[str]]] = hikari.UNDEFINED,
     min_length: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     max_length: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[str]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> DefaultT | ConvertedT: ...
 
 
@@ -348,12 +475,14 @@ def string(
     /,
     *,
     converter: t.Callable[[context.Context, str], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
     choices: hikari.UndefinedOr[Sequence[Choice[str]]] = hikari.UNDEFINED,
     min_length: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     max_length: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[str]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> str | DefaultT | ConvertedT:
     """
     A string option.
@@ -362,6 +491,8 @@ def string(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -370,6 +501,8 @@ def string(
         min_length: The minimum length for the option.
         max_length: The maximum length for the option.
         autocomplete: The autocomplete provider function to use for the option.
+        autocomplete_cache: The cache to use for the responses of the autocomplete provider. If :obj:`None`, responses
+            will not be cached. Defaults to :obj:`None`.
 
     Returns:
         Descriptor allowing access to the option value from within a command invocation.
@@ -389,7 +522,9 @@ def string(
             max_length=max_length,
             autocomplete=autocomplete is not hikari.UNDEFINED,
             autocomplete_provider=autocomplete,
+            autocomplete_cache=autocomplete_cache,
             converter=converter,
+            lazy=lazy,
         ),
         utils.EMPTY,
     )
@@ -408,6 +543,7 @@ def integer(
     min_value: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     max_value: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[int]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> int | DefaultT: ...
 
 
@@ -418,12 +554,14 @@ def integer(
     /,
     *,
     converter: t.Callable[[context.Context, int], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
     choices: hikari.UndefinedOr[Sequence[Choice[int]]] = hikari.UNDEFINED,
     min_value: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     max_value: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[int]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> DefaultT | ConvertedT: ...
 
 
@@ -433,12 +571,14 @@ def integer(
     /,
     *,
     converter: t.Callable[[context.Context, int], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
     choices: hikari.UndefinedOr[Sequence[Choice[int]]] = hikari.UNDEFINED,
     min_value: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     max_value: hikari.UndefinedOr[int] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[int]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> int | DefaultT | ConvertedT:
     """
     An integer option.
@@ -447,6 +587,8 @@ def integer(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -455,6 +597,8 @@ def integer(
         min_value: The minimum value for the option.
         max_value: The maximum value for the option.
         autocomplete: The autocomplete provider function to use for the option.
+        autocomplete_cache: The cache to use for the responses of the autocomplete provider. If :obj:`None`, responses
+            will not be cached. Defaults to :obj:`None`.
 
     Returns:
         Descriptor allowing access to the option value from within a command invocation.
@@ -476,7 +620,9 @@ def integer(
                 max_value=max_value,
                 autocomplete=autocomplete is not hikari.UNDEFINED,
                 autocomplete_provider=autocomplete,
+                autocomplete_cache=autocomplete_cache,
                 converter=converter,
+                lazy=lazy,
             ),
             utils.EMPTY,
         ),
@@ -501,6 +647,7 @@ def boolean(
     /,
     *,
     converter: t.Callable[[context.Context, bool], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> DefaultT | ConvertedT: ...
@@ -512,6 +659,7 @@ def boolean(
     /,
     *,
     converter: t.Callable[[context.Context, bool], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> bool | DefaultT | ConvertedT:
@@ -522,6 +670,8 @@ def boolean(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -543,6 +693,7 @@ def boolean(
                 localize=localize,
                 default=default,
                 converter=converter,
+                lazy=lazy,
             ),
             utils.EMPTY,
         ),
@@ -561,6 +712,7 @@ def number(
     min_value: hikari.UndefinedOr[float] = hikari.UNDEFINED,
     max_value: hikari.UndefinedOr[float] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[float]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> float | DefaultT: ...
 
 
@@ -571,12 +723,14 @@ def number(
     /,
     *,
     converter: t.Callable[[context.Context, float], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
     choices: hikari.UndefinedOr[Sequence[Choice[float]]] = hikari.UNDEFINED,
     min_value: hikari.UndefinedOr[float] = hikari.UNDEFINED,
     max_value: hikari.UndefinedOr[float] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[float]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> DefaultT | ConvertedT: ...
 
 
@@ -586,12 +740,14 @@ def number(
     /,
     *,
     converter: t.Callable[[context.Context, float], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
     choices: hikari.UndefinedOr[Sequence[Choice[float]]] = hikari.UNDEFINED,
     min_value: hikari.UndefinedOr[float] = hikari.UNDEFINED,
     max_value: hikari.UndefinedOr[float] = hikari.UNDEFINED,
     autocomplete: hikari.UndefinedOr[AutocompleteProvider[float]] = hikari.UNDEFINED,
+    autocomplete_cache: AutocompleteCache | None = None,
 ) -> float | DefaultT | ConvertedT:
     """
     A numeric (float) option.
@@ -600,6 +756,8 @@ def number(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -608,6 +766,8 @@ def number(
         min_value: The minimum value for the option.
         max_value: The maximum value for the option.
         autocomplete: The autocomplete provider function to use for the option.
+        autocomplete_cache: The cache to use for the responses of the autocomplete provider. If :obj:`None`, responses
+            will not be cached. Defaults to :obj:`None`.
 
     Returns:
         Descriptor allowing access to the option value from within a command invocation.
@@ -629,7 +789,9 @@ def number(
                 max_value=max_value,
                 autocomplete=autocomplete is not hikari.UNDEFINED,
                 autocomplete_provider=autocomplete,
+                autocomplete_cache=autocomplete_cache,
                 converter=converter,
+                lazy=lazy,
             ),
             utils.EMPTY,
         ),
@@ -654,6 +816,7 @@ def user(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.User], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> DefaultT | ConvertedT: ...
@@ -665,6 +828,7 @@ def user(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.User], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> hikari.User | DefaultT | ConvertedT:
@@ -675,6 +839,8 @@ def user(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -696,6 +862,7 @@ def user(
                 localize=localize,
                 default=default,
                 converter=converter,
+                lazy=lazy,
             ),
             utils.EMPTY,
         ),
@@ -721,6 +888,7 @@ def channel(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.PartialChannel], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
     channel_types: hikari.UndefinedOr[Sequence[hikari.ChannelType]] = hikari.UNDEFINED,
@@ -733,6 +901,7 @@ def channel(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.PartialChannel], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
     channel_types: hikari.UndefinedOr[Sequence[hikari.ChannelType]] = hikari.UNDEFINED,
@@ -744,6 +913,8 @@ def channel(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -767,6 +938,7 @@ def channel(
                 default=default,
                 channel_types=channel_types,
                 converter=converter,
+                lazy=lazy,
             ),
             utils.EMPTY,
         ),
@@ -791,6 +963,7 @@ def role(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.Role], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> DefaultT | ConvertedT: ...
@@ -802,6 +975,7 @@ def role(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.Role], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> hikari.Role | DefaultT | ConvertedT:
@@ -812,6 +986,8 @@ def role(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -833,6 +1009,7 @@ def role(
                 localize=localize,
                 default=default,
                 converter=converter,
+                lazy=lazy,
             ),
             utils.EMPTY,
         ),
@@ -857,6 +1034,7 @@ def mentionable(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.Snowflake], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> DefaultT | ConvertedT: ...
@@ -868,6 +1046,7 @@ def mentionable(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.Snowflake], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> hikari.Snowflake | DefaultT | ConvertedT:
@@ -878,6 +1057,8 @@ def mentionable(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -899,6 +1080,7 @@ def mentionable(
                 localize=localize,
                 default=default,
                 converter=converter,
+                lazy=lazy,
             ),
             utils.EMPTY,
         ),
@@ -923,6 +1105,7 @@ def attachment(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.Attachment], types.MaybeAwaitable[ConvertedT]],
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> DefaultT | ConvertedT: ...
@@ -934,6 +1117,7 @@ def attachment(
     /,
     *,
     converter: t.Callable[[context.Context, hikari.Attachment], types.MaybeAwaitable[ConvertedT]] | None = None,
+    lazy: bool | None = None,
     localize: bool = False,
     default: hikari.UndefinedOr[DefaultT] = hikari.UNDEFINED,
 ) -> hikari.Attachment | DefaultT | ConvertedT:
@@ -944,6 +1128,8 @@ def attachment(
         name: The name of the option.
         description: The description of the option.
         converter: The converter to be used to convert the value to a custom type.
+        lazy: Whether the converter should only be called when the option's value is first accessed, instead
+            of before the command is invoked. If :obj:`None`, the command's ``lazy_options`` setting is used.
         localize: Whether to localize this option's name and description. If :obj:`True`, then the
             ``name`` and ``description`` arguments will instead be interpreted as localization keys from which the
             actual name and description will be retrieved. Defaults to :obj:`False`.
@@ -965,6 +1151,7 @@ def attachment(
                 localize=localize,
                 default=default,
                 converter=converter,
+                lazy=lazy,
             ),
             utils.EMPTY,
         ),
@@ -160,6 +160,53 @@ component callbacks in any way - change attributes of the components, add compon
 within a component callback, you wish to resend the menu with a response (after changing anything) - you can pass
 ``rebuild_menu=True``, or ``components=self`` to the context respond call .
 
+Persisting Menus Across Restarts
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Menus attached using ``attach_persistent`` only exist in memory, so they will stop working when your bot restarts.
+If you pass a :obj:`~lightbulb.components.stores.MenuStore` to the client using the ``menu_store`` argument, you can
+attach a menu using ``persist=True`` to save it to the store. When an interaction is received for a persisted menu
+that is not attached - for example after a restart - the menu will be rebuilt from the store automatically.
+
+Lightbulb provides :obj:`~lightbulb.components.stores.SQLiteMenuStore` and
+:obj:`~lightbulb.components.stores.InMemoryMenuStore`, or you can implement your own.
+
+Any state that your menu needs should be returned from :meth:`~lightbulb.components.menus.Menu.to_state`, and be
+used to rebuild the menu in :meth:`~lightbulb.components.menus.Menu.from_state`. The rebuilt menu must add the same
+interactive components in the same order - their custom IDs will be restored for you.
+
+.. dropdown:: Example
+
+    .. code-block:: python
+
+        import hikari
+        import lightbulb
+
+        client = lightbulb.client_from_app(
+            bot, menu_store=lightbulb.components.SQLiteMenuStore("menus.db")
+        )
+
+        class Counter(lightbulb.components.Menu):
+            def __init__(self, count: int = 0) -> None:
+                self.count = count
+                self.button = self.add_interactive_button(hikari.ButtonStyle.PRIMARY, self.on_press, label="+1")
+
+            async def on_press(self, ctx: lightbulb.components.MenuContext) -> None:
+                self.count += 1
+                await ctx.respond(f"Count: {self.count}", edit=True)
+
+            def to_state(self) -> dict[str, int]:
+                return {"count": self.count}
+
+            @classmethod
+            def from_state(cls, state: dict[str, int]) -> "Counter":
+                return cls(state["count"])
+
+        # Within a command
+        menu = Counter()
+        await ctx.respond("Count: 0", components=menu)
+        menu.attach_persistent(client, timeout=None, persist=True)
+
 A Note on Select Components
 ^^^^^^^^^^^^^^^^^^^^^^^^^^^
 
@@ -182,6 +229,31 @@ You can get the selected values for a select menu using the
             async def on_select(self, ctx: lightbulb.components.MenuContext) -> None:
                 await ctx.respond(f"Selected: {ctx.selected_values_for(self.select)}")
 
+Pattern-Routed Handlers
+^^^^^^^^^^^^^^^^^^^^^^^
+
+For persistent components that do not need any per-message state - for example a "close ticket" button that exists
+on many different messages - you can register a handler with the client for a custom ID *pattern* instead of
+attaching a menu for every message.
+
+Patterns are made up of segments separated by ``:``. Segments in the form ``{name}`` will match any value, and the
+matched value will be passed to your handler as a keyword argument. Literal segments always take precedence over
+parameters. Handlers have dependency injection enabled, and will only be called for interactions that no attached
+menu is handling.
+
+.. dropdown:: Example
+
+    .. code-block:: python
+
+        import lightbulb
+
+        @client.component_handler("ticket:close:{ticket_id}")
+        async def close_ticket(ctx: lightbulb.components.ComponentContext, ticket_id: str) -> None:
+            await ctx.respond(f"Closed ticket {ticket_id}", edit=True, components=[])
+
+Handlers can also be registered using :meth:`~lightbulb.loaders.Loader.component_handler` so that they
+are added and removed along with your extensions.
+
 ----
 
 Modal Handling
@@ -287,19 +359,27 @@ injection.
 from lightbulb.components.base import *
 from lightbulb.components.menus import *
 from lightbulb.components.modals import *
+from lightbulb.components.routes import *
+from lightbulb.components.stores import *
 
 __all__ = [
     "BaseComponent",
     "ChannelSelect",
+    "ComponentContext",
+    "ComponentRouter",
+    "InMemoryMenuStore",
     "InteractiveButton",
     "LinkButton",
     "MentionableSelect",
     "Menu",
     "MenuContext",
     "MenuHandle",
+    "MenuRecord",
+    "MenuStore",
     "Modal",
     "ModalContext",
     "RoleSelect",
+    "SQLiteMenuStore",
     "Select",
     "TextInput",
     "TextSelect",
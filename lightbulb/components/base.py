@@ -30,6 +30,7 @@ import hikari
 from hikari.api import special_endpoints
 
 from lightbulb import context
+from lightbulb import tracing
 from lightbulb.internal import constants
 
 if t.TYPE_CHECKING:
@@ -198,8 +199,8 @@ class MessageResponseMixinWithEdit(context.MessageResponseMixin[context.Responda
                 # This will automatically cause a response if the initial response was deferred previously.
                 # I am not sure if this is intentional by discord however so, we may want to look into changing
                 # this to actually edit the initial response if it was previously deferred.
-                return (
-                    await self.interaction.execute(
+                with tracing.span("lightbulb.followup"):
+                    message = await self.interaction.execute(
                         content,
                         flags=flags,
                         tts=tts,
@@ -214,7 +215,7 @@ class MessageResponseMixinWithEdit(context.MessageResponseMixin[context.Responda
                         user_mentions=user_mentions,
                         role_mentions=role_mentions,
                     )
-                ).id
+                return message.id
 
 
 class BuildableComponentContainer(abc.ABC, Sequence[special_endpoints.ComponentBuilder], t.Generic[RowT]):
@@ -42,6 +42,8 @@ import abc
 import asyncio
 import contextlib
 import contextvars
+import importlib
+import json
 import typing as t
 import uuid
 
@@ -51,11 +53,14 @@ import linkd
 from hikari.api import special_endpoints
 from hikari.impl import special_endpoints as special_endpoints_impl
 
+from lightbulb import tracing
 from lightbulb.components import base
+from lightbulb.components import stores
 
 if t.TYPE_CHECKING:
     from collections.abc import Awaitable
     from collections.abc import Callable
+    from collections.abc import Mapping
     from collections.abc import Sequence
 
     import typing_extensions as t_ex
@@ -482,7 +487,8 @@ class MenuContext(base.MessageResponseMixinWithEdit[hikari.ComponentInteraction]
             if self._initial_response_sent.is_set():
                 raise RuntimeError("cannot respond with a modal if an initial response has already been sent")
 
-            await self.interaction.create_modal_response(title, custom_id, component, components)
+            with tracing.span("lightbulb.initial_response", response_type=hikari.ResponseType.MODAL.name):
+                await self.interaction.create_modal_response(title, custom_id, component, components)
             self._initial_response_sent.set()
 
     async def respond(
@@ -585,7 +591,7 @@ class MenuHandle:
         self._task = task
         self._stop_event = stop_event
 
-        self.__am: _MenuInteractionHandlerContainer | None = None
+        self.__am: _MenuInteractionHandlerContainer | None = _am
 
     @property
     def _am(self) -> _MenuInteractionHandlerContainer | None:
@@ -595,7 +601,7 @@ class MenuHandle:
     def _am(self, am: _MenuInteractionHandlerContainer) -> None:
         self.__am = am
         if self._stop_event.is_set():
-            am._client._attached_menus.discard(am)
+            am._forget()
 
     async def wait(self) -> None:
         if self._task is None:
@@ -612,7 +618,7 @@ class MenuHandle:
             :obj:`None`
         """
         if self.__am is not None:
-            self.__am._client._attached_menus.discard(self.__am)
+            self.__am._forget()
 
         self._stop_event.set()
         if self._task is not None:
@@ -620,7 +626,7 @@ class MenuHandle:
 
 
 class _MenuInteractionHandlerContainer:
-    __slots__ = ("_client", "_ctx", "_menu", "_stop_event", "_tm", "custom_ids")
+    __slots__ = ("_client", "_ctx", "_menu", "_menu_id", "_persisted", "_stop_event", "_tm", "custom_ids")
 
     def __init__(
         self,
@@ -629,17 +635,132 @@ class _MenuInteractionHandlerContainer:
         tm: async_timeout.Timeout | None,
         stop_event: asyncio.Event,
         ctx: contextvars.Context | None,
+        menu_id: str | None = None,
     ) -> None:
         self._client = client
         self._menu = menu
         self._tm = tm
         self._stop_event = stop_event
         self._ctx = ctx
+        self._menu_id = menu_id
+        # The custom IDs and serialized state last saved to the menu store, used to skip saves that change nothing
+        self._persisted: tuple[list[str], str] | None = None
 
         self.custom_ids: dict[str, base.BaseComponent[special_endpoints.MessageActionRowBuilder]] = {
             c.custom_id: c for row in self._menu._rows for c in row if not isinstance(c, LinkButton)
         }
 
+    def _attach(self) -> None:
+        """
+        Add this menu's custom IDs to the client's index so that interactions are routed to it. If another menu
+        is attached with the same custom ID, interactions are routed to the most recently attached menu.
+        """
+        attached = self._client._attached_menus
+        for custom_id in self.custom_ids:
+            menus = attached.setdefault(custom_id, [])
+            if self not in menus:
+                menus.append(self)
+
+    def _detach(self) -> None:
+        """
+        Remove this menu's custom IDs from the client's index. Interactions for a custom ID shared with another
+        attached menu are routed to that menu instead. Does nothing if the menu is not attached.
+        """
+        attached = self._client._attached_menus
+        for custom_id in self.custom_ids:
+            if (menus := attached.get(custom_id)) is None or self not in menus:
+                continue
+
+            menus.remove(self)
+            if not menus:
+                del attached[custom_id]
+
+    def _forget(self) -> None:
+        """Detach this menu, and remove its record from the client's menu store if it was persisted."""
+        self._detach()
+
+        if self._menu_id is None:
+            return
+
+        self._client._rehydrated_menus.pop(self._menu_id, None)
+        if (store := self._client.menu_store) is not None:
+            self._write(self._menu_id, store.delete)
+
+    def _write(self, menu_id: str, write: Callable[[str], Awaitable[None]]) -> asyncio.Task[None]:
+        """
+        Schedule a write to the client's menu store for the menu with the given ID. The write is run once all
+        writes previously scheduled for the same menu have finished, so that a record cannot be brought back by a
+        save which completes after it was deleted.
+        """
+        writes = self._client._menu_writes
+        previous = writes.get(menu_id)
+
+        async def _run() -> None:
+            if previous is not None:
+                # Errors from the previous write are reported by its own task
+                await asyncio.wait([previous])
+            await write(menu_id)
+
+        task = writes[menu_id] = self._client.safe_create_task(_run())
+        task.add_done_callback(lambda _: writes.pop(menu_id) if writes.get(menu_id) is task else None)
+        return task
+
+    async def _persist(self) -> None:
+        """
+        Save this menu's current state to the client's menu store. Does nothing if the menu is not persisted, or
+        if its state has not changed since it was last saved.
+        """
+        if self._menu_id is None or (store := self._client.menu_store) is None or self._stop_event.is_set():
+            return
+
+        menu_type = type(self._menu)
+        record = stores.MenuRecord(
+            menu_id=self._menu_id,
+            menu_type=f"{menu_type.__module__}:{menu_type.__qualname__}",
+            custom_ids=list(self.custom_ids),
+            state=self._menu.to_state(),
+        )
+        # Serialized now, as the menu may change its state again before the save is run
+        persisted = (list(record.custom_ids), json.dumps(record.state))
+
+        async def _save(_: str) -> None:
+            if persisted == self._persisted:
+                return
+
+            await store.save(record)
+            self._persisted = persisted
+
+        await self._write(self._menu_id, _save)
+
+    @classmethod
+    def _rehydrate(cls, client: client_.Client, record: stores.MenuRecord) -> _MenuInteractionHandlerContainer:
+        """Rebuild a persisted menu from the given record. Custom IDs are reassigned by component position."""
+        module, _, qualname = record.menu_type.partition(":")
+
+        menu_type: t.Any = importlib.import_module(module)
+        for attr in qualname.split("."):
+            menu_type = getattr(menu_type, attr)
+
+        if not (isinstance(menu_type, type) and issubclass(menu_type, Menu)):
+            raise TypeError(f"{record.menu_type!r} is not a menu class")
+
+        menu = menu_type.from_state(record.state)
+        components: list[InteractiveButton | Select[t.Any]] = [
+            c for row in menu._rows for c in row if isinstance(c, (InteractiveButton, Select))
+        ]
+        if len(components) != len(record.custom_ids):
+            raise ValueError(
+                f"rebuilt menu {record.menu_type!r} has {len(components)} interactive components "
+                f"but {len(record.custom_ids)} were persisted"
+            )
+
+        for component, custom_id in zip(components, record.custom_ids):
+            component._custom_id = custom_id
+
+        rehydrated = cls(client, menu, None, asyncio.Event(), None, record.menu_id)
+        rehydrated._persisted = (list(record.custom_ids), json.dumps(record.state))
+        return rehydrated
+
     async def on_interaction(
         self, interaction: hikari.ComponentInteraction, initial_response_sent: asyncio.Event
     ) -> None:
@@ -668,13 +789,17 @@ class _MenuInteractionHandlerContainer:
                 linkd.DI_CONTAINER.reset(token)
 
             if self._stop_event.is_set():
-                self._client._attached_menus.discard(self)
+                self._forget()
 
         if self._stop_event.is_set():
             return
 
         if context._should_re_resolve_custom_ids:
+            self._detach()
             self.custom_ids = {c.custom_id: c for row in self._menu._rows for c in row if not isinstance(c, LinkButton)}
+            self._attach()
+
+        await self._persist()
 
 
 class Menu(base.BuildableComponentContainer[special_endpoints.MessageActionRowBuilder]):
@@ -981,6 +1106,41 @@ class Menu(base.BuildableComponentContainer[special_endpoints.MessageActionRowBu
             )
         )
 
+    def to_state(self) -> dict[str, t.Any]:
+        """
+        Get the state of this menu that should be saved when it is persisted to the client's
+        :obj:`~lightbulb.components.stores.MenuStore`. The returned value **must** be JSON-serializable.
+
+        This will be called when the menu is first attached, and again after each interaction the menu handles, so
+        that any changes made within component callbacks are saved. By default, this returns an empty dictionary.
+
+        Returns:
+            The state of this menu.
+
+        See Also:
+            :meth:`~lightbulb.components.menus.Menu.from_state`
+        """
+        return {}
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, t.Any]) -> t_ex.Self:
+        """
+        Rebuild a menu from state previously returned by :meth:`~lightbulb.components.menus.Menu.to_state`. This is
+        called when an interaction is received for a persisted menu that is not currently attached to the client -
+        for example after a restart.
+
+        The returned menu **must** add the same interactive components, in the same order, as the menu that was
+        persisted. The custom IDs of the components will be restored automatically. By default, this calls the
+        class' constructor with no arguments.
+
+        Args:
+            state: The persisted state of the menu.
+
+        Returns:
+            The rebuilt menu.
+        """
+        return cls()
+
     async def attach(self, client: client_.Client, *, timeout: float | None = 30) -> None:
         """
         Attach this menu to the given client, starting it - and wait for it to terminate. You may optionally
@@ -1012,14 +1172,16 @@ class Menu(base.BuildableComponentContainer[special_endpoints.MessageActionRowBu
                 tm = await stack.enter_async_context(async_timeout.timeout(timeout))
 
             am = _MenuInteractionHandlerContainer(client, self, tm, stop_event, ctx)
-            client._attached_menus.add(am)
+            am._attach()
 
             try:
                 await stop_event.wait()
             finally:
-                client._attached_menus.discard(am)
+                am._detach()
 
-    def attach_persistent(self, client: client_.Client, *, timeout: float | None = 30) -> MenuHandle:
+    def attach_persistent(
+        self, client: client_.Client, *, timeout: float | None = 30, persist: bool = False
+    ) -> MenuHandle:
         """
         Attach this menu to the given client, starting it in the background. You may optionally provide
         a timeout, after which an :obj:`asyncio.TimeoutError` will be raised within the created task. This method
@@ -1029,20 +1191,38 @@ class Menu(base.BuildableComponentContainer[special_endpoints.MessageActionRowBu
             client: The client to attach the menu to.
             timeout: The amount of time in seconds before the menu will time out. Defaults to `30` seconds. Set to
                 :obj:`None` to disable timeout.
+            persist: Whether the menu should be saved to the client's :obj:`~lightbulb.components.stores.MenuStore`
+                so that it can continue to handle interactions after a restart. Defaults to :obj:`False`. The menu
+                will be rebuilt using :meth:`~lightbulb.components.menus.Menu.from_state` when the first
+                interaction for it is received after a restart. Requires ``timeout`` to be :obj:`None`.
 
         Returns:
             A proxy for the menu's interaction consumer. You can await `.wait()` on this in order
             to wait for the menu to terminate. You may also call `.stop_interacting()` to manually stop the menu.
 
+        Raises:
+            :obj:`ValueError`: If ``persist`` is :obj:`True` and a timeout was passed.
+            :obj:`RuntimeError`: If ``persist`` is :obj:`True` and the client does not have a menu store.
+
         Note:
             If you wait on a menu to terminate that had ``timeout=None``, it is possible that it will block
             forever if the menu never terminates from within one of the component callbacks.
         """
+        if persist:
+            if timeout is not None:
+                raise ValueError("only menus without a timeout can be persisted")
+            if client.menu_store is None:
+                raise RuntimeError("cannot persist menu - client does not have a menu store")
+
         stop_event = asyncio.Event()
 
         if timeout is None:
-            am = _MenuInteractionHandlerContainer(client, self, None, stop_event, None)
-            client._attached_menus.add(am)
+            am = _MenuInteractionHandlerContainer(
+                client, self, None, stop_event, None, uuid.uuid4().hex if persist else None
+            )
+            am._attach()
+            if persist:
+                client.safe_create_task(am._persist())
             return MenuHandle(None, stop_event, _am=am)
 
         handle = MenuHandle(None, stop_event)
@@ -1051,12 +1231,12 @@ class Menu(base.BuildableComponentContainer[special_endpoints.MessageActionRowBu
             async with async_timeout.timeout(timeout) as tm:
                 am = _MenuInteractionHandlerContainer(client, self, tm, stop_event, None)
                 handle._am = am
-                client._attached_menus.add(am)
+                am._attach()
 
                 try:
                     await stop_event.wait()
                 finally:
-                    client._attached_menus.discard(am)
+                    am._detach()
 
         # Always suppress timeout exceptions from being logged to prevent clutter
         task = client.safe_create_task(_run_with_timeout())
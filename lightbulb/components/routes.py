@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__ = ["ComponentContext", "ComponentRouter"]
+
+import re
+import typing as t
+
+import hikari
+
+from lightbulb import tracing
+from lightbulb.components import base
+
+if t.TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from hikari.api import special_endpoints
+
+    from lightbulb import client as client_
+    from lightbulb.internal import types
+
+SEGMENT_SEPARATOR: t.Final[str] = ":"
+_PARAMETER_REGEX: t.Final[re.Pattern[str]] = re.compile(r"^\{(?P<name>[A-Za-z_][A-Za-z0-9_]*)\}$")
+
+
+class ComponentContext(base.MessageResponseMixinWithEdit[hikari.ComponentInteraction]):
+    """Class representing the context for a component interaction handled by a pattern-routed component handler."""
+
+    __slots__ = ("_interaction", "client", "pattern")
+
+    def __init__(
+        self,
+        client: client_.Client,
+        interaction: hikari.ComponentInteraction,
+        pattern: str,
+        initial_response_sent: asyncio.Event,
+    ) -> None:
+        super().__init__(initial_response_sent)
+
+        self.client: client_.Client = client
+        """The client that is handling interactions for this context."""
+        self.pattern: str = pattern
+        """The pattern of the handler that matched the interaction's custom ID."""
+        self._interaction: hikari.ComponentInteraction = interaction
+
+    @property
+    def interaction(self) -> hikari.ComponentInteraction:
+        """The interaction that this context is for."""
+        return self._interaction
+
+    @property
+    def custom_id(self) -> str:
+        """The custom ID of the component that triggered the interaction."""
+        return self.interaction.custom_id
+
+    @property
+    def guild_id(self) -> hikari.Snowflake | None:
+        """The ID of the guild that the interaction was created in. :obj:`None` if the interaction occurred in DM."""
+        return self.interaction.guild_id
+
+    @property
+    def channel_id(self) -> hikari.Snowflake:
+        """The ID of the channel that the interaction was created in."""
+        return self.interaction.channel_id
+
+    @property
+    def user(self) -> hikari.User:
+        """The user that created the interaction."""
+        return self.interaction.user
+
+    @property
+    def member(self) -> hikari.InteractionMember | None:
+        """The member that created the interaction, if it was created in a guild."""
+        return self.interaction.member
+
+    async def respond_with_modal(
+        self,
+        title: str,
+        custom_id: str,
+        component: hikari.UndefinedOr[special_endpoints.ComponentBuilder] = hikari.UNDEFINED,
+        components: hikari.UndefinedOr[Sequence[special_endpoints.ComponentBuilder]] = hikari.UNDEFINED,
+    ) -> None:
+        """
+        Create a modal response to the interaction that this context represents.
+
+        Args:
+            title: The title that will show up in the modal.
+            custom_id: Developer set custom ID used for identifying interactions with this modal.
+            component: A component builder to send in this modal.
+            components: A sequence of component builders to send in this modal.
+
+        Returns:
+            :obj:`None`
+
+        Raises:
+            :obj:`RuntimeError`: If an initial response has already been sent.
+        """
+        async with self._response_lock:
+            if self._initial_response_sent.is_set():
+                raise RuntimeError("cannot respond with a modal if an initial response has already been sent")
+
+            with tracing.span("lightbulb.initial_response", response_type=hikari.ResponseType.MODAL.name):
+                await self.interaction.create_modal_response(title, custom_id, component, components)
+            self._initial_response_sent.set()
+
+
+class _RouteNode:
+    __slots__ = ("handler", "literals", "parameter", "parameter_name", "pattern")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _RouteNode] = {}
+        self.parameter: _RouteNode | None = None
+        self.parameter_name: str | None = None
+
+        self.handler: types.ComponentHandler | None = None
+        self.pattern: str | None = None
+
+    def is_empty(self) -> bool:
+        return self.handler is None and not self.literals and self.parameter is None
+
+
+class ComponentRouter:
+    """
+    Radix tree mapping custom ID patterns to component handlers. Patterns are made up of segments separated by
+    ``:``. Each segment is either a literal which must match exactly, or a parameter - ``{name}`` - which will
+    match any single segment and be passed to the handler as a keyword argument.
+
+    Literal segments are always preferred over parameters when resolving a custom ID. For example, given the patterns
+    ``ticket:close:all`` and ``ticket:close:{ticket_id}``, the custom ID ``ticket:close:all`` will always resolve
+    to the first pattern.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        self._root = _RouteNode()
+
+    @staticmethod
+    def _parse_segment(segment: str) -> str | None:
+        if match := _PARAMETER_REGEX.match(segment):
+            return match.group("name")
+
+        if "{" in segment or "}" in segment:
+            raise ValueError(f"invalid pattern segment {segment!r} - parameters must take up an entire segment")
+        return None
+
+    def add(self, pattern: str, handler: types.ComponentHandler) -> None:
+        """
+        Add a handler for the given pattern.
+
+        Args:
+            pattern: The custom ID pattern to add the handler for.
+            handler: The handler to call when a custom ID matching the pattern is received.
+
+        Returns:
+            :obj:`None`
+
+        Raises:
+            :obj:`ValueError`: If the pattern is invalid, or a handler is already registered for an
+                equivalent pattern.
+        """
+        seen: set[str] = set()
+
+        node = self._root
+        for segment in pattern.split(SEGMENT_SEPARATOR):
+            parameter = self._parse_segment(segment)
+            if parameter is None:
+                node = node.literals.setdefault(segment, _RouteNode())
+                continue
+
+            if parameter in seen:
+                raise ValueError(f"duplicate parameter {parameter!r} in pattern {pattern!r}")
+            seen.add(parameter)
+
+            if node.parameter is None:
+                node.parameter, node.parameter_name = _RouteNode(), parameter
+            elif node.parameter_name != parameter:
+                raise ValueError(
+                    f"parameter {parameter!r} in pattern {pattern!r} conflicts with existing parameter "
+                    f"{node.parameter_name!r}"
+                )
+            node = node.parameter
+
+        if node.handler is not None:
+            raise ValueError(f"a component handler is already registered for pattern {node.pattern!r}")
+
+        node.handler, node.pattern = handler, pattern
+
+    def _walk(self, pattern: str) -> list[tuple[_RouteNode, str | None]] | None:
+        path: list[tuple[_RouteNode, str | None]] = []
+
+        node = self._root
+        for segment in pattern.split(SEGMENT_SEPARATOR):
+            parameter = self._parse_segment(segment)
+            next_node = node.literals.get(segment) if parameter is None else node.parameter
+            if next_node is None or (parameter is not None and node.parameter_name != parameter):
+                return None
+
+            path.append((node, segment if parameter is None else None))
+            node = next_node
+
+        path.append((node, None))
+        return path
+
+    def get(self, pattern: str) -> types.ComponentHandler | None:
+        """
+        Get the handler registered for the given pattern.
+
+        Args:
+            pattern: The custom ID pattern to get the handler for.
+
+        Returns:
+            The registered handler, or :obj:`None` if no handler is registered for the pattern.
+        """
+        if (path := self._walk(pattern)) is None:
+            return None
+        return path[-1][0].handler
+
+    def remove(self, pattern: str) -> types.ComponentHandler | None:
+        """
+        Remove the handler for the given pattern.
+
+        Args:
+            pattern: The custom ID pattern to remove the handler for.
+
+        Returns:
+            The removed handler, or :obj:`None` if no handler was registered for the pattern.
+        """
+        if (path := self._walk(pattern)) is None:
+            return None
+
+        node, _ = path.pop()
+        handler, node.handler, node.pattern = node.handler, None, None
+
+        # Prune any branches that no longer lead to a handler
+        for parent, segment in reversed(path):
+            if not node.is_empty():
+                break
+
+            if segment is None:
+                parent.parameter, parent.parameter_name = None, None
+            else:
+                del parent.literals[segment]
+            node = parent
+
+        return handler
+
+    def resolve(self, custom_id: str) -> tuple[types.ComponentHandler, str, Mapping[str, str]] | None:
+        """
+        Resolve the handler for the given custom ID.
+
+        Args:
+            custom_id: The custom ID to resolve the handler for.
+
+        Returns:
+            The handler, the pattern it was registered with, and the parsed parameters; or :obj:`None` if
+            no pattern matches the custom ID.
+        """
+        segments = custom_id.split(SEGMENT_SEPARATOR)
+        params: dict[str, str] = {}
+
+        def _resolve(node: _RouteNode, index: int) -> _RouteNode | None:
+            if index == len(segments):
+                return node if node.handler is not None else None
+
+            segment = segments[index]
+            if (literal := node.literals.get(segment)) is not None and (
+                found := _resolve(literal, index + 1)
+            ) is not None:
+                return found
+
+            if node.parameter is not None and (found := _resolve(node.parameter, index + 1)) is not None:
+                assert node.parameter_name is not None
+                params[node.parameter_name] = segment
+                return found
+
+            return None
+
+        found = _resolve(self._root, 0)
+        if found is None:
+            return None
+
+        assert found.handler is not None and found.pattern is not None
+        return found.handler, found.pattern, params
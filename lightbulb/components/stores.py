@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__ = ["InMemoryMenuStore", "MenuRecord", "MenuStore", "SQLiteMenuStore"]
+
+import abc
+import asyncio
+import dataclasses
+import json
+import sqlite3
+import threading
+import typing as t
+
+if t.TYPE_CHECKING:
+    import os
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MenuRecord:
+    """Dataclass representing the persisted state of a single menu."""
+
+    menu_id: str
+    """The unique ID of the menu."""
+    menu_type: str
+    """The import path of the menu's class, in the form ``module:QualifiedName``."""
+    custom_ids: Sequence[str]
+    """The custom IDs of the menu's interactive components, in the order they appear in the menu."""
+    state: Mapping[str, t.Any]
+    """The JSON-serializable state of the menu, as returned from :meth:`~lightbulb.components.menus.Menu.to_state`."""
+
+
+class MenuStore(abc.ABC):
+    """
+    Abstract class defining the interface for a store used to persist the state of menus so that they
+    can be rebuilt after a restart.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    async def save(self, record: MenuRecord) -> None:
+        """
+        Save the given menu record, replacing any existing record with the same menu ID.
+
+        Args:
+            record: The record to save.
+
+        Returns:
+            :obj:`None`
+        """
+
+    @abc.abstractmethod
+    async def get(self, custom_id: str) -> MenuRecord | None:
+        """
+        Get the record for the menu containing a component with the given custom ID.
+
+        Args:
+            custom_id: The custom ID to get the menu record for.
+
+        Returns:
+            The menu record, or :obj:`None` if no menu containing the custom ID has been saved.
+        """
+
+    @abc.abstractmethod
+    async def delete(self, menu_id: str) -> None:
+        """
+        Delete the record for the menu with the given ID. If no such record exists, this will do nothing.
+
+        Args:
+            menu_id: The ID of the menu to delete the record for.
+
+        Returns:
+            :obj:`None`
+        """
+
+    async def close(self) -> None:
+        """
+        Release any resources held by the store. Called when the client is stopped. By default, this does nothing.
+
+        Returns:
+            :obj:`None`
+        """
+
+
+class InMemoryMenuStore(MenuStore):
+    """
+    Menu store implementation that keeps all records in memory. Records will **not** survive a restart, so this
+    is mostly useful for testing.
+    """
+
+    __slots__ = ("_custom_ids", "_records")
+
+    def __init__(self) -> None:
+        self._records: dict[str, MenuRecord] = {}
+        self._custom_ids: dict[str, str] = {}
+
+    async def save(self, record: MenuRecord) -> None:
+        await self.delete(record.menu_id)
+
+        self._records[record.menu_id] = record
+        for custom_id in record.custom_ids:
+            self._custom_ids[custom_id] = record.menu_id
+
+    async def get(self, custom_id: str) -> MenuRecord | None:
+        if (menu_id := self._custom_ids.get(custom_id)) is None:
+            return None
+        return self._records.get(menu_id)
+
+    async def delete(self, menu_id: str) -> None:
+        if (record := self._records.pop(menu_id, None)) is None:
+            return
+
+        for custom_id in record.custom_ids:
+            if self._custom_ids.get(custom_id) == menu_id:
+                del self._custom_ids[custom_id]
+
+
+class SQLiteMenuStore(MenuStore):
+    """
+    Menu store implementation backed by an SQLite database. Queries are run in a separate thread so that they
+    do not block the event loop. The database connection is opened lazily on first use.
+
+    Args:
+        path: The path to the database file. The tables used by the store will be created if they do not exist.
+    """
+
+    __slots__ = ("_conn", "_lock", "_path")
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self._path = path
+
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            with self._conn:
+                self._conn.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS lightbulb_menus (
+                        menu_id TEXT PRIMARY KEY,
+                        menu_type TEXT NOT NULL,
+                        state TEXT NOT NULL
+                    );
+                    CREATE TABLE IF NOT EXISTS lightbulb_menu_custom_ids (
+                        custom_id TEXT PRIMARY KEY,
+                        menu_id TEXT NOT NULL,
+                        position INTEGER NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS lightbulb_menu_custom_ids_menu_id
+                        ON lightbulb_menu_custom_ids (menu_id);
+                    """
+                )
+        return self._conn
+
+    def _save(self, record: MenuRecord) -> None:
+        with self._lock, self._connection() as conn:
+            conn.execute("DELETE FROM lightbulb_menu_custom_ids WHERE menu_id = ?", (record.menu_id,))
+            conn.execute(
+                "INSERT OR REPLACE INTO lightbulb_menus (menu_id, menu_type, state) VALUES (?, ?, ?)",
+                (record.menu_id, record.menu_type, json.dumps(record.state)),
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO lightbulb_menu_custom_ids (custom_id, menu_id, position) VALUES (?, ?, ?)",
+                [(custom_id, record.menu_id, i) for i, custom_id in enumerate(record.custom_ids)],
+            )
+
+    def _get(self, custom_id: str) -> MenuRecord | None:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT m.menu_id, m.menu_type, m.state FROM lightbulb_menu_custom_ids c "
+                "JOIN lightbulb_menus m ON m.menu_id = c.menu_id WHERE c.custom_id = ?",
+                (custom_id,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            menu_id, menu_type, state = row
+            custom_ids = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT custom_id FROM lightbulb_menu_custom_ids WHERE menu_id = ? ORDER BY position", (menu_id,)
+                )
+            ]
+
+        return MenuRecord(menu_id, menu_type, custom_ids, json.loads(state))
+
+    def _delete(self, menu_id: str) -> None:
+        with self._lock, self._connection() as conn:
+            conn.execute("DELETE FROM lightbulb_menu_custom_ids WHERE menu_id = ?", (menu_id,))
+            conn.execute("DELETE FROM lightbulb_menus WHERE menu_id = ?", (menu_id,))
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def save(self, record: MenuRecord) -> None:
+        await asyncio.to_thread(self._save, record)
+
+    async def get(self, custom_id: str) -> MenuRecord | None:
+        return await asyncio.to_thread(self._get, custom_id)
+
+    async def delete(self, menu_id: str) -> None:
+        await asyncio.to_thread(self._delete, menu_id)
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close)
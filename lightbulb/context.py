@@ -34,6 +34,7 @@ from collections.abc import Sequence
 import hikari
 from hikari.api import special_endpoints
 
+from lightbulb import tracing
 from lightbulb.internal import constants
 
 if t.TYPE_CHECKING:
@@ -55,7 +56,16 @@ AutocompleteResponse: t.TypeAlias = t.Union[
 class AutocompleteContext(t.Generic[T]):
     """Class representing the context for an autocomplete interaction."""
 
-    __slots__ = ("_focused", "_initial_response_sent", "client", "command", "interaction", "options")
+    __slots__ = (
+        "_focused",
+        "_initial_response_sent",
+        "_options_by_name",
+        "_response",
+        "client",
+        "command",
+        "interaction",
+        "options",
+    )
 
     def __init__(
         self,
@@ -75,22 +85,25 @@ class AutocompleteContext(t.Generic[T]):
         """Command class for the autocomplete invocation."""
 
         self._focused: hikari.AutocompleteInteractionOption | None = None
+        self._options_by_name: dict[str, hikari.AutocompleteInteractionOption] | None = None
         self._initial_response_sent: asyncio.Event = initial_response_sent
+        self._response: Sequence[special_endpoints.AutocompleteChoiceBuilder] | None = None
 
     @property
     def focused(self) -> hikari.AutocompleteInteractionOption:
         """
         The focused option for the autocomplete interaction - the option currently being autocompleted.
 
+        Raises:
+            :obj:`RuntimeError`: If the interaction does not contain a focused option.
+
         See Also:
             :meth:`~AutocompleteContext.get_option`
         """
-        if self._focused is not None:
-            return self._focused
+        if self._focused is None:
+            self._index_options()
 
-        found = next(filter(lambda opt: opt.is_focused, self.options))
-
-        self._focused = found
+        assert self._focused is not None
         return self._focused
 
     @property
@@ -120,7 +133,22 @@ class AutocompleteContext(t.Generic[T]):
         if option is None:
             return None
 
-        return next(filter(lambda opt: opt.name == option._localized_name, self.options), None)
+        if self._options_by_name is None:
+            self._index_options()
+
+        assert self._options_by_name is not None
+        return self._options_by_name.get(option._localized_name)
+
+    def _index_options(self) -> None:
+        # Find the focused option and map the provided options by name in a single pass
+        self._options_by_name = {}
+        for option in self.options:
+            self._options_by_name[option.name] = option
+            if option.is_focused:
+                self._focused = option
+
+        if self._focused is None:
+            raise RuntimeError("no focused option provided with the interaction")
 
     @staticmethod
     def _normalise_choices(choices: AutocompleteResponse[T]) -> Sequence[special_endpoints.AutocompleteChoiceBuilder]:
@@ -151,18 +179,24 @@ class AutocompleteContext(t.Generic[T]):
             :obj:`None`
         """
         normalised_choices = self._normalise_choices(choices)
-        await self.interaction.create_response(normalised_choices)
+        with tracing.span("lightbulb.initial_response", response_type=hikari.ResponseType.AUTOCOMPLETE.name):
+            await self.interaction.create_response(normalised_choices)
         self._initial_response_sent.set()
+        self._response = normalised_choices
 
 
 class MessageResponseMixin(abc.ABC, t.Generic[RespondableInteractionT]):
     """Abstract mixin for contexts that allow creating responses to interactions."""
 
-    __slots__ = ("_initial_response_sent", "_response_lock")
+    __slots__ = ("_deferred_flags", "_initial_response_sent", "_recorded_responses", "_response_lock")
 
     def __init__(self, initial_response_sent: asyncio.Event) -> None:
         self._response_lock: asyncio.Lock = asyncio.Lock()
         self._initial_response_sent: asyncio.Event = initial_response_sent
+        # When not None, the arguments of each call to 'respond' are appended - used to cache responses
+        self._recorded_responses: list[dict[str, t.Any]] | None = None
+        # The flags of the deferred initial response, if one was created - used to mirror deferrals
+        self._deferred_flags: hikari.MessageFlag | None = None
 
     @property
     @abc.abstractmethod
@@ -287,22 +321,23 @@ class MessageResponseMixin(abc.ABC, t.Generic[RespondableInteractionT]):
         user_mentions: hikari.UndefinedOr[hikari.SnowflakeishSequence[hikari.PartialUser] | bool] = hikari.UNDEFINED,
         role_mentions: hikari.UndefinedOr[hikari.SnowflakeishSequence[hikari.PartialRole] | bool] = hikari.UNDEFINED,
     ) -> hikari.Snowflakeish:
-        await self.interaction.create_initial_response(
-            response_type,  # type: ignore[reportArgumentType]
-            content,
-            flags=flags,
-            tts=tts,
-            attachment=attachment,
-            attachments=attachments,
-            component=component,
-            components=components,
-            embed=embed,
-            embeds=embeds,
-            poll=poll,
-            mentions_everyone=mentions_everyone,
-            user_mentions=user_mentions,
-            role_mentions=role_mentions,
-        )
+        with tracing.span("lightbulb.initial_response", response_type=response_type.name):
+            await self.interaction.create_initial_response(
+                response_type,  # type: ignore[reportArgumentType]
+                content,
+                flags=flags,
+                tts=tts,
+                attachment=attachment,
+                attachments=attachments,
+                component=component,
+                components=components,
+                embed=embed,
+                embeds=embeds,
+                poll=poll,
+                mentions_everyone=mentions_everyone,
+                user_mentions=user_mentions,
+                role_mentions=role_mentions,
+            )
         return constants.INITIAL_RESPONSE_IDENTIFIER
 
     async def defer(self, *, ephemeral: bool = False) -> None:
@@ -320,10 +355,9 @@ class MessageResponseMixin(abc.ABC, t.Generic[RespondableInteractionT]):
             if self._initial_response_sent.is_set():
                 return
 
-            await self._create_initial_response(
-                hikari.ResponseType.DEFERRED_MESSAGE_CREATE,
-                flags=hikari.MessageFlag.EPHEMERAL if ephemeral else hikari.MessageFlag.NONE,
-            )
+            flags = hikari.MessageFlag.EPHEMERAL if ephemeral else hikari.MessageFlag.NONE
+            await self._create_initial_response(hikari.ResponseType.DEFERRED_MESSAGE_CREATE, flags=flags)
+            self._deferred_flags = flags
             self._initial_response_sent.set()
 
     async def respond(
@@ -383,6 +417,25 @@ class MessageResponseMixin(abc.ABC, t.Generic[RespondableInteractionT]):
         if ephemeral:
             flags = (flags or hikari.MessageFlag.NONE) | hikari.MessageFlag.EPHEMERAL
 
+        if self._recorded_responses is not None:
+            self._recorded_responses.append(
+                {
+                    "content": content,
+                    "flags": flags,
+                    "tts": tts,
+                    "attachment": attachment,
+                    "attachments": attachments,
+                    "component": component,
+                    "components": components,
+                    "embed": embed,
+                    "embeds": embeds,
+                    "poll": poll,
+                    "mentions_everyone": mentions_everyone,
+                    "user_mentions": user_mentions,
+                    "role_mentions": role_mentions,
+                }
+            )
+
         async with self._response_lock:
             if not self._initial_response_sent.is_set():
                 await self._create_initial_response(
@@ -407,8 +460,8 @@ class MessageResponseMixin(abc.ABC, t.Generic[RespondableInteractionT]):
                 # This will automatically cause a response if the initial response was deferred previously.
                 # I am not sure if this is intentional by discord however so, we may want to look into changing
                 # this to actually edit the initial response if it was previously deferred.
-                return (
-                    await self.interaction.execute(
+                with tracing.span("lightbulb.followup"):
+                    message = await self.interaction.execute(
                         content,
                         flags=flags,
                         tts=tts,
@@ -423,7 +476,7 @@ class MessageResponseMixin(abc.ABC, t.Generic[RespondableInteractionT]):
                         user_mentions=user_mentions,
                         role_mentions=role_mentions,
                     )
-                ).id
+                return message.id
 
 
 class Context(MessageResponseMixin[hikari.CommandInteraction]):
@@ -507,5 +560,6 @@ class Context(MessageResponseMixin[hikari.CommandInteraction]):
             if self._initial_response_sent.is_set():
                 raise RuntimeError("cannot respond with a modal if an initial response has already been sent")
 
-            await self.interaction.create_modal_response(title, custom_id, component, components)
+            with tracing.span("lightbulb.initial_response", response_type=hikari.ResponseType.MODAL.name):
+                await self.interaction.create_modal_response(title, custom_id, component, components)
             self._initial_response_sent.set()
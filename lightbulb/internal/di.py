@@ -0,0 +1,667 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__ = [
+    "Dependent",
+    "LazyContainer",
+    "RuntimeDependencies",
+    "cache_resolution_plan",
+    "default_container",
+    "direct_callable",
+    "lazy_context",
+    "provided_at_runtime",
+    "requires_injection",
+    "validate_dependencies",
+    "warm_up",
+]
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import time
+import typing as t
+
+import linkd
+from linkd import conditions as linkd_conditions
+from linkd import graph as linkd_graph
+from linkd import solver as linkd_solver
+from linkd import utils as linkd_utils
+
+from lightbulb import di
+from lightbulb import tracing
+from lightbulb import utils
+
+if t.TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+
+    import typing_extensions as t_ex
+
+RuntimeDependencies: t.TypeAlias = "dict[linkd.Context, set[str]]"
+"""Mapping of context to the IDs of the dependencies added to its containers while they are in use."""
+Dependent: t.TypeAlias = "tuple[linkd.Context, str, Callable[..., t.Any], int]"
+"""
+A function that has dependencies injected when called by the client - a tuple of the context it is called in,
+a description of the function, the function, and the number of positional arguments it is always called with
+(including ``self`` for methods).
+"""
+
+_CONTEXT_NAMES: t.Final[dict[linkd.Context, str]] = {
+    di.Contexts.DEFAULT: "DEFAULT",
+    di.Contexts.COMMAND: "COMMAND",
+    di.Contexts.AUTOCOMPLETE: "AUTOCOMPLETE",
+    di.Contexts.LISTENER: "LISTENER",
+    di.Contexts.TASK: "TASK",
+}
+_NO_CONTEXT: contextlib.nullcontext[None] = contextlib.nullcontext()
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _linkd_internals_available() -> bool:
+    # Dependency validation, dependency warm-up, cached resolution plans and the lazily created containers use
+    # linkd internals that are not part of its public API. If any are missing from the installed version, slower
+    # equivalents using only the public API are used instead - tests/test_linkd_compatibility.py checks them
+    try:
+        return (
+            {"_graph", "_instances", "_parent", "_tag"}.issubset(linkd.Container.__slots__)
+            and callable(getattr(linkd.Container, "_get", None))
+            and "_graph" in linkd.Registry.__slots__
+            and "_dependency_func" in linkd.AutoInjecting.__slots__
+            and callable(getattr(linkd.AutoInjecting, "_codegen_dependency_func", None))
+            and {"_order", "_required"}.issubset(linkd.DependencyExpression.__slots__)
+            and callable(getattr(linkd_solver, "_parse_injectable_params", None))
+            and hasattr(linkd_solver, "CANNOT_INJECT")
+            and isinstance(getattr(linkd_conditions, "_Try", None), type)
+            and callable(getattr(linkd_utils, "_is_compose_class", None))
+            and isinstance(getattr(linkd_utils, "_DEPS_ATTR", None), str)
+        )
+    except Exception:
+        return False
+
+
+_USE_LINKD_INTERNALS: bool = _linkd_internals_available()
+if not _USE_LINKD_INTERNALS:
+    LOGGER.warning(
+        "the installed version of linkd (%s) is not supported by lightbulb's dependency injection optimisations - "
+        "containers will be created for every invocation and dependency validation is disabled",
+        getattr(linkd, "__version__", "unknown"),
+    )
+
+
+def requires_injection(func: Callable[..., t.Any], n_args: int) -> bool:
+    """
+    Determine whether calling the given function would require any of its parameters to be dependency injected.
+
+    Args:
+        func: The function to check. This should be the original function, not the dependency injection wrapper.
+        n_args: The number of positional arguments the function is always called with.
+
+    Returns:
+        :obj:`bool`: Whether the function has any parameters that would be injected. If the function's signature
+            cannot be inspected, this will be :obj:`True`.
+    """
+    try:
+        parameters = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return True
+
+    for i, parameter in enumerate(parameters):
+        if parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            continue
+        if parameter.kind is not inspect.Parameter.KEYWORD_ONLY and i < n_args:
+            continue
+        if parameter.annotation is inspect.Parameter.empty:
+            continue
+        if parameter.default is not inspect.Parameter.empty and parameter.default is not di.INJECTED:
+            continue
+        return True
+    return False
+
+
+def direct_callable(func: Callable[..., t.Any], n_args: int) -> Callable[..., Awaitable[t.Any]] | None:
+    """
+    Get the coroutine function that can be called in place of the given - possibly dependency injection
+    enabled - function without resolving any dependencies, and without needing a container.
+
+    Args:
+        func: The function, which may be wrapped by :obj:`~lightbulb.di.with_di`.
+        n_args: The number of positional arguments the function is always called with.
+
+    Returns:
+        The original coroutine function, or :obj:`None` if it has parameters that would be injected or is not a
+        coroutine function.
+    """
+    inner: Callable[..., t.Any] = getattr(func, "_func", func)
+    if not inspect.iscoroutinefunction(inner):
+        return None
+    if inner is not func and requires_injection(inner, n_args):
+        return None
+    return inner
+
+
+async def default_container(manager: linkd.DependencyInjectionManager) -> linkd.Container:
+    """
+    Get the default container for the given manager, creating it if it does not yet exist.
+
+    Args:
+        manager: The dependency injection manager to get the default container for.
+
+    Returns:
+        The default container.
+    """
+    if (default := manager.default_container) is not None:
+        return default
+
+    # The manager keeps the default container it creates when the context is entered, even once it is exited.
+    # The current container is cleared so that the default container is created without a parent.
+    token = linkd.DI_CONTAINER.set(None)
+    try:
+        with tracing.span("lightbulb.di_enter", context="DEFAULT"):
+            async with manager.enter_context(di.Contexts.DEFAULT) as default:
+                return default
+    finally:
+        linkd.DI_CONTAINER.reset(token)
+
+
+class LazyContainer:
+    """
+    Stand-in for the container of a dependency injection context which only creates the container the first time
+    it is used. Until then, values added to it are kept so that they can be added to the container once it is
+    created. Attributes that are not defined here are looked up on the created container.
+
+    Entering this as an async context manager makes it the current container, and exiting it closes the
+    created container, if any. As with :meth:`linkd.solver.DependencyInjectionManager.enter_context`, the
+    container is a child of the current container - or of the default container, which is created on entry if
+    it does not yet exist - and if the current container already belongs to the same context, it is reused
+    instead of creating a new one.
+
+    Args:
+        manager: The dependency injection manager to create the containers using.
+        context: The context that the container is for.
+        values: ``(type, value)`` pairs to add to the container once it is created.
+    """
+
+    __slots__ = ("_closed", "_container", "_manager", "_owned", "_parent", "_pending", "_tag", "_token")
+
+    def __init__(
+        self, manager: linkd.DependencyInjectionManager, context: linkd.Context, values: Sequence[tuple[t.Any, t.Any]]
+    ) -> None:
+        self._manager = manager
+        self._tag = context
+        self._parent: linkd.Container | None = None
+        self._closed = False
+        self._container: linkd.Container | None = None
+        self._owned = False
+        self._pending: list[tuple[t.Any, t.Any, t.Any]] = [(typ, value, None) for typ, value in values]
+        self._token: t.Any = None
+
+    def __repr__(self) -> str:
+        return f"LazyContainer(tag={self._tag!r}, created={self._container is not None})"
+
+    def __getattr__(self, item: str) -> t.Any:
+        return getattr(self._create(), item)
+
+    @property
+    def created(self) -> bool:
+        """Whether the container has been created."""
+        return self._container is not None
+
+    def _use(self, container: linkd.Container) -> linkd.Container:
+        for typ, value, teardown in self._pending:
+            container.add_value(typ, value, teardown=teardown)
+        self._pending.clear()
+
+        self._container = container
+        return container
+
+    def _create(self) -> linkd.Container:
+        if self._container is not None:
+            return self._container
+        if self._closed:
+            raise linkd.ContainerClosedException("the container is closed")
+
+        with tracing.span("lightbulb.di_enter", context=_CONTEXT_NAMES.get(self._tag, str(self._tag))):
+            container = linkd.Container(self._manager.registry_for(self._tag), parent=self._parent, tag=self._tag)
+            if (cls := linkd.global_context_registry.type_for(self._tag)) is not None:
+                container.add_value(cls, container)
+
+        self._owned = True
+        return self._use(container)
+
+    def __contains__(self, item: t.Any) -> bool:
+        return item in self._create()
+
+    async def __aenter__(self) -> LazyContainer:
+        current = linkd.DI_CONTAINER.get(None)
+
+        existing = current
+        while existing is not None and existing._tag != self._tag:
+            existing = existing._parent
+
+        if existing is not None:
+            self._parent = existing._parent
+            self._use(existing)
+        elif self._tag == di.Contexts.DEFAULT:
+            self._use(await default_container(self._manager))
+        else:
+            self._parent = current if current is not None else await default_container(self._manager)
+
+        # Only the tag and parent are read from the current container directly, anything else is looked up on the
+        # created container - this is a container as far as dependency injection is concerned
+        self._token = linkd.DI_CONTAINER.set(t.cast("linkd.Container", self))
+        return self
+
+    async def __aexit__(self, *_: t.Any) -> None:
+        linkd.DI_CONTAINER.reset(self._token)
+        await self.close()
+
+    async def close(self) -> None:
+        self._closed = True
+
+        container, self._container = self._container, None
+        if container is None:
+            for _, value, teardown in reversed(self._pending):
+                if teardown is not None:
+                    await utils.maybe_await(teardown(value))
+            self._pending.clear()
+            return
+
+        if self._owned:
+            await container.close()
+
+    def add_value(
+        self,
+        typ: type[linkd_utils.T],
+        value: linkd_utils.T,
+        *,
+        teardown: Callable[[linkd_utils.T], linkd_utils.MaybeAwaitable[None]] | None = None,
+    ) -> t_ex.Self:
+        if self._container is None and not self._closed:
+            self._pending.append((typ, value, teardown))
+            return self
+
+        self._create().add_value(typ, value, teardown=teardown)
+        return self
+
+    def add_factory(self, *args: t.Any, **kwargs: t.Any) -> t_ex.Self:
+        self._create().add_factory(*args, **kwargs)
+        return self
+
+    async def _get(self, dependency_id: str) -> tuple[t.Any, bool]:
+        return await self._create()._get(dependency_id)
+
+    async def get(self, type_: t.Any, /) -> t.Any:
+        return await self._create().get(type_)
+
+
+@contextlib.asynccontextmanager
+async def _entered_context(
+    manager: linkd.DependencyInjectionManager, context: linkd.Context, values: Sequence[tuple[t.Any, t.Any]]
+) -> AsyncGenerator[linkd.Container, None]:
+    async with contextlib.AsyncExitStack() as stack:
+        if context != di.Contexts.DEFAULT:
+            await stack.enter_async_context(manager.enter_context(di.Contexts.DEFAULT))
+        container = await stack.enter_async_context(manager.enter_context(context))
+
+        for typ, value in values:
+            container.add_value(typ, value)
+        yield container
+
+
+def lazy_context(
+    manager: linkd.DependencyInjectionManager, context: linkd.Context, *values: tuple[t.Any, t.Any]
+) -> t.AsyncContextManager[t.Any]:
+    """
+    Get an async context manager which makes a container for the given context available to the code within it,
+    without creating any containers until a dependency is first requested.
+
+    If the installed version of linkd does not provide the internals that :obj:`~LazyContainer` relies on, the
+    default container and the container for the context are entered as normal instead.
+
+    Args:
+        manager: The dependency injection manager to create the containers using.
+        context: The context to make available.
+        *values: ``(type, value)`` pairs to add to the container once it is created.
+
+    Returns:
+        The async context manager. If dependency injection is disabled, it does nothing.
+    """
+    if not linkd.DI_ENABLED:
+        return _NO_CONTEXT
+    if not _USE_LINKD_INTERNALS:
+        return _entered_context(manager, context, values)
+    return LazyContainer(manager, context, values)
+
+
+def provided_at_runtime(runtime: RuntimeDependencies, context: linkd.Context, *types: t.Any) -> None:
+    """
+    Declare that values for the given types are added to the containers for the given context while they are in
+    use, instead of being registered to the context's registry. Dependencies on these types will always be
+    considered satisfiable when validating dependencies.
+
+    Functions called in a context can also declare the types of the values they add to its containers by setting
+    a ``_provided_at_runtime`` attribute to a sequence of the types.
+
+    Args:
+        runtime: The runtime dependencies to add the types to.
+        context: The context that the values are added for.
+        *types: The types that the values are added as.
+
+    Returns:
+        :obj:`None`
+    """
+    runtime.setdefault(context, set()).update(linkd_utils.get_dependency_id(typ) for typ in types)
+
+
+def cache_resolution_plan(func: Callable[..., t.Any]) -> None:
+    """
+    Generate and cache the function used to resolve the dependencies of the given dependency injection enabled
+    function, if it has not been already.
+
+    Copies of the wrapper created when a method is bound to an instance are given the cached function, but do not
+    store the function they generate themselves - so invoke methods would otherwise generate it each time they are
+    called.
+
+    Args:
+        func: The function to cache the resolution plan for. Does nothing if this does not have dependency
+            injection enabled, or if the installed version of linkd does not support it.
+
+    Returns:
+        :obj:`None`
+    """
+    if _USE_LINKD_INTERNALS and isinstance(func, linkd.AutoInjecting) and func._dependency_func is None:
+        func._dependency_func = func._codegen_dependency_func()
+
+
+def _runtime_dependencies(context: linkd.Context, declared: Iterable[str]) -> set[str]:
+    # Containers always provide themselves, the default container also provides the manager
+    provided = {linkd_utils.get_dependency_id(linkd.Container), *declared}
+    if (cls := linkd.global_context_registry.type_for(context)) is not None:
+        provided.add(linkd_utils.get_dependency_id(cls))
+    if context == di.Contexts.DEFAULT:
+        provided.add(linkd_utils.get_dependency_id(di.DefaultContainer))
+        provided.add(linkd_utils.get_dependency_id(linkd.DependencyInjectionManager))
+    return provided
+
+
+class _DependencyGraphValidator:
+    __slots__ = ("_declared", "_manager", "_runtime")
+
+    def __init__(self, manager: linkd.DependencyInjectionManager, declared: RuntimeDependencies) -> None:
+        self._manager = manager
+        self._declared = declared
+        self._runtime: RuntimeDependencies = {}
+
+    def _provider(
+        self, chain: Sequence[linkd.Context], dependency_id: str
+    ) -> tuple[int, linkd_graph.DependencyData[t.Any] | None] | None:
+        for i, context in enumerate(chain):
+            if (runtime := self._runtime.get(context)) is None:
+                runtime = self._runtime[context] = _runtime_dependencies(context, self._declared.get(context, ()))
+            if dependency_id in runtime:
+                return i, None
+            if (data := self._manager.registry_for(context)._graph.nodes.get(dependency_id)) is not None:
+                return i, data
+        return None
+
+    def check_dependency(
+        self, chain: Sequence[linkd.Context], dependency_id: str, path: tuple[str, ...]
+    ) -> tuple[str, bool] | None:
+        if (found := self._provider(chain, dependency_id)) is None:
+            contexts = " or ".join(_CONTEXT_NAMES.get(context, str(context)) for context in chain)
+            return f"{dependency_id!r} is not provided for the {contexts} context", False
+
+        index, data = found
+        if data is None:
+            return None
+
+        if dependency_id in path:
+            cycle = " -> ".join((*path[path.index(dependency_id) :], dependency_id))
+            return f"circular dependency found - {cycle}", True
+
+        # Factory parameters are resolved from the container that the dependency is registered to
+        for expression in data.factory_params.values():
+            if (problem := self.check_expression(chain[index:], expression, (*path, dependency_id))) is not None:
+                return problem
+        return None
+
+    def check_expression(
+        self, chain: Sequence[linkd.Context], expression: t.Any, path: tuple[str, ...]
+    ) -> tuple[str, bool] | None:
+        if linkd_utils._is_compose_class(expression):
+            for sub_expression in getattr(expression, linkd_utils._DEPS_ATTR).values():
+                if (problem := self.check_expression(chain, sub_expression, path)) is not None:
+                    return problem
+            return None
+
+        problem: tuple[str, bool] | None = None
+        for condition in expression._order:
+            # 'Try' falls back if the dependency cannot be created, 'If' only if it is not known to the container
+            if isinstance(condition, linkd_conditions._Try):
+                if (problem := self.check_dependency(chain, condition.inner_id, path)) is None:
+                    return None
+            elif self._provider(chain, condition.inner_id) is not None:
+                return self.check_dependency(chain, condition.inner_id, path)
+            else:
+                problem = self.check_dependency(chain, condition.inner_id, path)
+
+        if not expression._required:
+            return None
+        if len(expression._order) == 1:
+            return problem
+        options = " | ".join(
+            f"{type(condition).__name__.lstrip('_')}[{condition.inner_id}]" for condition in expression._order
+        )
+        return f"no dependencies can satisfy the requested type - '{options}'", False
+
+    def check(self, dependent: Dependent) -> list[tuple[str, bool]]:
+        context, description, func, n_args = dependent
+        chain = (context,) if context == di.Contexts.DEFAULT else (context, di.Contexts.DEFAULT)
+
+        try:
+            positional, keyword_only = linkd_solver._parse_injectable_params(getattr(func, "_func", func))
+        except (TypeError, ValueError):
+            # The signature cannot be inspected - this will be reported when the function is called instead
+            return []
+        except Exception as e:
+            return [(f"{description}: failed to parse parameter annotations - {e!r}", False)]
+
+        parameters = [*positional[n_args:], *keyword_only.items()]
+        problems: list[tuple[str, bool]] = []
+        for name, expression in parameters:
+            if expression is linkd_solver.CANNOT_INJECT:
+                continue
+            if (problem := self.check_expression(chain, expression, ())) is not None:
+                problems.append((f"{description}, parameter {name!r}: {problem[0]}", problem[1]))
+        return problems
+
+
+def validate_dependencies(
+    manager: linkd.DependencyInjectionManager, dependents: Sequence[Dependent], runtime: RuntimeDependencies
+) -> None:
+    """
+    Check that the dependencies of each of the given functions can be provided by the registries of the context
+    that they are called in, including the dependencies of any factories needed to create them.
+
+    If the installed version of linkd does not provide the internals that this relies on, a warning is logged and
+    nothing is checked.
+
+    Args:
+        manager: The dependency injection manager whose registries provide the dependencies.
+        dependents: The functions to check.
+        runtime: The dependencies that are added to the containers for each context while they are in use. The
+            types declared by any of the functions are also included.
+
+    Returns:
+        :obj:`None`
+
+    Raises:
+        :obj:`~lightbulb.di.CircularDependencyException`: If any dependency depends on itself.
+        :obj:`~lightbulb.di.DependencyNotSatisfiableException`: If any dependency cannot be provided.
+    """
+    if not _USE_LINKD_INTERNALS:
+        LOGGER.warning("cannot validate dependencies - not supported by the installed version of linkd")
+        return
+
+    declared = {context: set(ids) for context, ids in runtime.items()}
+    for context, _, func, _ in dependents:
+        if provided := getattr(getattr(func, "_func", func), "_provided_at_runtime", ()):
+            provided_at_runtime(declared, context, *provided)
+
+    validator = _DependencyGraphValidator(manager, declared)
+
+    problems: list[tuple[str, bool]] = []
+    for dependent in dependents:
+        problems.extend(validator.check(dependent))
+
+    if not problems:
+        return
+
+    message = "unsatisfiable dependencies found:\n" + "\n".join(f"  - {problem}" for problem, _ in problems)
+    if any(circular for _, circular in problems):
+        raise di.CircularDependencyException(message)
+    raise di.DependencyNotSatisfiableException(message)
+
+
+def _warm_up_order(container: linkd.Container, dependency_ids: Iterable[str]) -> dict[str, list[str]]:
+    # Maps each singleton that needs creating to the singletons its factory requires, in topological order
+    edges: dict[str, list[str]] = {}
+    to_visit = list(dependency_ids)
+    while to_visit:
+        if (dependency_id := to_visit.pop()) in edges:
+            continue
+
+        if (data := container._graph.nodes.get(dependency_id)) is None:
+            raise di.DependencyNotSatisfiableException(
+                f"cannot warm up {dependency_id!r} - not registered for the DEFAULT context"
+            )
+        if data.lifetime is not linkd_graph.Lifetime.SINGLETON:
+            raise ValueError(f"cannot warm up {dependency_id!r} - only singleton dependencies can be warmed up")
+
+        requires: list[str] = []
+        for expression in data.factory_params.values():
+            # Only the first dependency known to the container would be used to satisfy the expression
+            for condition in expression._order:
+                if (sub_data := container._graph.nodes.get(condition.inner_id)) is None:
+                    continue
+                if sub_data.lifetime is linkd_graph.Lifetime.SINGLETON:
+                    requires.append(condition.inner_id)
+                    to_visit.append(condition.inner_id)
+                break
+        edges[dependency_id] = requires
+
+    ordered: dict[str, list[str]] = {}
+    remaining = dict(edges)
+    while remaining:
+        ready = [dependency_id for dependency_id, requires in remaining.items() if all(r in ordered for r in requires)]
+        if not ready:
+            cycle = ", ".join(repr(dependency_id) for dependency_id in remaining)
+            raise di.CircularDependencyException(f"cannot warm up dependencies - circular dependency found in {cycle}")
+
+        for dependency_id in ready:
+            ordered[dependency_id] = remaining.pop(dependency_id)
+    return ordered
+
+
+async def _warm_up_sequentially(container: linkd.Container, types: Iterable[t.Any]) -> dict[str, int]:
+    timings: dict[str, int] = {}
+
+    token = linkd.DI_CONTAINER.set(container)
+    try:
+        for typ in types:
+            before = time.perf_counter_ns()
+            await container.get(typ)
+            timings[linkd_utils.get_dependency_id(typ)] = time.perf_counter_ns() - before
+    finally:
+        linkd.DI_CONTAINER.reset(token)
+
+    return timings
+
+
+async def warm_up(manager: linkd.DependencyInjectionManager, types: Iterable[t.Any]) -> dict[str, int]:
+    """
+    Create the given singleton dependencies registered for the ``DEFAULT`` context, along with any singleton
+    dependencies their factories require. Dependencies are created concurrently - each is only created once all
+    of the dependencies it requires have been. Dependencies that have already been created are skipped.
+
+    Because each dependency finishes being created after the ones it requires, the default container will tear
+    them down in the reverse order when it is closed.
+
+    If the installed version of linkd does not provide the internals that this relies on, the dependencies are
+    instead requested from the default container one at a time, and the time taken for each includes the time
+    taken to create the dependencies it requires.
+
+    Args:
+        manager: The dependency injection manager whose default container to create the dependencies in.
+        types: The types of the dependencies to create.
+
+    Returns:
+        Mapping of dependency ID to the time taken to create the dependency, in nanoseconds. This does not
+        include the time spent waiting for the dependencies it requires.
+
+    Raises:
+        :obj:`ValueError`: If any of the dependencies are not singletons.
+        :obj:`~lightbulb.di.CircularDependencyException`: If any of the dependencies depend on themselves.
+        :obj:`~lightbulb.di.DependencyNotSatisfiableException`: If any of the dependencies are not registered, or
+            could not be created. Other dependencies that are being created concurrently are cancelled.
+    """
+    container = await default_container(manager)
+    if not _USE_LINKD_INTERNALS:
+        return await _warm_up_sequentially(container, types)
+
+    order = _warm_up_order(container, (linkd_utils.get_dependency_id(typ) for typ in types))
+
+    timings: dict[str, int] = {}
+    created: dict[str, asyncio.Task[None]] = {}
+
+    async def _create(dependency_id: str, requires: Sequence[str]) -> None:
+        if requires:
+            await asyncio.gather(*(created[r] for r in requires))
+        if dependency_id in container._instances:
+            return
+
+        before = time.perf_counter_ns()
+        await container._get(dependency_id)
+        timings[dependency_id] = time.perf_counter_ns() - before
+
+    # The tasks copy the current context, so factories can use the default container - for example to offload work
+    token = linkd.DI_CONTAINER.set(container)
+    try:
+        for dependency_id, requires in order.items():
+            created[dependency_id] = asyncio.create_task(_create(dependency_id, requires))
+    finally:
+        linkd.DI_CONTAINER.reset(token)
+
+    try:
+        await asyncio.gather(*created.values())
+    except BaseException:
+        for task in created.values():
+            task.cancel()
+        await asyncio.gather(*created.values(), return_exceptions=True)
+        raise
+
+    return timings
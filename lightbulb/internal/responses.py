@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__ = ["ResponseEvent", "response_delay"]
+
+import asyncio
+import time
+
+
+class ResponseEvent(asyncio.Event):
+    """
+    Event used to signal that the initial response to an interaction has been sent, which also
+    records the time (from :func:`time.monotonic`) that it was first set at.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.set_at: float | None = None
+
+    def set(self) -> None:
+        if self.set_at is None:
+            self.set_at = time.monotonic()
+        super().set()
+
+
+def response_delay(event: asyncio.Event, started: float) -> float | None:
+    """
+    Get the number of seconds between the given start time and the initial response to an interaction being sent.
+
+    Args:
+        event: The event that is set when the initial response is sent.
+        started: The start time, from :func:`time.monotonic`.
+
+    Returns:
+        The number of seconds until the initial response was sent, or :obj:`None` if it has not been sent, or
+        if the event does not record when it was set.
+    """
+    if isinstance(event, ResponseEvent) and event.set_at is not None:
+        return max(event.set_at - started, 0.0)
+    return None
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from __future__ import annotations
+
+__all__ = ["CommandRoute", "CommandRoutes", "build_command_routes", "resolve_command_route"]
+
+import dataclasses
+import typing as t
+
+import hikari
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from lightbulb.commands import commands
+    from lightbulb.internal import utils
+
+    OptionT = t.TypeVar("OptionT", hikari.CommandInteractionOption, hikari.AutocompleteInteractionOption)
+
+_SUBCOMMAND_OPTION_TYPES: t.Final[frozenset[hikari.OptionType]] = frozenset(
+    (hikari.OptionType.SUB_COMMAND, hikari.OptionType.SUB_COMMAND_GROUP)
+)
+
+
+@dataclasses.dataclass(slots=True)
+class CommandRoute:
+    """
+    A single node of the client's command routing trie. Top-level nodes represent a command or group name,
+    and each child represents a subcommand or subgroup name.
+    """
+
+    command: type[commands.CommandBase] | None = None
+    """The command invoked when routing terminates at this node, or :obj:`None` if this node is a group."""
+    children: dict[str, CommandRoute] = dataclasses.field(default_factory=dict)  # type: ignore[reportUnknownVariableType]
+    """Mapping of subcommand or subgroup name to the route for it."""
+
+
+CommandRoutes: t.TypeAlias = "dict[hikari.Snowflakeish, dict[hikari.CommandType, dict[str, CommandRoute]]]"
+"""Mapping of guild ID to command type to top-level command name to the route for that command."""
+
+
+def build_command_routes(
+    mapping: Mapping[hikari.Snowflakeish, Mapping[tuple[str, ...], utils.CommandCollection]],
+) -> CommandRoutes:
+    """
+    Compile the given command invocation mapping into a routing trie which can be used to resolve the command
+    for an interaction without any intermediate allocations.
+
+    Args:
+        mapping: The command invocation mapping to compile. Usually from
+            :obj:`~lightbulb.client.Client.invokable_commands`.
+
+    Returns:
+        The compiled routes.
+    """
+    routes: CommandRoutes = {}
+
+    for guild, paths in mapping.items():
+        guild_routes: dict[hikari.CommandType, dict[str, CommandRoute]] = {}
+
+        for path, collection in paths.items():
+            for command_type, command in (
+                (hikari.CommandType.SLASH, collection.slash),
+                (hikari.CommandType.USER, collection.user),
+                (hikari.CommandType.MESSAGE, collection.message),
+            ):
+                if command is None:
+                    continue
+
+                type_routes = guild_routes.setdefault(command_type, {})
+                route = type_routes.setdefault(path[0], CommandRoute())
+                for name in path[1:]:
+                    route = route.children.setdefault(name, CommandRoute())
+                route.command = command
+
+        if guild_routes:
+            routes[guild] = guild_routes
+
+    return routes
+
+
+def resolve_command_route(
+    routes: CommandRoutes,
+    guild: hikari.Snowflakeish,
+    command_type: hikari.CommandType | int,
+    name: str,
+    options: Sequence[OptionT] | None,
+) -> tuple[Sequence[OptionT], type[commands.CommandBase]] | None:
+    """
+    Resolve the command, and the options that should be used to invoke it, from the given routes.
+
+    Args:
+        routes: The compiled routes to resolve the command from.
+        guild: The ID of the guild the command is registered in, or ``0`` for global commands.
+        command_type: The type of the command being invoked.
+        name: The name of the top-level command being invoked.
+        options: The options supplied with the interaction.
+
+    Returns:
+        The options for the resolved command, and the command class; or :obj:`None` if no command could be
+        resolved.
+    """
+    if (guild_routes := routes.get(guild)) is None or (type_routes := guild_routes.get(command_type)) is None:  # type: ignore[reportArgumentType]
+        return None
+
+    if (route := type_routes.get(name)) is None:
+        return None
+
+    options = options or ()
+    while route.children:
+        # Discord always sends the subcommand or subgroup as the only option if one was used
+        if not options or (subcommand := options[0]).type not in _SUBCOMMAND_OPTION_TYPES:
+            return None
+
+        if (route := route.children.get(subcommand.name)) is None:
+            return None
+
+        options = subcommand.options or ()
+
+    if route.command is None:
+        return None
+
+    return options, route.command
@@ -20,12 +20,14 @@
 # SOFTWARE.
 __all__ = [
     "CommandOrGroup",
+    "ComponentHandler",
     "DeferredRegistrationCallback",
     "ErrorHandler",
     "MaybeAwaitable",
 ]
 
 import typing as t
+from collections.abc import Awaitable
 from collections.abc import Callable
 from collections.abc import Iterable
 
@@ -44,6 +46,7 @@ CommandOrGroup: t.TypeAlias = t.Union["groups.Group", type["commands.CommandBase
 ErrorHandler: t.TypeAlias = t.Callable[
     "t.Concatenate[exceptions.ExecutionPipelineFailedException, ...]", MaybeAwaitable[bool]
 ]
+ComponentHandler: t.TypeAlias = Callable[..., Awaitable[None]]
 DeferredRegistrationCallback: t.TypeAlias = Callable[
     [CommandOrGroup], MaybeAwaitable[tuple[Iterable[hikari.Snowflakeish], bool] | None]
 ]
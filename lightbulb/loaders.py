@@ -33,6 +33,7 @@ import linkd
 from lightbulb import di
 from lightbulb import tasks
 from lightbulb.commands import groups
+from lightbulb.internal import di as i_di
 
 if t.TYPE_CHECKING:
     from collections.abc import Awaitable
@@ -44,6 +45,7 @@ if t.TYPE_CHECKING:
 
 CommandOrGroupT = t.TypeVar("CommandOrGroupT", bound="types.CommandOrGroup")
 ErrorHandlerT = t.TypeVar("ErrorHandlerT", bound="types.ErrorHandler")
+ComponentHandlerT = t.TypeVar("ComponentHandlerT", bound="types.ComponentHandler")
 EventT = t.TypeVar("EventT", bound=hikari.Event)
 
 LOGGER = logging.getLogger(__name__)
@@ -133,17 +135,31 @@ class _ListenerLoadable(Loadable):
             LOGGER.warning("skipping loading listener - bot is not event manager aware")
             return
 
+        callback: Callable[..., Awaitable[t.Any]] = self._callback
+        if (detector := client.stall_detector) is not None:
+            event_names = ", ".join(event.__name__ for event in self._event_types)
+
+            @functools.wraps(self._callback)
+            async def _monitored(*args: t.Any, **kwargs: t.Any) -> t.Any:
+                return await detector.monitor(self._callback(*args, **kwargs), "listener", event_names)
+
+            callback = _monitored
+
         @functools.wraps(self._callback)
         async def _wrapped(*args: t.Any, **kwargs: t.Any) -> t.Any:
-            async with client.di.enter_context(di.Contexts.DEFAULT), client.di.enter_context(di.Contexts.LISTENER):
-                return await self._callback(*args, **kwargs)
+            async with i_di.lazy_context(client.di, di.Contexts.LISTENER):
+                return await callback(*args, **kwargs)
 
-        self._wrapped_callback = _wrapped if linkd.DI_ENABLED else None
+        if linkd.DI_ENABLED:
+            self._wrapped_callback = _wrapped
+        else:
+            self._wrapped_callback = callback if callback is not self._callback else None
 
         for event in self._event_types:
             if (self._wrapped_callback or self._callback) in em.get_listeners(event):
                 continue
             em.subscribe(event, self._wrapped_callback or self._callback)  # type: ignore[reportArgumentType]
+        client._listeners.add(self._callback)
 
     async def unload(self, client: client_.Client) -> None:
         em = getattr(getattr(client, "_app", None), "event_manager", None)
@@ -154,19 +170,23 @@ class _ListenerLoadable(Loadable):
             if (self._wrapped_callback or self._callback) not in em.get_listeners(event):
                 continue
             em.unsubscribe(event, self._wrapped_callback or self._callback)  # type: ignore[reportArgumentType]
+        client._listeners.discard(self._callback)
 
 
 class _ErrorHandlerLoadable(Loadable):
-    __slots__ = ("_callback", "_priority")
+    __slots__ = ("_callback", "_on", "_priority")
 
-    def __init__(self, callback: types.ErrorHandler, priority: int) -> None:
+    def __init__(
+        self, callback: types.ErrorHandler, priority: int, on: type[Exception] | Sequence[type[Exception]] | None
+    ) -> None:
         self._callback = callback
         self._priority = priority
+        self._on = on
 
     async def load(self, client: client_.Client) -> None:
         if self._callback in client._error_handlers.get(self._priority, []):
             return
-        client.error_handler(self._callback, priority=self._priority)
+        client.error_handler(self._callback, priority=self._priority, on=self._on)
 
     async def unload(self, client: client_.Client) -> None:
         if self._callback not in client._error_handlers.get(self._priority, []):
@@ -174,6 +194,24 @@ class _ErrorHandlerLoadable(Loadable):
         client.remove_error_handler(self._callback)
 
 
+class _ComponentHandlerLoadable(Loadable):
+    __slots__ = ("_callback", "_pattern")
+
+    def __init__(self, callback: types.ComponentHandler, pattern: str) -> None:
+        self._callback = callback
+        self._pattern = pattern
+
+    async def load(self, client: client_.Client) -> None:
+        if client._component_router.get(self._pattern) is self._callback:
+            return
+        client._component_router.add(self._pattern, self._callback)
+
+    async def unload(self, client: client_.Client) -> None:
+        if client._component_router.get(self._pattern) is not self._callback:
+            return
+        client.remove_component_handler(self._pattern)
+
+
 class _TaskLoadable(Loadable):
     __slots__ = ("_task",)
 
@@ -366,13 +404,25 @@ class Loader:
         return _inner
 
     @t.overload
-    def error_handler(self, *, priority: int = 0) -> Callable[[ErrorHandlerT], ErrorHandlerT]: ...
+    def error_handler(
+        self, *, priority: int = 0, on: type[Exception] | Sequence[type[Exception]] | None = None
+    ) -> Callable[[ErrorHandlerT], ErrorHandlerT]: ...
 
     @t.overload
-    def error_handler(self, func: ErrorHandlerT, *, priority: int = 0) -> ErrorHandlerT: ...
+    def error_handler(
+        self,
+        func: ErrorHandlerT,
+        *,
+        priority: int = 0,
+        on: type[Exception] | Sequence[type[Exception]] | None = None,
+    ) -> ErrorHandlerT: ...
 
     def error_handler(
-        self, func: ErrorHandlerT | None = None, *, priority: int = 0
+        self,
+        func: ErrorHandlerT | None = None,
+        *,
+        priority: int = 0,
+        on: type[Exception] | Sequence[type[Exception]] | None = None,
     ) -> ErrorHandlerT | Callable[[ErrorHandlerT], ErrorHandlerT]:
         """
         Register an error handler function to call when an :obj:`~lightbulb.commands.execution.ExecutionPipeline` fails.
@@ -386,14 +436,36 @@ class Loader:
             func: The function to register as a command error handler.
             priority: The priority that this handler should be registered at. Higher priority handlers
                 will be executed first.
+            on: The exception type, or sequence of exception types, that this handler handles. If specified, the
+                handler will only be called when one of the exception's ``causes`` is an instance of one of the
+                given types. If unspecified, the handler will be called for all failures.
         """
         if func is not None:
             wrapped = di.with_di(func)
-            self.add(_ErrorHandlerLoadable(wrapped, priority))  # type: ignore[reportArgumentType]
+            self.add(_ErrorHandlerLoadable(wrapped, priority, on))  # type: ignore[reportArgumentType]
             return t.cast("ErrorHandlerT", wrapped)
 
         def _inner(func_: ErrorHandlerT) -> ErrorHandlerT:
-            return self.error_handler(func_, priority=priority)
+            return self.error_handler(func_, priority=priority, on=on)
+
+        return _inner
+
+    def component_handler(self, pattern: str) -> Callable[[ComponentHandlerT], ComponentHandlerT]:
+        """
+        Second order decorator to register a persistent handler for component interactions with a custom ID
+        matching the given pattern with this loader. Also enables dependency injection for the handler function.
+
+        Args:
+            pattern: The custom ID pattern to register the handler for.
+
+        See Also:
+            :meth:`~lightbulb.client.Client.component_handler`
+        """
+
+        def _inner(func: ComponentHandlerT) -> ComponentHandlerT:
+            wrapped = di.with_di(func)
+            self.add(_ComponentHandlerLoadable(wrapped, pattern))  # type: ignore[reportArgumentType]
+            return t.cast("ComponentHandlerT", wrapped)
 
         return _inner
 
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Timing instrumentation for command execution. When a :obj:`~MetricsSink` is passed to the client, the execution
+pipeline records how long option resolution, each hook and the command's invoke method take to run, and the client
+records how long each dependency declared using :meth:`~lightbulb.client.Client.warm_up` takes to create. When no
+sink is set, no timings are taken.
+
+.. dropdown:: Example
+
+    .. code-block:: python
+
+        import lightbulb
+
+        sink = lightbulb.metrics.HistogramSink()
+        client = lightbulb.client_from_app(bot, metrics_sink=sink)
+
+        # Later - for example in a HTTP handler for your metrics endpoint
+        text = lightbulb.metrics.render_openmetrics(sink)
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "DEPENDENCY_WARMUP_DURATION",
+    "HOOK_DURATION",
+    "INVOKE_DURATION",
+    "OPTION_RESOLUTION_DURATION",
+    "Histogram",
+    "HistogramSink",
+    "MetricsSink",
+    "render_openmetrics",
+]
+
+import bisect
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+OPTION_RESOLUTION_DURATION: t.Final[str] = "lightbulb_option_resolution_duration_seconds"
+"""
+Name of the metric recording the time taken to resolve a command's options. This does not include the
+converters of lazy options, which are only called when the option is accessed during invocation.
+"""
+HOOK_DURATION: t.Final[str] = "lightbulb_hook_duration_seconds"
+"""Name of the metric recording the time taken to run each execution hook."""
+INVOKE_DURATION: t.Final[str] = "lightbulb_invoke_duration_seconds"
+"""Name of the metric recording the time taken to run a command's invoke method."""
+DEPENDENCY_WARMUP_DURATION: t.Final[str] = "lightbulb_dependency_warmup_duration_seconds"
+"""Name of the metric recording the time taken to create each dependency warmed up when the client is started."""
+
+DEFAULT_BUCKETS: t.Final[Sequence[float]] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+"""The default histogram bucket upper bounds, in seconds."""
+
+
+class MetricsSink(t.Protocol):
+    """Protocol for objects that timings recorded during command execution can be sent to."""
+
+    def record(self, name: str, duration_ns: int, labels: Mapping[str, str]) -> None:
+        """
+        Record a single timing. This is called directly from the execution pipeline, so should not block.
+
+        Args:
+            name: The name of the metric - one of :obj:`~OPTION_RESOLUTION_DURATION`, :obj:`~HOOK_DURATION`
+                or :obj:`~INVOKE_DURATION`.
+            duration_ns: The measured duration, in nanoseconds.
+            labels: The labels for the timing. All timings have a ``command`` label containing the command's
+                qualified name. Hook timings also have ``step`` and ``hook`` labels.
+
+        Returns:
+            :obj:`None`
+        """
+        ...
+
+
+class Histogram:
+    """
+    Class representing a histogram of durations, using fixed bucket upper bounds.
+
+    Args:
+        buckets: The bucket upper bounds, in seconds. An implicit ``+Inf`` bucket is always included.
+    """
+
+    __slots__ = ("_bounds_ns", "_counts", "buckets", "count", "sum_ns")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets: Sequence[float] = tuple(sorted(buckets))
+        """The bucket upper bounds, in seconds."""
+        self.count: int = 0
+        """The number of observed durations."""
+        self.sum_ns: int = 0
+        """The sum of all observed durations, in nanoseconds."""
+
+        self._bounds_ns = [round(bucket * 1e9) for bucket in self.buckets]
+        self._counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, duration_ns: int) -> None:
+        """
+        Add a duration to the histogram.
+
+        Args:
+            duration_ns: The duration to add, in nanoseconds.
+
+        Returns:
+            :obj:`None`
+        """
+        self._counts[bisect.bisect_left(self._bounds_ns, duration_ns)] += 1
+        self.count += 1
+        self.sum_ns += duration_ns
+
+    def cumulative_counts(self) -> Sequence[int]:
+        """
+        Get the cumulative number of observations for each bucket, with the last element being the count
+        for the ``+Inf`` bucket.
+
+        Returns:
+            :obj:`~typing.Sequence` [ :obj:`int` ]: The cumulative bucket counts.
+        """
+        counts: list[int] = []
+        total = 0
+        for count in self._counts:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class HistogramSink:
+    """
+    Metrics sink that aggregates all recorded timings in-process, keeping one :obj:`~Histogram` for each
+    metric name and set of labels.
+
+    Args:
+        buckets: The bucket upper bounds to use for created histograms, in seconds.
+    """
+
+    __slots__ = ("_buckets", "_histograms")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._histograms: dict[str, dict[tuple[tuple[str, str], ...], Histogram]] = {}
+
+    @property
+    def histograms(self) -> Mapping[str, Mapping[tuple[tuple[str, str], ...], Histogram]]:
+        """Mapping of metric name to mapping of sorted label pairs to the histogram for those labels."""
+        return self._histograms
+
+    def get(self, name: str, **labels: str) -> Histogram | None:
+        """
+        Get the histogram for the given metric name and labels.
+
+        Args:
+            name: The name of the metric.
+            **labels: The labels of the histogram.
+
+        Returns:
+            The histogram, or :obj:`None` if no timings have been recorded for the name and labels.
+        """
+        return self._histograms.get(name, {}).get(tuple(sorted(labels.items())))
+
+    def record(self, name: str, duration_ns: int, labels: Mapping[str, str]) -> None:
+        by_labels = self._histograms.setdefault(name, {})
+
+        key = tuple(sorted(labels.items()))
+        if (histogram := by_labels.get(key)) is None:
+            histogram = by_labels[key] = Histogram(self._buckets)
+        histogram.observe(duration_ns)
+
+    def clear(self) -> None:
+        """
+        Remove all recorded timings.
+
+        Returns:
+            :obj:`None`
+        """
+        self._histograms.clear()
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Sequence[tuple[str, str]]) -> str:
+    return ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+
+
+def render_openmetrics(sink: HistogramSink) -> str:
+    """
+    Render the histograms held by the given sink using the OpenMetrics text exposition format. This format is
+    also accepted by Prometheus.
+
+    Args:
+        sink: The sink to render the histograms for.
+
+    Returns:
+        :obj:`str`: The rendered metrics, ending with the ``# EOF`` marker.
+    """
+    lines: list[str] = []
+    for name, by_labels in sorted(sink.histograms.items()):
+        lines.append(f"# TYPE {name} histogram")
+        lines.append(f"# UNIT {name} seconds")
+
+        for labels, histogram in sorted(by_labels.items()):
+            prefix = _format_labels(labels)
+            prefix = f"{prefix}," if prefix else ""
+
+            cumulative = histogram.cumulative_counts()
+            for bound, count in zip([*map(repr, map(float, histogram.buckets)), "+Inf"], cumulative):
+                lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {count}')
+
+            formatted = _format_labels(labels)
+            suffix = f"{{{formatted}}}" if formatted else ""
+            lines.append(f"{name}_count{suffix} {histogram.count}")
+            lines.append(f"{name}_sum{suffix} {histogram.sum_ns / 1e9!r}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Running blocking or CPU-bound work away from the event loop. When an :obj:`~Offloader` is passed to the client, it
+owns a process pool and a thread pool which are created when the client is started and shut down when it is stopped.
+The offloader is registered as a dependency, so it can be injected into any dependency-enabled function.
+
+.. dropdown:: Example
+
+    .. code-block:: python
+
+        import lightbulb
+
+        client = lightbulb.client_from_app(bot, offloader=lightbulb.offload.Offloader(max_processes=4))
+
+        # Must be defined at the top level of a module so that it can be sent to a worker process
+        @lightbulb.offload.offloaded
+        def render_chart(data: list[int]) -> bytes:
+            ...
+
+        class Chart(lightbulb.SlashCommand, name="chart", description="..."):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                image = await render_chart([1, 2, 3])
+                await ctx.respond(attachment=hikari.Bytes(image, "chart.png"))
+"""
+
+from __future__ import annotations
+
+__all__ = ["OffloadedFunction", "Offloader", "PoolKind", "PoolStats", "offloaded"]
+
+import asyncio
+import concurrent.futures
+import contextvars
+import dataclasses
+import functools
+import importlib
+import logging
+import os
+import typing as t
+
+import linkd
+
+if t.TYPE_CHECKING:
+    import multiprocessing.context
+    from collections.abc import Callable
+
+P = t.ParamSpec("P")
+R = t.TypeVar("R")
+
+PoolKind: t.TypeAlias = t.Literal["process", "thread"]
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class PoolStats:
+    """Dataclass representing a snapshot of the state of one of an offloader's pools."""
+
+    max_workers: int
+    """The maximum number of workers in the pool."""
+    in_flight: int
+    """The number of submitted calls that have not yet completed."""
+    queued: int
+    """The number of submitted calls waiting for a worker to become available."""
+    completed: int
+    """The number of calls that have completed, including those that raised an exception."""
+
+
+def _call_by_reference(module: str, qualname: str, args: tuple[t.Any, ...], kwargs: dict[str, t.Any]) -> t.Any:
+    # Run within the worker process - the decorated function cannot be pickled directly because
+    # the module attribute refers to the OffloadedFunction wrapping it instead of the function itself
+    obj: t.Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+
+    if isinstance(obj, OffloadedFunction):
+        obj = obj.func
+    return obj(*args, **kwargs)
+
+
+class Offloader:
+    """
+    Class managing the pools that blocking or CPU-bound work can be offloaded to. Both pools are created when
+    :meth:`~Offloader.start` is called, and shut down when :meth:`~Offloader.close` is called - the client
+    does both of these automatically when it is started and stopped.
+
+    Args:
+        max_processes: The maximum number of worker processes. Defaults to the number of CPUs.
+        max_threads: The maximum number of worker threads. Defaults to the same as
+            :obj:`~concurrent.futures.ThreadPoolExecutor`.
+        mp_context: The multiprocessing context to use to start worker processes. Defaults to
+            the platform default.
+
+    Note:
+        Functions run in the process pool, along with their arguments and return values, must be picklable. This
+        means they must be defined at the top level of a module.
+    """
+
+    __slots__ = ("_completed", "_executors", "_in_flight", "max_processes", "max_threads", "mp_context")
+
+    def __init__(
+        self,
+        *,
+        max_processes: int | None = None,
+        max_threads: int | None = None,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ) -> None:
+        self.max_processes: int = max_processes or os.cpu_count() or 1
+        """The maximum number of worker processes."""
+        self.max_threads: int = max_threads or min(32, (os.cpu_count() or 1) + 4)
+        """The maximum number of worker threads."""
+        self.mp_context: multiprocessing.context.BaseContext | None = mp_context
+        """The multiprocessing context used to start worker processes."""
+
+        self._executors: dict[PoolKind, concurrent.futures.Executor] = {}
+        self._in_flight: dict[PoolKind, int] = {"process": 0, "thread": 0}
+        self._completed: dict[PoolKind, int] = {"process": 0, "thread": 0}
+
+    @property
+    def started(self) -> bool:
+        """Whether the offloader has been started and not yet closed."""
+        return bool(self._executors)
+
+    def start(self) -> None:
+        """
+        Create the pools. Worker processes and threads are started when work is first submitted.
+
+        Returns:
+            :obj:`None`
+
+        Raises:
+            :obj:`RuntimeError`: If the offloader has already been started.
+        """
+        if self._executors:
+            raise RuntimeError("cannot start already-started offloader")
+
+        self._executors["process"] = concurrent.futures.ProcessPoolExecutor(
+            self.max_processes, mp_context=self.mp_context
+        )
+        self._executors["thread"] = concurrent.futures.ThreadPoolExecutor(
+            self.max_threads, thread_name_prefix="lightbulb-offload"
+        )
+
+    async def close(self) -> None:
+        """
+        Shut down the pools, waiting for running work to complete. Work that has been submitted but
+        not yet started is cancelled.
+
+        Returns:
+            :obj:`None`
+        """
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            # Shutting down waits for the workers to exit - do it in a separate thread to avoid blocking the loop
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    def stats(self, kind: PoolKind) -> PoolStats:
+        """
+        Get a snapshot of the state of one of the pools.
+
+        Args:
+            kind: The pool to get the state of.
+
+        Returns:
+            :obj:`~PoolStats`: The state of the pool.
+        """
+        max_workers = self.max_processes if kind == "process" else self.max_threads
+        in_flight = self._in_flight[kind]
+        return PoolStats(max_workers, in_flight, max(in_flight - max_workers, 0), self._completed[kind])
+
+    async def _run(
+        self,
+        kind: PoolKind,
+        func: Callable[..., R],
+        args: tuple[t.Any, ...],
+        kwargs: dict[str, t.Any],
+        *,
+        by_reference: bool = False,
+    ) -> R:
+        if (executor := self._executors.get(kind)) is None:
+            raise RuntimeError("cannot offload work - the offloader has not been started")
+
+        if kind == "process":
+            if by_reference:
+                call = functools.partial(_call_by_reference, func.__module__, func.__qualname__, args, kwargs)
+            else:
+                call = functools.partial(func, *args, **kwargs)
+        else:
+            # Run within a copy of the current context so that context variables - such as the
+            # current trace - are available within the thread
+            call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+
+        self._in_flight[kind] += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, call)
+        finally:
+            self._in_flight[kind] -= 1
+            self._completed[kind] += 1
+
+    async def run_in_process(self, func: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> R:
+        """
+        Run the given function in the process pool, and wait for it to complete.
+
+        Args:
+            func: The function to run. Must be picklable.
+            *args: The positional arguments to call the function with.
+            **kwargs: The keyword arguments to call the function with.
+
+        Returns:
+            The return value of the function.
+
+        Raises:
+            :obj:`RuntimeError`: If the offloader has not been started.
+        """
+        return await self._run("process", func, args, kwargs)
+
+    async def run_in_thread(self, func: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> R:
+        """
+        Run the given function in the thread pool, and wait for it to complete.
+
+        Args:
+            func: The function to run.
+            *args: The positional arguments to call the function with.
+            **kwargs: The keyword arguments to call the function with.
+
+        Returns:
+            The return value of the function.
+
+        Raises:
+            :obj:`RuntimeError`: If the offloader has not been started.
+        """
+        return await self._run("thread", func, args, kwargs)
+
+
+class OffloadedFunction(t.Generic[P, R]):
+    """
+    Class representing a function that will be run using the current client's :obj:`~Offloader` when called.
+    Calling it returns an awaitable which resolves to the function's return value. You should generally
+    not instantiate this class manually - use :obj:`~offloaded` instead.
+
+    Args:
+        func: The function to run.
+        kind: The pool to run the function in.
+    """
+
+    def __init__(self, func: Callable[P, R], kind: PoolKind) -> None:
+        self.func: Callable[P, R] = func
+        """The function that will be run."""
+        self.kind: PoolKind = kind
+        """The pool that the function will be run in."""
+        functools.update_wrapper(self, func)
+
+    async def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        container: linkd.Container | None = linkd.DI_CONTAINER.get(None)
+        if container is None:
+            raise RuntimeError("cannot offload work - no dependency injection context is active")
+
+        try:
+            offloader: Offloader = await container.get(Offloader)
+        except linkd.DependencyNotSatisfiableException:
+            raise RuntimeError("cannot offload work - the client does not have an offloader") from None
+
+        return await offloader._run(self.kind, self.func, args, kwargs, by_reference=True)
+
+
+@t.overload
+def offloaded(func: Callable[P, R], /) -> OffloadedFunction[P, R]: ...
+@t.overload
+def offloaded(*, kind: PoolKind = "process") -> Callable[[Callable[P, R]], OffloadedFunction[P, R]]: ...
+def offloaded(
+    func: Callable[P, R] | None = None, /, *, kind: PoolKind = "process"
+) -> OffloadedFunction[P, R] | Callable[[Callable[P, R]], OffloadedFunction[P, R]]:
+    """
+    Second order decorator to mark a synchronous function to be run using the current client's :obj:`~Offloader`.
+    The decorated function can then be awaited from any function that is run within a dependency injection context -
+    such as command invocations, hooks, and component or modal handlers. The result is returned to the event loop,
+    so can be used to respond to the interaction as normal.
+
+    Args:
+        func: The function to decorate.
+        kind: The pool to run the function in. Use ``"thread"`` for blocking IO, and ``"process"`` for CPU-bound
+            work. Defaults to ``"process"``.
+
+    Returns:
+        The decorated function.
+
+    Raises:
+        :obj:`RuntimeError`: When the decorated function is called, if the client does not have an offloader, or if
+            there is no active dependency injection context.
+
+    Note:
+        Functions run in the process pool **must** be defined at the top level of a module, and their arguments and
+        return values must be picklable.
+
+    Example:
+
+        .. code-block:: python
+
+            @lightbulb.offload.offloaded(kind="thread")
+            def read_file(path: str) -> str:
+                with open(path) as fp:
+                    return fp.read()
+    """
+
+    def inner(func_: Callable[P, R]) -> OffloadedFunction[P, R]:
+        return OffloadedFunction(func_, kind)
+
+    if func is not None:
+        return inner(func)
+    return inner
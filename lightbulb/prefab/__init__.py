@@ -20,7 +20,9 @@
 # SOFTWARE.
 """Subpackage providing common hooks and utilities you can use in your own bot."""
 
+from lightbulb.prefab.caching import *
 from lightbulb.prefab.checks import *
+from lightbulb.prefab.coalescing import *
 from lightbulb.prefab.concurrency import *
 from lightbulb.prefab.cooldowns import *
 
@@ -32,11 +34,14 @@ __all__ = [
     "MissingRequiredRoles",
     "NotOwner",
     "OnCooldown",
+    "ResponseCache",
     "bot_has_permissions",
+    "cached_response",
     "fixed_window",
     "has_permissions",
     "has_roles",
     "max_concurrency",
     "owner_only",
+    "single_flight",
     "sliding_window",
 ]
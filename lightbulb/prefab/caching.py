@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__all__ = ["ResponseCache", "cached_response"]
+
+import collections
+import time
+import typing as t
+from collections.abc import Hashable
+from collections.abc import Iterator
+from collections.abc import Sequence
+
+import hikari
+
+from lightbulb import context
+from lightbulb import utils
+from lightbulb.commands import execution
+from lightbulb.prefab.cooldowns import _PROVIDED_BUCKETS
+from lightbulb.prefab.cooldowns import Bucket
+from lightbulb.prefab.cooldowns import BucketCallable
+
+
+async def _response_key(ctx: context.Context, bucket_callable: BucketCallable) -> tuple[Hashable, ...]:
+    return (
+        ctx.command_data.qualified_name,
+        await utils.maybe_await(bucket_callable(ctx)),
+        *sorted((option.name, option.value) for option in ctx.options),
+    )
+
+
+def _resources(response: dict[str, t.Any]) -> Iterator[object]:
+    for name in ("attachment", "attachments", "embed", "embeds"):
+        value: t.Any = response[name]
+        if value is hikari.UNDEFINED or value is None:
+            continue
+
+        items = t.cast("Sequence[t.Any]", value) if name.endswith("s") else (value,)
+        for item in items:
+            if not isinstance(item, hikari.Embed):
+                yield item
+                continue
+
+            for media in (item.image, item.thumbnail):
+                if media is not None:
+                    yield media.resource
+            for owner in (item.footer, item.author):
+                if owner is not None and owner.icon is not None:
+                    yield owner.icon.resource
+
+
+def _replayable(responses: Sequence[dict[str, t.Any]]) -> bool:
+    # Files being uploaded may only be readable once - for example streams or open files - so responses containing
+    # them cannot be sent again. Existing attachments and URLs can be reused
+    return all(
+        isinstance(resource, (hikari.Attachment, hikari.URL))
+        for response in responses
+        for resource in _resources(response)
+    )
+
+
+class ResponseCache:
+    """
+    Cache for the responses created by commands using the :obj:`~cached_response` hooks. Responses are keyed by
+    the command's qualified name, the value of the bucket that the hooks were created with, and the values of the
+    options the command was invoked with - in that order.
+
+    Args:
+        max_size: The maximum number of responses to cache. When exceeded, the least recently used
+            response will be removed.
+    """
+
+    __slots__ = ("_entries", "hits", "max_size", "misses")
+
+    def __init__(self, max_size: int = 1000) -> None:
+        self.max_size: int = max_size
+        """The maximum number of responses to cache."""
+
+        self.hits: int = 0
+        """The number of command invocations that have been responded to from the cache."""
+        self.misses: int = 0
+        """The number of command invocations that required the command to be invoked."""
+
+        self._entries: collections.OrderedDict[tuple[Hashable, ...], tuple[float, Sequence[dict[str, t.Any]]]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: tuple[Hashable, ...]) -> Sequence[dict[str, t.Any]] | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def _put(self, key: tuple[Hashable, ...], responses: Sequence[dict[str, t.Any]], ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, responses)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *prefix: Hashable) -> int:
+        """
+        Remove all responses whose key starts with the given elements. For example, ``invalidate("leaderboard")``
+        removes all cached responses for the ``leaderboard`` command, and ``invalidate("leaderboard", guild_id)``
+        removes only those cached for the given guild when the hooks were created using the ``guild`` bucket.
+
+        Args:
+            *prefix: The leading elements of the keys to remove. Subcommands are identified by their qualified
+                name - for example ``"stats server"``.
+
+        Returns:
+            :obj:`int`: The number of responses removed.
+        """
+        n = len(prefix)
+        stale = [key for key in self._entries if key[:n] == prefix]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """
+        Remove all responses from the cache.
+
+        Returns:
+            :obj:`None`
+        """
+        self._entries.clear()
+
+
+def cached_response(
+    ttl: float, key: Bucket = "global", *, cache: ResponseCache | None = None
+) -> tuple[execution.ExecutionHook, execution.ExecutionHook]:
+    """
+    Creates hooks that cache the responses created by a command, replaying them instead of invoking the command
+    when it is invoked again with the same option values within the same bucket. Responses are replayed using
+    :meth:`~lightbulb.context.Context.respond`. The created hooks are run during the ``PRE_INVOKE`` and
+    ``POST_INVOKE`` execution steps, so any checks and cooldowns are still applied when a cached response is
+    replayed. As this returns **multiple** hooks, you should unpack them into the hooks list for your command - see
+    the example for details.
+
+    Args:
+        ttl: The number of seconds that a cached response remains valid for.
+        key: The bucket which responses should be shared within. Accepts the same values that the cooldowns do.
+        cache: The cache to store responses in. Pass the same cache to multiple commands to allow them to
+            be invalidated together. If not provided, a new cache is created for the hooks.
+
+    Returns:
+        The created hooks.
+
+    Warning:
+        You should only cache responses for commands which do not have side effects, and whose response depends
+        solely on the values of the command's options (and the bucket). Only responses created using ``respond``
+        are cached - if the command edits or deletes its responses, these will not be replayed. Responses are not
+        cached if the command invocation fails, or if any of them upload files - as attachments, or as images in
+        embeds - as the files may only be readable once. Existing attachments and URLs are cached as normal.
+
+    Example:
+
+        .. code-block:: python
+
+            leaderboard_cache = lightbulb.prefab.ResponseCache(max_size=500)
+
+            class Leaderboard(
+                ...,
+                hooks=[*lightbulb.prefab.cached_response(60, "guild", cache=leaderboard_cache)]
+            ):
+                ...
+
+            # Later - for example when the scores for a guild change
+            leaderboard_cache.invalidate("leaderboard", guild_id)
+    """
+    bucket_callable = _PROVIDED_BUCKETS[key] if isinstance(key, str) else key
+    cache = cache if cache is not None else ResponseCache()
+
+    @execution.hook(execution.ExecutionSteps.PRE_INVOKE, name="replay_cached_response")
+    async def _replay_cached_response(pl: execution.ExecutionPipeline, ctx: context.Context) -> None:
+        responses = cache._get(await _response_key(ctx, bucket_callable))
+        if responses is None:
+            if ctx._recorded_responses is None:
+                ctx._recorded_responses = []
+            return
+
+        pl.skip_invocation()
+        for response in responses:
+            await ctx.respond(**response)
+
+    @execution.hook(execution.ExecutionSteps.POST_INVOKE, name="cache_response")
+    async def _cache_response(pl: execution.ExecutionPipeline, ctx: context.Context) -> None:
+        if pl.invocation_skipped or pl.failed or not ctx._recorded_responses:
+            return
+        if not _replayable(ctx._recorded_responses):
+            return
+
+        cache._put(await _response_key(ctx, bucket_callable), tuple(ctx._recorded_responses), ttl)
+
+    return _replay_cached_response, _cache_response
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+__all__ = ["single_flight"]
+
+import asyncio
+import collections
+import typing as t
+from collections.abc import Hashable
+from collections.abc import Sequence
+
+import hikari
+
+from lightbulb import context
+from lightbulb.commands import execution
+from lightbulb.prefab.caching import _replayable
+from lightbulb.prefab.caching import _response_key
+from lightbulb.prefab.cooldowns import _PROVIDED_BUCKETS
+from lightbulb.prefab.cooldowns import Bucket
+
+
+class _Flight:
+    __slots__ = ("changed", "leader", "responses", "waiters")
+
+    def __init__(self, leader: context.Context) -> None:
+        loop = asyncio.get_running_loop()
+        self.leader: context.Context = leader
+        # Replaced each time the leader changes, so that the waiting invocations can watch the new leader
+        self.changed: asyncio.Future[None] = loop.create_future()
+        self.responses: asyncio.Future[Sequence[dict[str, t.Any]] | None] = loop.create_future()
+        self.waiters: collections.deque[context.Context] = collections.deque()
+
+
+def _is_ephemeral(ctx: context.Context) -> bool:
+    if (flags := ctx._deferred_flags) is None and ctx._recorded_responses:
+        flags = ctx._recorded_responses[0]["flags"]
+    return isinstance(flags, int) and bool(flags & hikari.MessageFlag.EPHEMERAL)
+
+
+async def _wait(ctx: context.Context, flight: _Flight) -> None:
+    # 'asyncio.wait' never cancels the futures passed to it, so this invocation being cancelled
+    # does not affect the others
+    while not flight.responses.done() and flight.leader is not ctx:
+        leader, changed = flight.leader, flight.changed
+        waiting: list[asyncio.Future[t.Any]] = [flight.responses, changed]
+        watch = None
+        if not ctx.initial_response_sent.is_set():
+            watch = asyncio.create_task(leader.initial_response_sent.wait())
+            waiting.append(watch)
+
+        try:
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if watch is not None:
+                watch.cancel()
+
+        if watch is not None and not (flight.responses.done() or changed.done()) and watch.done():
+            # The leader has responded (or deferred) but is still running, so defer this invocation to
+            # prevent the interaction from expiring while it waits
+            await ctx.defer(ephemeral=_is_ephemeral(leader))
+
+
+def single_flight(key: Bucket = "global") -> tuple[execution.ExecutionHook, execution.ExecutionHook]:
+    """
+    Creates hooks that coalesce concurrent invocations of a command with the same option values within the same
+    bucket. The first invocation runs the command as normal, while any others that arrive before it completes
+    wait for it to finish instead of invoking the command themselves. The responses created by the first
+    invocation are then replayed to each waiting invocation using its own :meth:`~lightbulb.context.Context.respond`.
+
+    If the first invocation responds or defers while the others are waiting, each waiting invocation is deferred
+    (ephemerally, if the first invocation's initial response was ephemeral) so that it does not expire. If the first
+    invocation fails, the first of the waiting invocations takes its place and invokes the command, while the
+    others continue to wait. If the responses created by the first invocation upload files, the waiting invocations
+    are all released to invoke the command themselves, as the files may only be readable once.
+
+    The created hooks are run during the ``PRE_INVOKE`` and ``POST_INVOKE`` execution steps. As this returns
+    **multiple** hooks, you should unpack them into the hooks list for your command - see the example for details.
+
+    Args:
+        key: The bucket which invocations should be coalesced within. Accepts the same values that the
+            cooldowns do.
+
+    Returns:
+        The created hooks.
+
+    Warning:
+        **DO NOT** use the same hooks for multiple commands. Make sure you call this function a single time for
+        each command you wish to coalesce invocations of.
+
+    Warning:
+        You should only coalesce invocations of commands which do not have side effects, and whose response depends
+        solely on the values of the command's options (and the bucket). Only responses created using ``respond``
+        are replayed - if the command edits or deletes its responses, these will not be replayed. Responses which
+        upload files - as attachments, or as images in embeds - are not replayed.
+
+    Example:
+
+        .. code-block:: python
+
+            class Leaderboard(
+                ...,
+                hooks=[*lightbulb.prefab.single_flight("guild")]
+            ):
+                ...
+    """
+    bucket_callable = _PROVIDED_BUCKETS[key] if isinstance(key, str) else key
+    in_flight: dict[tuple[Hashable, ...], _Flight] = {}
+    leaders: dict[context.Context, tuple[tuple[Hashable, ...], _Flight]] = {}
+
+    def _land(ctx: context.Context, responses: Sequence[dict[str, t.Any]] | None, *, hand_over: bool = True) -> None:
+        if (led := leaders.pop(ctx, None)) is None:
+            return
+
+        flight_key, flight = led
+        if responses is None and hand_over and flight.waiters:
+            # Hand the flight over to the next waiting invocation instead of releasing them all at once
+            flight.leader = new_leader = flight.waiters.popleft()
+            leaders[new_leader] = led
+            flight.changed.set_result(None)
+            flight.changed = asyncio.get_running_loop().create_future()
+            return
+
+        if in_flight.get(flight_key) is flight:
+            del in_flight[flight_key]
+        if not flight.responses.done():
+            flight.responses.set_result(responses)
+
+    @execution.hook(execution.ExecutionSteps.PRE_INVOKE, name="join_single_flight")
+    async def _join_single_flight(pl: execution.ExecutionPipeline, ctx: context.Context) -> None:
+        flight_key = await _response_key(ctx, bucket_callable)
+
+        if (flight := in_flight.get(flight_key)) is not None:
+            flight.waiters.append(ctx)
+            try:
+                await _wait(ctx, flight)
+            except BaseException:
+                if ctx in flight.waiters:
+                    flight.waiters.remove(ctx)
+                # If this invocation was made the leader, pass the flight on to the next one
+                _land(ctx, None)
+                raise
+
+            if flight.leader is not ctx and (responses := flight.responses.result()) is not None:
+                pl.skip_invocation()
+                for response in responses:
+                    await ctx.respond(**response)
+                return
+        else:
+            flight = in_flight[flight_key] = _Flight(ctx)
+            leaders[ctx] = (flight_key, flight)
+
+        if ctx._recorded_responses is None:
+            ctx._recorded_responses = []
+
+        # Release the waiting invocations even if this one is cancelled before the POST_INVOKE hook is run
+        if (task := asyncio.current_task()) is not None:
+            task.add_done_callback(lambda _: _land(ctx, None))
+
+    @execution.hook(execution.ExecutionSteps.POST_INVOKE, name="land_single_flight", always_run=True)
+    def _land_single_flight(pl: execution.ExecutionPipeline, ctx: context.Context) -> None:
+        if pl.failed or pl.invocation_skipped or ctx._recorded_responses is None:
+            _land(ctx, None)
+        elif not _replayable(ctx._recorded_responses):
+            # The responses cannot be sent again, so let every waiting invocation run the command itself
+            _land(ctx, None, hand_over=False)
+        else:
+            _land(ctx, tuple(ctx._recorded_responses))
+
+    return _join_single_flight, _land_single_flight
@@ -80,7 +80,7 @@ def max_concurrency(n_invocations: int, bucket: Bucket) -> tuple[execution.Execu
 
         invocations[hash] += 1
 
-    @execution.hook(execution.ExecutionSteps.POST_INVOKE, name="decr_concurrency")
+    @execution.hook(execution.ExecutionSteps.POST_INVOKE, name="decr_concurrency", always_run=True)
     async def _decrement_invocation_count(_: execution.ExecutionPipeline, ctx: context.Context) -> None:
         invocations[hash] = min(invocations[hash := await utils.maybe_await(bucket_callable(ctx))] - 1, 0)
 
@@ -24,6 +24,7 @@ import collections
 import time
 import typing as t
 from collections.abc import Callable
+from collections.abc import Sequence
 
 import hikari
 import linkd
@@ -112,6 +113,9 @@ def _maybe_register_dependency(cc: CommandCooldown) -> None:
 class _FixedWindow:
     __slots__ = ("_allowed_invocations", "_bucket", "_invocations", "_window_length")
 
+    # Added to the command container each time the hook is run
+    _provided_at_runtime: t.ClassVar[Sequence[t.Any]] = (CommandCooldown,)
+
     class _InvocationData:
         __slots__ = ("expires", "n")
 
@@ -152,6 +156,9 @@ class _FixedWindow:
 class _SlidingWindow:
     __slots__ = ("_allowed_invocations", "_bucket", "_invocations", "_window_length")
 
+    # Added to the command container each time the hook is run
+    _provided_at_runtime: t.ClassVar[Sequence[t.Any]] = (CommandCooldown,)
+
     def __init__(self, window_length: float, allowed_invocations: int, bucket: BucketCallable) -> None:
         self._window_length = window_length
         self._allowed_invocations = allowed_invocations
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Detection of event loop stalls. When a :obj:`~StallDetector` is passed to the client, each step of command
+invocations, hooks, autocomplete providers, listeners, tasks, menu callbacks and component handlers is timed. Any
+single step that blocks the event loop for longer than the detector's threshold is recorded against the callable
+that was running, using the same names as the client's tracing spans - the command's qualified name, the hook name,
+the listener's event types or the task function's name.
+
+The detector also samples the loop's lag in the background, so that stalls caused by code that is not managed by
+lightbulb are still counted - these are recorded as :obj:`~UNATTRIBUTED`. When no detector is set, nothing is timed.
+
+.. dropdown:: Example
+
+    .. code-block:: python
+
+        import lightbulb
+
+        detector = lightbulb.stalls.StallDetector(threshold=0.05)
+        client = lightbulb.client_from_app(bot, stall_detector=detector)
+
+        # Later - for example in an owner-only debug command
+        print(detector.report(10))
+"""
+
+from __future__ import annotations
+
+__all__ = ["UNATTRIBUTED", "Offender", "Stall", "StallDetector"]
+
+import asyncio
+import collections
+import contextlib
+import dataclasses
+import logging
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Generator
+    from collections.abc import Sequence
+
+T = t.TypeVar("T")
+
+LOGGER = logging.getLogger(__name__)
+
+UNATTRIBUTED: t.Final[str] = "unattributed"
+"""The kind given to stalls found by sampling the loop's lag that were not caused by a lightbulb-managed callable."""
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class Stall:
+    """Dataclass representing a single period during which the event loop was blocked."""
+
+    kind: str
+    """
+    The kind of callable that blocked the loop - one of ``command``, ``hook``, ``autocomplete``, ``listener``,
+    ``task``, ``menu``, ``component_handler`` or :obj:`~UNATTRIBUTED`.
+    """
+    name: str
+    """The name of the callable that blocked the loop. Empty for unattributed stalls."""
+    duration_ns: int
+    """How long the loop was blocked for, in nanoseconds."""
+    timestamp: float
+    """The time that the stall was recorded, in seconds since the epoch."""
+
+
+@dataclasses.dataclass(slots=True)
+class Offender:
+    """Dataclass representing the stalls recorded for a single callable."""
+
+    kind: str
+    """The kind of the callable."""
+    name: str
+    """The name of the callable."""
+    count: int = 0
+    """The number of stalls recorded for the callable."""
+    total_ns: int = 0
+    """The total time the callable blocked the loop for, in nanoseconds."""
+    max_ns: int = 0
+    """The longest single stall recorded for the callable, in nanoseconds."""
+
+
+class _Monitored(t.Generic[T]):
+    __slots__ = ("_awaitable", "_detector", "_kind", "_name")
+
+    def __init__(self, detector: StallDetector, awaitable: Awaitable[T], kind: str, name: str) -> None:
+        self._detector = detector
+        self._awaitable = awaitable
+        self._kind = kind
+        self._name = name
+
+    def __await__(self) -> Generator[t.Any, t.Any, T]:
+        return self._detector._drive(self._awaitable.__await__(), self._kind, self._name)
+
+
+class StallDetector:
+    """
+    Class recording which lightbulb-managed callables block the event loop.
+
+    Each step of a monitored callable - the synchronous code run between two of its suspension points - is timed
+    separately. Time spent in steps of nested monitored callables (for example a hook run as part of a command's
+    execution) is only counted against the innermost callable.
+
+    Args:
+        threshold: The minimum time, in seconds, that the loop must be blocked for to be recorded as a stall.
+        sample_interval: How often to sample the loop's lag, in seconds.
+        history: The maximum number of stalls to keep. When exceeded, the oldest stall is discarded.
+    """
+
+    __slots__ = (
+        "_attributed",
+        "_sampler",
+        "_stack",
+        "_stalls",
+        "_threshold_ns",
+        "lag",
+        "max_lag",
+        "sample_interval",
+        "threshold",
+    )
+
+    def __init__(self, threshold: float = 0.1, *, sample_interval: float = 0.05, history: int = 1000) -> None:
+        if threshold <= 0:
+            raise ValueError("threshold must be greater than 0")
+        if sample_interval <= 0:
+            raise ValueError("sample_interval must be greater than 0")
+        if history < 1:
+            raise ValueError("history must be at least 1")
+
+        self.threshold: float = threshold
+        """The minimum time, in seconds, that the loop must be blocked for to be recorded as a stall."""
+        self.sample_interval: float = sample_interval
+        """How often the loop's lag is sampled, in seconds."""
+        self.lag: float = 0.0
+        """The most recently sampled loop lag, in seconds."""
+        self.max_lag: float = 0.0
+        """The largest loop lag sampled since the detector was started, in seconds."""
+
+        self._threshold_ns = round(threshold * 1e9)
+        self._stalls: collections.deque[Stall] = collections.deque(maxlen=history)
+        # Time spent in nested monitored steps, for each monitored step currently running
+        self._stack: list[int] = []
+        self._attributed = False
+        self._sampler: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop lag sampler is running."""
+        return self._sampler is not None and not self._sampler.done()
+
+    @property
+    def stalls(self) -> Sequence[Stall]:
+        """The stalls currently held, oldest first."""
+        return tuple(self._stalls)
+
+    def start(self) -> None:
+        """
+        Start sampling the loop's lag. Must be called from within a running event loop.
+
+        Returns:
+            :obj:`None`
+
+        Raises:
+            :obj:`RuntimeError`: If the detector has already been started.
+        """
+        if self.running:
+            raise RuntimeError("cannot start already-started stall detector")
+
+        self.max_lag = 0.0
+        self._sampler = asyncio.create_task(self._sample())
+
+    async def close(self) -> None:
+        """
+        Stop sampling the loop's lag. Recorded stalls are kept.
+
+        Returns:
+            :obj:`None`
+        """
+        sampler, self._sampler = self._sampler, None
+        if sampler is None:
+            return
+
+        sampler.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sampler
+
+    def clear(self) -> None:
+        """
+        Remove all recorded stalls.
+
+        Returns:
+            :obj:`None`
+        """
+        self._stalls.clear()
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.sample_interval
+            await asyncio.sleep(self.sample_interval)
+
+            self.lag = max(loop.time() - expected, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+
+            if self.lag >= self.threshold and not self._attributed:
+                self._record(UNATTRIBUTED, "", round(self.lag * 1e9))
+            self._attributed = False
+
+    def _record(self, kind: str, name: str, duration_ns: int) -> None:
+        self._stalls.append(Stall(kind, name, duration_ns, time.time()))
+
+        if kind == UNATTRIBUTED:
+            LOGGER.warning("event loop lagged by %.1fms - not caused by a monitored callable", duration_ns / 1e6)
+            return
+
+        self._attributed = True
+        LOGGER.warning("event loop blocked for %.1fms by %s %r", duration_ns / 1e6, kind, name)
+
+    def _exit(self, kind: str, name: str, start: int) -> None:
+        elapsed = time.perf_counter_ns() - start
+        own = elapsed - self._stack.pop()
+        if self._stack:
+            self._stack[-1] += elapsed
+
+        if own >= self._threshold_ns:
+            self._record(kind, name, own)
+
+    def _drive(self, iterator: Generator[t.Any, t.Any, T], kind: str, name: str) -> Generator[t.Any, t.Any, T]:
+        value: t.Any = None
+        error: BaseException | None = None
+        while True:
+            self._stack.append(0)
+            start = time.perf_counter_ns()
+            try:
+                yielded = iterator.send(value) if error is None else iterator.throw(error)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self._exit(kind, name, start)
+
+            value, error = None, None
+            try:
+                value = yield yielded
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as e:
+                error = e
+
+    @contextlib.contextmanager
+    def section(self, kind: str, name: str) -> Generator[None, None, None]:
+        """
+        Context manager timing a block of synchronous code, recording a stall against the given callable if
+        the block runs for longer than the threshold.
+
+        Args:
+            kind: The kind of callable being run.
+            name: The name of the callable being run.
+        """
+        self._stack.append(0)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._exit(kind, name, start)
+
+    def monitor(self, awaitable: Awaitable[T], kind: str, name: str) -> Awaitable[T]:
+        """
+        Wrap an awaitable so that each of its steps is timed, recording a stall against the given callable if
+        any step runs for longer than the threshold.
+
+        Args:
+            awaitable: The awaitable to monitor.
+            kind: The kind of callable being run.
+            name: The name of the callable being run.
+
+        Returns:
+            The wrapped awaitable, which gives the same result as the original.
+        """
+        return _Monitored(self, awaitable, kind, name)
+
+    def top_offenders(self, n: int = 10, *, window: float | None = None) -> Sequence[Offender]:
+        """
+        Get the callables that have blocked the loop for the longest total time.
+
+        Args:
+            n: The maximum number of offenders to return.
+            window: Only consider stalls recorded within this many seconds. If :obj:`None`, all stalls
+                currently held are considered.
+
+        Returns:
+            :obj:`~typing.Sequence` [ :obj:`~Offender` ]: The offenders, worst first.
+        """
+        since = time.time() - window if window is not None else None
+
+        offenders: dict[tuple[str, str], Offender] = {}
+        for stall in self._stalls:
+            if since is not None and stall.timestamp < since:
+                continue
+
+            key = (stall.kind, stall.name)
+            if (offender := offenders.get(key)) is None:
+                offender = offenders[key] = Offender(stall.kind, stall.name)
+
+            offender.count += 1
+            offender.total_ns += stall.duration_ns
+            offender.max_ns = max(offender.max_ns, stall.duration_ns)
+
+        return sorted(offenders.values(), key=lambda o: o.total_ns, reverse=True)[:n]
+
+    def report(self, n: int = 10, *, window: float | None = None) -> str:
+        """
+        Render the worst offenders as a plain-text table.
+
+        Args:
+            n: The maximum number of offenders to include.
+            window: Only consider stalls recorded within this many seconds. If :obj:`None`, all stalls
+                currently held are considered.
+
+        Returns:
+            :obj:`str`: The rendered report.
+        """
+        lines = [f"{'kind':<18} {'name':<40} {'count':>6} {'total ms':>10} {'max ms':>10}"]
+        for offender in self.top_offenders(n, window=window):
+            lines.append(
+                f"{offender.kind:<18} {offender.name or '-':<40} {offender.count:>6} "
+                f"{offender.total_ns / 1e6:>10.1f} {offender.max_ns / 1e6:>10.1f}"
+            )
+        lines.append(f"loop lag: {self.lag * 1e3:.1f}ms (max {self.max_lag * 1e3:.1f}ms)")
+        return "\n".join(lines)
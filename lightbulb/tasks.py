@@ -95,6 +95,7 @@ from collections.abc import Callable
 
 from lightbulb import di
 from lightbulb import utils
+from lightbulb.internal import di as i_di
 from lightbulb.internal import types
 
 if t.TYPE_CHECKING:
@@ -303,12 +304,12 @@ class Task:
             LOGGER.debug("invoking task %r", self._func.__name__)
 
             before, self.last_invoked_at = time.perf_counter(), datetime.datetime.now(datetime.timezone.utc)
-            async with (
-                self._client.di.enter_context(di.Contexts.DEFAULT),
-                self._client.di.enter_context(di.Contexts.TASK),
-            ):
+            async with i_di.lazy_context(self._client.di, di.Contexts.TASK):
                 try:
-                    await self._func()
+                    if self._client.stall_detector is None:
+                        await self._func()
+                    else:
+                        await self._client.stall_detector.monitor(self._func(), "task", self._func.__name__)
                 except Exception as e:
                     if isinstance(e, asyncio.CancelledError):
                         LOGGER.debug("task cancelled")
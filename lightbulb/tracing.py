@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Tracing for the interaction lifecycle. When a :obj:`~Tracer` is passed to the client, each interaction received is
+recorded as a tree of spans - routing, dependency injection container creation, each execution step, the initial
+response and any followups, as well as menu, modal and autocomplete handling. When no tracer is set, no spans are
+created.
+
+The trace ID of the interaction currently being processed is carried in a context variable so that any logs
+emitted while handling the interaction - including from tasks created during that time - can be correlated
+using :obj:`~TraceIdFilter`.
+
+.. dropdown:: Example
+
+    .. code-block:: python
+
+        import logging
+        import lightbulb
+
+        buffer = lightbulb.tracing.RingBufferExporter(capacity=5000)
+        tracer = lightbulb.tracing.Tracer(
+            buffer,
+            lightbulb.tracing.JsonLinesExporter("spans.jsonl"),
+        )
+        client = lightbulb.client_from_app(bot, tracer=tracer)
+
+        handler = logging.StreamHandler()
+        handler.addFilter(lightbulb.tracing.TraceIdFilter())
+        handler.setFormatter(logging.Formatter("[%(trace_id)s] %(levelname)s %(message)s"))
+
+        # Later - find the slowest interactions handled recently
+        for span in buffer.slowest(10, name="lightbulb.interaction"):
+            print(span.trace_id, span.duration_ns / 1e6, span.attributes)
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "JsonLinesExporter",
+    "RingBufferExporter",
+    "Span",
+    "SpanExporter",
+    "TraceIdFilter",
+    "Tracer",
+    "current_span",
+    "current_trace_id",
+    "span",
+]
+
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import heapq
+import json
+import logging
+import random
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    import os
+    from collections.abc import Generator
+    from collections.abc import Sequence
+
+LOGGER = logging.getLogger(__name__)
+
+_CURRENT_SPAN: contextvars.ContextVar[tuple[Tracer, Span] | None] = contextvars.ContextVar(
+    "lightbulb_current_span", default=None
+)
+_NO_SPAN: contextlib.nullcontext[None] = contextlib.nullcontext()
+
+
+@dataclasses.dataclass(slots=True)
+class Span:
+    """Dataclass representing a single timed operation within a trace."""
+
+    name: str
+    """The name of the span."""
+    trace_id: str
+    """The ID of the trace that this span belongs to. Shared by all spans created while handling an interaction."""
+    span_id: str
+    """The ID of this span."""
+    parent_id: str | None
+    """The ID of the parent of this span, or :obj:`None` if this is the root span of the trace."""
+    start_ns: int
+    """The time that this span started, in nanoseconds since the epoch."""
+    attributes: dict[str, t.Any] = dataclasses.field(default_factory=dict[str, t.Any])
+    """Additional information about the operation that this span represents."""
+    duration_ns: int = 0
+    """The duration of this span, in nanoseconds. Will be ``0`` until the span has ended."""
+    error: str | None = None
+    """The name of the exception type that caused this span to fail, or :obj:`None` if it did not fail."""
+
+    def to_dict(self) -> dict[str, t.Any]:
+        """
+        Get a JSON-serializable representation of this span.
+
+        Returns:
+            :obj:`dict` [ :obj:`str`, :obj:`~typing.Any` ]: The span as a dictionary.
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "duration_ns": self.duration_ns,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class SpanExporter(t.Protocol):
+    """Protocol for objects that finished spans can be sent to."""
+
+    def export(self, span: Span) -> None:
+        """
+        Export a single finished span. This is called directly when the span ends, so should not block.
+
+        Args:
+            span: The finished span.
+
+        Returns:
+            :obj:`None`
+        """
+        ...
+
+    def close(self) -> None:
+        """
+        Release any resources held by the exporter. Called when the client is stopped.
+
+        Returns:
+            :obj:`None`
+        """
+        ...
+
+
+class RingBufferExporter:
+    """
+    Span exporter that keeps the most recently finished spans in memory.
+
+    Args:
+        capacity: The maximum number of spans to keep. When exceeded, the oldest span is discarded.
+    """
+
+    __slots__ = ("_spans",)
+
+    def __init__(self, capacity: int = 1000) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self._spans: collections.deque[Span] = collections.deque(maxlen=capacity)
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of spans that will be kept."""
+        assert self._spans.maxlen is not None
+        return self._spans.maxlen
+
+    @property
+    def spans(self) -> Sequence[Span]:
+        """The spans currently held, oldest first."""
+        return tuple(self._spans)
+
+    def slowest(self, n: int = 10, *, name: str | None = None) -> Sequence[Span]:
+        """
+        Get the slowest spans currently held.
+
+        Args:
+            n: The maximum number of spans to return.
+            name: The span name to filter by. If :obj:`None`, spans of all names are considered.
+
+        Returns:
+            :obj:`~typing.Sequence` [ :obj:`~Span` ]: The slowest spans, slowest first.
+        """
+        spans = self._spans if name is None else (s for s in self._spans if s.name == name)
+        return heapq.nlargest(n, spans, key=lambda s: s.duration_ns)
+
+    def trace(self, trace_id: str) -> Sequence[Span]:
+        """
+        Get all spans currently held that belong to the given trace.
+
+        Args:
+            trace_id: The ID of the trace.
+
+        Returns:
+            :obj:`~typing.Sequence` [ :obj:`~Span` ]: The spans of the trace, ordered by their start time.
+        """
+        return sorted((s for s in self._spans if s.trace_id == trace_id), key=lambda s: s.start_ns)
+
+    def clear(self) -> None:
+        """
+        Remove all spans currently held.
+
+        Returns:
+            :obj:`None`
+        """
+        self._spans.clear()
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def close(self) -> None:
+        return None
+
+
+class JsonLinesExporter:
+    """
+    Span exporter that appends each finished span to a file as a single line of JSON.
+
+    Spans are written through a buffer, which is flushed once ``flush_every`` spans have been written
+    and when the exporter is closed.
+
+    Args:
+        path: The path of the file to append spans to. The file is created if it does not exist.
+        flush_every: The number of spans to write between flushes of the file buffer.
+    """
+
+    __slots__ = ("_file", "_flush_every", "_unflushed", "path")
+
+    def __init__(self, path: str | os.PathLike[str], *, flush_every: int = 100) -> None:
+        self.path: str | os.PathLike[str] = path
+        """The path of the file that spans are appended to."""
+        self._flush_every = max(flush_every, 1)
+        self._unflushed = 0
+        self._file: t.TextIO | None = None
+
+    def export(self, span: Span) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+
+        self._file.write(json.dumps(span.to_dict(), default=str, separators=(",", ":")) + "\n")
+        self._unflushed += 1
+        if self._unflushed >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Flush any buffered spans to the file.
+
+        Returns:
+            :obj:`None`
+        """
+        if self._file is not None:
+            self._file.flush()
+        self._unflushed = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._unflushed = 0
+
+
+class Tracer:
+    """
+    Class which creates spans and sends them to the given exporters once they have finished.
+
+    Args:
+        *exporters: The exporters that finished spans should be sent to.
+    """
+
+    __slots__ = ("exporters",)
+
+    def __init__(self, *exporters: SpanExporter) -> None:
+        self.exporters: Sequence[SpanExporter] = exporters
+        """The exporters that finished spans are sent to."""
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: t.Any) -> Generator[Span, None, None]:
+        """
+        Context manager which times the code within it as a span. If another span is active, the new span is created
+        as its child - otherwise a new trace is started.
+
+        Args:
+            name: The name of the span.
+            **attributes: Additional information to attach to the span.
+
+        Returns:
+            :obj:`~typing.ContextManager` [ :obj:`~Span` ]: Context manager yielding the created span.
+        """
+        if (current := _CURRENT_SPAN.get()) is None:
+            trace_id, parent_id = f"{random.getrandbits(128):032x}", None
+        else:
+            trace_id, parent_id = current[1].trace_id, current[1].span_id
+
+        new = Span(name, trace_id, f"{random.getrandbits(64):016x}", parent_id, time.time_ns(), attributes)
+        token = _CURRENT_SPAN.set((self, new))
+        start = time.perf_counter_ns()
+        try:
+            yield new
+        except BaseException as e:
+            new.error = type(e).__name__
+            raise
+        finally:
+            new.duration_ns = time.perf_counter_ns() - start
+            _CURRENT_SPAN.reset(token)
+            self._export(new)
+
+    def _export(self, span: Span) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                LOGGER.error("failed to export span %r", span.name, exc_info=(type(e), e, e.__traceback__))
+
+    def close(self) -> None:
+        """
+        Close all exporters.
+
+        Returns:
+            :obj:`None`
+        """
+        for exporter in self.exporters:
+            try:
+                exporter.close()
+            except Exception as e:
+                LOGGER.error("failed to close span exporter", exc_info=(type(e), e, e.__traceback__))
+
+
+def span(name: str, **attributes: t.Any) -> t.ContextManager[Span | None]:
+    """
+    Context manager which times the code within it as a child of the current span. If there is no current span -
+    for example if the client does not have a tracer set - no span is created.
+
+    This can be used within command, hook and handler functions to add your own spans to the trace of the
+    interaction being processed.
+
+    Args:
+        name: The name of the span.
+        **attributes: Additional information to attach to the span.
+
+    Returns:
+        :obj:`~typing.ContextManager` [ :obj:`~Span` | :obj:`None` ]: Context manager yielding the created span,
+            or :obj:`None` if no span was created.
+
+    Example:
+
+        .. code-block:: python
+
+            class Lookup(lightbulb.SlashCommand, name="lookup", description="..."):
+                @lightbulb.invoke
+                async def invoke(self, ctx: lightbulb.Context) -> None:
+                    with lightbulb.tracing.span("database.lookup", user=ctx.user.id):
+                        result = await database.lookup(ctx.user.id)
+                    await ctx.respond(result)
+    """
+    if (current := _CURRENT_SPAN.get()) is None:
+        return _NO_SPAN
+    return current[0].span(name, **attributes)
+
+
+def current_span() -> Span | None:
+    """
+    Get the span that is currently active.
+
+    Returns:
+        :obj:`~Span` | :obj:`None`: The current span, or :obj:`None` if there is no active span.
+    """
+    current = _CURRENT_SPAN.get()
+    return current[1] if current is not None else None
+
+
+def current_trace_id() -> str | None:
+    """
+    Get the ID of the trace that is currently active.
+
+    Returns:
+        :obj:`str` | :obj:`None`: The current trace ID, or :obj:`None` if there is no active trace.
+    """
+    current = _CURRENT_SPAN.get()
+    return current[1].trace_id if current is not None else None
+
+
+class TraceIdFilter(logging.Filter):
+    """
+    Logging filter which adds the ID of the current trace to each log record as the ``trace_id`` attribute, allowing
+    it to be used in log formats. Records are never dropped by this filter.
+
+    Args:
+        default: The value to use when there is no active trace.
+    """
+
+    def __init__(self, default: str = "-") -> None:
+        super().__init__()
+        self.default: str = default
+        """The value used when there is no active trace."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.trace_id = current_trace_id() or self.default
+        return True
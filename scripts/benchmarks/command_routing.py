@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Microbenchmark for resolving the command to invoke for an incoming interaction.
+
+Compares the previous implementation - walking the interaction options and performing lookups
+in the client's command invocation mapping - against the compiled routing trie, using a registry
+of 500 slash commands spread over three-level groups.
+
+Run with ``python scripts/benchmarks/command_routing.py``.
+"""
+
+import asyncio
+import dataclasses
+import random
+import time
+import typing as t
+from unittest import mock
+
+import hikari
+
+import lightbulb
+from lightbulb.internal import constants
+
+N_GROUPS = 20
+N_SUBGROUPS = 5
+N_SUBCOMMANDS = 5
+N_INTERACTIONS = 100_000
+
+
+@dataclasses.dataclass(slots=True)
+class FakeOption:
+    name: str
+    type: hikari.OptionType
+    options: t.Sequence["FakeOption"] | None = None
+    value: t.Any = None
+
+
+@dataclasses.dataclass(slots=True)
+class FakeInteraction:
+    command_name: str
+    options: t.Sequence[FakeOption]
+    command_type: hikari.CommandType = hikari.CommandType.SLASH
+    registered_guild_id: hikari.Snowflake | None = None
+
+
+def make_command(name: str) -> type[lightbulb.SlashCommand]:
+    async def invoke(self: t.Any, ctx: lightbulb.Context) -> None: ...
+
+    return t.cast(
+        "type[lightbulb.SlashCommand]",
+        type(lightbulb.SlashCommand)(
+            name,
+            (lightbulb.SlashCommand,),
+            {"invoke": lightbulb.invoke(invoke), "__slots__": ()},
+            name=name,
+            description="benchmark",
+        ),
+    )
+
+
+def legacy_resolve(client: lightbulb.Client, interaction: t.Any) -> t.Any:
+    def get_subcommand(options: t.Sequence[t.Any]) -> t.Any:
+        subcommand = filter(
+            lambda o: o.type in (hikari.OptionType.SUB_COMMAND, hikari.OptionType.SUB_COMMAND_GROUP), options
+        )
+        return next(subcommand, None)
+
+    command_path = [interaction.command_name]
+
+    options = interaction.options or []
+    while (subcommand := get_subcommand(options)) is not None:
+        command_path.append(subcommand.name)
+        options = subcommand.options or []
+
+    global_commands = client._command_invocation_mapping.get(constants.GLOBAL_COMMAND_KEY, {}).get(tuple(command_path))
+    guild_commands = client._command_invocation_mapping.get(
+        interaction.registered_guild_id or constants.GLOBAL_COMMAND_KEY, {}
+    ).get(tuple(command_path))
+
+    root_commands = guild_commands if interaction.registered_guild_id is not None else global_commands
+    if root_commands is None:
+        return None
+
+    command = {
+        int(hikari.CommandType.SLASH): root_commands.slash,
+        int(hikari.CommandType.USER): root_commands.user,
+        int(hikari.CommandType.MESSAGE): root_commands.message,
+    }[int(interaction.command_type)]
+
+    if command is None:
+        return None
+
+    return options, command
+
+
+async def build_client() -> tuple[lightbulb.Client, list[FakeInteraction]]:
+    client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+    interactions: list[FakeInteraction] = []
+    for g in range(N_GROUPS):
+        group = lightbulb.Group(f"group{g}", "benchmark")
+        for s in range(N_SUBGROUPS):
+            subgroup = group.subgroup(f"subgroup{s}", "benchmark")
+            for c in range(N_SUBCOMMANDS):
+                subgroup.register(make_command(f"command{c}"))
+
+                leaf = FakeOption(
+                    f"command{c}",
+                    hikari.OptionType.SUB_COMMAND,
+                    [FakeOption("opt", hikari.OptionType.STRING, value="x")],
+                )
+                interactions.append(
+                    FakeInteraction(
+                        f"group{g}", [FakeOption(f"subgroup{s}", hikari.OptionType.SUB_COMMAND_GROUP, [leaf])]
+                    )
+                )
+        client.register(group)
+
+    await client.start()
+    random.shuffle(interactions)
+    return client, interactions
+
+
+def bench(name: str, func: t.Callable[[t.Any], t.Any], interactions: list[FakeInteraction]) -> float:
+    n = len(interactions)
+    before = time.perf_counter()
+    for i in range(N_INTERACTIONS):
+        assert func(interactions[i % n]) is not None
+    elapsed = time.perf_counter() - before
+
+    rate = N_INTERACTIONS / elapsed
+    print(f"{name:>8}: {rate:>12,.0f} interactions/sec ({elapsed * 1e9 / N_INTERACTIONS:,.0f} ns/interaction)")
+    return rate
+
+
+async def main() -> None:
+    client, interactions = await build_client()
+    print(f"registry: {len(interactions)} commands ({N_GROUPS} groups, 3 levels)")
+
+    before = bench("before", lambda i: legacy_resolve(client, i), interactions)
+    after = bench("after", client._resolve_options_and_command, interactions)
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
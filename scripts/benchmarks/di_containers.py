@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Microbenchmark for the dependency injection overhead of each command invocation.
+
+Compares the previous implementation - entering the ``DEFAULT`` and ``COMMAND`` contexts, creating a command
+container and registering the context and pipeline for every invocation, then calling the invoke method through
+its dependency injection wrapper - against the current one, where containers are only created when a dependency
+is first requested and invoke methods with nothing to inject are called directly. Each is measured for a command
+with no injectable dependencies, and for one whose invoke method requests a dependency.
+
+Run with ``python scripts/benchmarks/di_containers.py``.
+"""
+
+import asyncio
+import time
+import typing as t
+from unittest import mock
+
+import lightbulb
+
+N_INVOCATIONS = 50_000
+
+
+class Dependency: ...
+
+
+class Plain(lightbulb.SlashCommand, name="plain", description="benchmark"):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+class Injected(lightbulb.SlashCommand, name="injected", description="benchmark"):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context, dep: Dependency) -> None: ...
+
+
+async def eager_run(context: lightbulb.Context) -> None:
+    client = context.client
+    pipeline = lightbulb.ExecutionPipeline(context, client.execution_step_order)
+    async with (
+        client.di.enter_context(lightbulb.di.Contexts.DEFAULT),
+        client.di.enter_context(lightbulb.di.Contexts.COMMAND) as container,
+    ):
+        container.add_value(lightbulb.Context, context)
+        container.add_value(lightbulb.ExecutionPipeline, pipeline)
+
+        await context.command._resolve_options()
+        await getattr(context.command, context.command_data.invoke_method)(context)
+
+
+async def lazy_run(context: lightbulb.Context) -> None:
+    await context.client._execute_command_pipeline(context)
+
+
+async def bench(
+    name: str,
+    func: t.Callable[[lightbulb.Context], t.Awaitable[None]],
+    client: lightbulb.Client,
+    command: type[lightbulb.SlashCommand],
+) -> float:
+    context = lightbulb.Context(client, mock.Mock(), [], command(), mock.Mock())
+
+    before = time.perf_counter()
+    for _ in range(N_INVOCATIONS):
+        await func(context)
+    elapsed = time.perf_counter() - before
+
+    rate = N_INVOCATIONS / elapsed
+    print(f"{name:>16}: {rate:>12,.0f} invocations/sec ({elapsed * 1e9 / N_INVOCATIONS:,.0f} ns/invocation)")
+    return rate
+
+
+async def main() -> None:
+    client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+    client.execution_step_order = [lightbulb.ExecutionSteps.INVOKE]
+    client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(Dependency, Dependency)
+
+    for command in (Plain, Injected):
+        print(f"command: {command._command_data.name}")
+        before = await bench("before (eager)", eager_run, client, command)
+        after = await bench("after (lazy)", lazy_run, client, command)
+        print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Microbenchmark for resolving the dependencies of an invoke method.
+
+Bound copies of a dependency injection wrapper do not keep the resolver function they generate, so before
+resolution plans were cached when the client starts, the resolver for an invoke method was generated - parsing
+the method's signature and compiling the generated code - every time the command was invoked. This compares
+calling an injected invoke method with and without the cached plan.
+
+Run with ``python scripts/benchmarks/di_resolution_plans.py``.
+"""
+
+import asyncio
+import time
+from unittest import mock
+
+import lightbulb
+
+N_INVOCATIONS = 20_000
+
+
+class Database: ...
+
+
+class Cache: ...
+
+
+class Injected(lightbulb.SlashCommand, name="injected", description="benchmark"):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context, db: Database, cache: Cache | None) -> None: ...
+
+
+async def bench(name: str, client: lightbulb.Client) -> float:
+    context = lightbulb.Context(client, mock.Mock(), [], Injected(), mock.Mock())
+
+    before = time.perf_counter()
+    for _ in range(N_INVOCATIONS):
+        await client._execute_command_pipeline(context)
+    elapsed = time.perf_counter() - before
+
+    rate = N_INVOCATIONS / elapsed
+    print(f"{name:>17}: {rate:>12,.0f} invocations/sec ({elapsed * 1e9 / N_INVOCATIONS:,.0f} ns/invocation)")
+    return rate
+
+
+async def main() -> None:
+    client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+    client.execution_step_order = [lightbulb.ExecutionSteps.INVOKE]
+    client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(Database, Database)
+    client.register(Injected)
+
+    before = await bench("before (uncached)", client)
+    await client.start()
+    after = await bench("after (cached)", client)
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Microbenchmark for the per-invocation overhead of the command execution pipeline.
+
+Compares the previous implementation - bucketing the client and command hooks by step for every
+invocation and popping from copies of the step and hook lists - against walking the compiled execution
+plan cached on the client, using 10 global hooks and 5 command hooks. The ``INVOKE`` step is left out of
+the step order so that the measurement is not dominated by the command's invocation method.
+
+Run with ``python scripts/benchmarks/execution_pipeline.py``.
+"""
+
+import asyncio
+import collections
+import time
+import typing as t
+from unittest import mock
+
+import lightbulb
+
+N_GLOBAL_HOOKS = 10
+N_COMMAND_HOOKS = 5
+N_INVOCATIONS = 50_000
+
+STEPS = [
+    lightbulb.ExecutionSteps.MAX_CONCURRENCY,
+    lightbulb.ExecutionSteps.CHECKS,
+    lightbulb.ExecutionSteps.COOLDOWNS,
+    lightbulb.ExecutionSteps.PRE_INVOKE,
+    lightbulb.ExecutionSteps.POST_INVOKE,
+]
+
+
+def make_hook(i: int) -> lightbulb.ExecutionHook:
+    async def func(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None: ...
+
+    return lightbulb.hook(STEPS[i % len(STEPS)], name=f"hook{i}")(func)
+
+
+class Command(
+    lightbulb.SlashCommand,
+    name="command",
+    description="benchmark",
+    hooks=[make_hook(i) for i in range(N_GLOBAL_HOOKS, N_GLOBAL_HOOKS + N_COMMAND_HOOKS)],
+):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+async def legacy_run(context: lightbulb.Context, order: t.Sequence[lightbulb.ExecutionStep]) -> None:
+    remaining = list(order)
+    hooks: dict[lightbulb.ExecutionStep, list[lightbulb.ExecutionHook]] = collections.defaultdict(list)
+    for hook in [*context.client.hooks, *context.command_data.hooks]:
+        hooks[hook.step].append(hook)
+
+    pipeline = mock.Mock()
+    current_step = remaining.pop(0) if remaining else None
+    while current_step is not None:
+        if current_step == lightbulb.ExecutionSteps.INVOKE:
+            await context.command._resolve_options()
+            await getattr(context.command, context.command_data.invoke_method)(context)
+            current_step = remaining.pop(0) if remaining else None
+            continue
+
+        step_hooks = list(hooks.get(current_step, []))
+        while step_hooks:
+            await step_hooks.pop(0)(pipeline, context)
+
+        current_step = remaining.pop(0) if remaining else None
+
+
+async def compiled_run(context: lightbulb.Context, order: t.Sequence[lightbulb.ExecutionStep]) -> None:
+    plan = context.client._execution_plan_for(type(context.command))
+    await lightbulb.ExecutionPipeline(context, order, plan=plan)._run()
+
+
+async def bench(
+    name: str,
+    func: t.Callable[[lightbulb.Context, t.Sequence[lightbulb.ExecutionStep]], t.Awaitable[None]],
+    client: lightbulb.Client,
+) -> float:
+    context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+    order = client.execution_step_order
+
+    before = time.perf_counter()
+    for _ in range(N_INVOCATIONS):
+        await func(context, order)
+    elapsed = time.perf_counter() - before
+
+    rate = N_INVOCATIONS / elapsed
+    print(f"{name:>8}: {rate:>12,.0f} invocations/sec ({elapsed * 1e9 / N_INVOCATIONS:,.0f} ns/invocation)")
+    return rate
+
+
+async def main() -> None:
+    client = lightbulb.client_from_app(
+        mock.Mock(), sync_commands=False, hooks=[make_hook(i) for i in range(N_GLOBAL_HOOKS)]
+    )
+    client.execution_step_order = STEPS
+    print(f"hooks: {N_GLOBAL_HOOKS} global, {N_COMMAND_HOOKS} command")
+
+    before = await bench("before", legacy_run, client)
+    after = await bench("after", compiled_run, client)
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Microbenchmark for the cost of option converters that are never read during an invocation.
+
+Compares a command whose three options all have a converter - standing in for an expensive lookup, such as a
+database query - called before the command is invoked, against the same command using ``lazy_options=True``.
+Each invocation creates a command instance, sets its context, resolves its options and reads only the first
+option, so with lazy options only one of the three converters is called. Each timing is the best of several
+repeats.
+
+Run with ``python scripts/benchmarks/lazy_options.py``.
+"""
+
+import asyncio
+import time
+import types
+import typing as t
+
+import hikari
+
+import lightbulb
+
+N_INVOCATIONS = 2_000
+N_REPEATS = 5
+
+
+def converter(_: lightbulb.Context, value: str) -> int:
+    return sum(range(len(value) * 1_000))
+
+
+class Eager(lightbulb.SlashCommand, name="eager", description="benchmark"):
+    one = lightbulb.string("one", "benchmark", converter=converter)
+    two = lightbulb.string("two", "benchmark", converter=converter)
+    three = lightbulb.string("three", "benchmark", converter=converter)
+
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+class Lazy(lightbulb.SlashCommand, name="lazy", description="benchmark", lazy_options=True):
+    one = lightbulb.string("one", "benchmark", converter=converter)
+    two = lightbulb.string("two", "benchmark", converter=converter)
+    three = lightbulb.string("three", "benchmark", converter=converter)
+
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+def make_context() -> t.Any:
+    options = [
+        hikari.CommandInteractionOption(name=name, type=hikari.OptionType.STRING, value="value", options=None)
+        for name in ("one", "two", "three")
+    ]
+    return types.SimpleNamespace(options=options, interaction=types.SimpleNamespace(resolved=None))
+
+
+async def bench(name: str, cls: type[t.Any], context: t.Any) -> float:
+    await cls.as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+
+    timings: list[float] = []
+    for _ in range(N_REPEATS):
+        before = time.perf_counter()
+        for _ in range(N_INVOCATIONS):
+            command = cls()
+            command._set_context(context)
+            await command._resolve_options()
+            _ = command.one
+        timings.append(time.perf_counter() - before)
+
+    us = min(timings) * 1e6 / N_INVOCATIONS
+    print(f"{name:>6}: {us:>8,.1f} us/invocation")
+    return us
+
+
+async def main() -> None:
+    context = make_context()
+
+    eager = await bench("eager", Eager, context)
+    lazy = await bench("lazy", Lazy, context)
+    print(f"speedup: {eager / lazy:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
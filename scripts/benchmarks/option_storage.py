@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+Microbenchmark for the allocations and lookup cost of storing resolved option values on command instances.
+
+Compares the previous implementation - a dict of resolved values keyed by option name, created once when the
+command instance is created and again when the context is set, read by each option descriptor using the option's
+name - against storing the values in a list, read by each option descriptor using the slot index assigned when
+the command class was created. Each invocation creates a command instance, sets its context, resolves its five
+options and reads each of them. Each timing is the best of several repeats.
+
+Run with ``python scripts/benchmarks/option_storage.py``.
+"""
+
+import asyncio
+import time
+import tracemalloc
+import types
+import typing as t
+
+import hikari
+
+import lightbulb
+
+N_INVOCATIONS = 20_000
+N_REPEATS = 5
+N_MEMORY_INVOCATIONS = 2_000
+PRIMITIVE_OPTION_TYPES = lightbulb.commands.commands._PRIMITIVE_OPTION_TYPES
+
+
+class Command(lightbulb.SlashCommand, name="command", description="benchmark"):
+    one = lightbulb.string("one", "benchmark")
+    two = lightbulb.string("two", "benchmark")
+    three = lightbulb.integer("three", "benchmark")
+    four = lightbulb.integer("four", "benchmark", default=4)
+    five = lightbulb.boolean("five", "benchmark", default=False)
+
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+class DictOption:
+    __slots__ = ("_data", "_unbound_default")
+
+    def __init__(self, option: lightbulb.commands.Option[t.Any, t.Any]) -> None:
+        self._data = option._data
+        self._unbound_default = option._unbound_default
+
+    def __get__(self, instance: t.Any, owner: type[t.Any]) -> t.Any:
+        if instance is None or getattr(instance, "_current_context", None) is None:
+            return self._unbound_default
+
+        if self._data._localized_name not in instance._resolved_option_cache:
+            raise RuntimeError(f"Tried to access option {self._data._localized_name} before resolving options.")
+
+        return instance._resolved_option_cache[self._data._localized_name]
+
+
+class DictCommand:
+    __slots__ = ("_current_context", "_resolved_option_cache")
+
+    _command_data = Command._command_data
+
+    one = DictOption(Command.__dict__["one"])
+    two = DictOption(Command.__dict__["two"])
+    three = DictOption(Command.__dict__["three"])
+    four = DictOption(Command.__dict__["four"])
+    five = DictOption(Command.__dict__["five"])
+
+    def __new__(cls, *args: t.Any, **kwargs: t.Any) -> "DictCommand":
+        new = super().__new__(cls, *args, **kwargs)
+        new._current_context = None
+        new._resolved_option_cache = {}
+        return new
+
+    def _set_context(self, context: t.Any) -> None:
+        self._current_context = context
+        self._resolved_option_cache = {}
+
+    async def _resolve_options(self) -> None:
+        context = self._current_context
+        assert context is not None
+
+        if len(self._command_data._option_positions) != len(self._command_data.options):
+            self._command_data._index_options()
+
+        positions = self._command_data._option_positions
+        provided: list[t.Any] = [None] * len(positions)
+        for opt in context.options:
+            if (position := positions.get(opt.name)) is not None:
+                provided[position] = opt
+
+        resolved = context.interaction.resolved
+        for option, interaction_option in zip(self._command_data.options.values(), provided):
+            name = option._localized_name
+            if interaction_option is None or (option.type not in PRIMITIVE_OPTION_TYPES and resolved is None):
+                if option.default is hikari.UNDEFINED:
+                    raise ValueError(f"no option resolved and no default provided for option: {name}")
+
+                self._resolved_option_cache[name] = option.default
+                continue
+
+            value = interaction_option.value
+            if option.type in PRIMITIVE_OPTION_TYPES:
+                self._resolved_option_cache[name] = value if option.converter is None else None
+                continue
+
+            raise TypeError("unsupported option type passed")
+
+
+def make_context() -> t.Any:
+    options = [
+        hikari.CommandInteractionOption(name=name, type=type_, value=value, options=None)
+        for name, type_, value in (
+            ("one", hikari.OptionType.STRING, "a"),
+            ("two", hikari.OptionType.STRING, "b"),
+            ("three", hikari.OptionType.INTEGER, 3),
+        )
+    ]
+    return types.SimpleNamespace(options=options, interaction=types.SimpleNamespace(resolved=None))
+
+
+async def invoke(cls: type[t.Any], context: t.Any) -> t.Any:
+    command = cls()
+    command._set_context(context)
+    await command._resolve_options()
+    _ = (command.one, command.two, command.three, command.four, command.five)
+    return command
+
+
+async def bench(name: str, cls: type[t.Any], context: t.Any) -> tuple[float, float]:
+    timings: list[float] = []
+    for _ in range(N_REPEATS):
+        before = time.perf_counter()
+        for _ in range(N_INVOCATIONS):
+            await invoke(cls, context)
+        timings.append(time.perf_counter() - before)
+
+    # Keep each command instance alive so that the memory retained by its option storage is measured
+    kept: list[t.Any] = []
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for _ in range(N_MEMORY_INVOCATIONS):
+        kept.append(await invoke(cls, context))
+    retained = (tracemalloc.get_traced_memory()[0] - start) / N_MEMORY_INVOCATIONS
+    tracemalloc.stop()
+
+    ns = min(timings) * 1e9 / N_INVOCATIONS
+    print(f"{name:>15}: {ns:>8,.0f} ns/invocation, {retained:>6,.0f} bytes retained per command instance")
+    return ns, retained
+
+
+async def main() -> None:
+    await Command.as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+    context = make_context()
+
+    before_ns, before_bytes = await bench("before (dict)", DictCommand, context)
+    after_ns, after_bytes = await bench("after (slots)", Command, context)
+    print(f"speedup: {before_ns / after_ns:.2f}x, memory: {after_bytes / before_bytes:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
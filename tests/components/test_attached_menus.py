@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+from unittest import mock
+
+import hikari
+
+import lightbulb
+from lightbulb.components import menus
+
+
+class Menu(lightbulb.components.Menu):
+    def __init__(self, custom_id: str) -> None:
+        self.button = self.add_interactive_button(
+            hikari.ButtonStyle.PRIMARY, self.on_press, label="button", custom_id=custom_id
+        )
+
+    async def on_press(self, ctx: lightbulb.components.MenuContext) -> None: ...
+
+
+def make_handler(client: lightbulb.Client, custom_id: str) -> menus._MenuInteractionHandlerContainer:
+    return menus._MenuInteractionHandlerContainer(client, Menu(custom_id), None, asyncio.Event(), None)
+
+
+class TestAttachedMenus:
+    def test_most_recently_attached_menu_receives_interactions(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        first, second = make_handler(client, "foo"), make_handler(client, "foo")
+
+        first._attach()
+        second._attach()
+
+        assert client._attached_menu("foo") is second
+
+    def test_earlier_menu_receives_interactions_after_later_menu_detached(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        first, second = make_handler(client, "foo"), make_handler(client, "foo")
+
+        first._attach()
+        second._attach()
+        second._detach()
+
+        assert client._attached_menu("foo") is first
+
+    def test_later_menu_still_receives_interactions_after_earlier_menu_detached(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        first, second = make_handler(client, "foo"), make_handler(client, "foo")
+
+        first._attach()
+        second._attach()
+        first._detach()
+
+        assert client._attached_menu("foo") is second
+
+    def test_custom_id_removed_when_last_menu_detached(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        handler = make_handler(client, "foo")
+
+        handler._attach()
+        handler._detach()
+
+        assert "foo" not in client._attached_menus
+        assert client._attached_menu("foo") is None
+
+    def test_attaching_twice_does_not_duplicate_menu(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        handler = make_handler(client, "foo")
+
+        handler._attach()
+        handler._attach()
+        handler._detach()
+
+        assert client._attached_menu("foo") is None
+
+    def test_detaching_unattached_menu_does_nothing(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        first, second = make_handler(client, "foo"), make_handler(client, "foo")
+
+        first._attach()
+        second._detach()
+
+        assert client._attached_menu("foo") is first
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from unittest import mock
+
+import pytest
+
+from lightbulb.components import routes
+
+
+class TestComponentRouter:
+    @pytest.fixture(scope="function")
+    def router(self) -> routes.ComponentRouter:
+        return routes.ComponentRouter()
+
+    def test_resolves_literal_pattern(self, router: routes.ComponentRouter) -> None:
+        handler = mock.AsyncMock()
+        router.add("ticket:close", handler)
+
+        assert router.resolve("ticket:close") == (handler, "ticket:close", {})
+
+    def test_resolves_parameters(self, router: routes.ComponentRouter) -> None:
+        handler = mock.AsyncMock()
+        router.add("ticket:{action}:{ticket_id}", handler)
+
+        assert router.resolve("ticket:close:123") == (
+            handler,
+            "ticket:{action}:{ticket_id}",
+            {"action": "close", "ticket_id": "123"},
+        )
+
+    @pytest.mark.parametrize("custom_id", ["ticket", "ticket:close:123:456", "other:close:123", ""])
+    def test_returns_none_when_no_pattern_matches(self, router: routes.ComponentRouter, custom_id: str) -> None:
+        router.add("ticket:close:{ticket_id}", mock.AsyncMock())
+
+        assert router.resolve(custom_id) is None
+
+    def test_literal_takes_precedence_over_parameter(self, router: routes.ComponentRouter) -> None:
+        literal, parameter = mock.AsyncMock(), mock.AsyncMock()
+        router.add("ticket:close:{ticket_id}", parameter)
+        router.add("ticket:close:all", literal)
+
+        assert router.resolve("ticket:close:all") == (literal, "ticket:close:all", {})
+        assert router.resolve("ticket:close:1") == (parameter, "ticket:close:{ticket_id}", {"ticket_id": "1"})
+
+    def test_falls_back_to_parameter_when_literal_branch_does_not_match(self, router: routes.ComponentRouter) -> None:
+        literal, parameter = mock.AsyncMock(), mock.AsyncMock()
+        router.add("ticket:close:all", literal)
+        router.add("ticket:{action}:{ticket_id}", parameter)
+
+        assert router.resolve("ticket:close:1") == (
+            parameter,
+            "ticket:{action}:{ticket_id}",
+            {"action": "close", "ticket_id": "1"},
+        )
+
+    def test_adding_duplicate_pattern_raises(self, router: routes.ComponentRouter) -> None:
+        router.add("ticket:{ticket_id}", mock.AsyncMock())
+
+        with pytest.raises(ValueError):
+            router.add("ticket:{ticket_id}", mock.AsyncMock())
+
+    def test_adding_conflicting_parameter_name_raises(self, router: routes.ComponentRouter) -> None:
+        router.add("ticket:{ticket_id}", mock.AsyncMock())
+
+        with pytest.raises(ValueError):
+            router.add("ticket:{id}:close", mock.AsyncMock())
+
+    @pytest.mark.parametrize("pattern", ["ticket:id_{ticket_id}", "ticket:{ticket_id", "{a}:{a}"])
+    def test_adding_invalid_pattern_raises(self, router: routes.ComponentRouter, pattern: str) -> None:
+        with pytest.raises(ValueError):
+            router.add(pattern, mock.AsyncMock())
+
+    def test_remove_prunes_empty_branches(self, router: routes.ComponentRouter) -> None:
+        handler = mock.AsyncMock()
+        router.add("ticket:close:{ticket_id}", handler)
+
+        assert router.remove("ticket:close:{ticket_id}") is handler
+        assert router.resolve("ticket:close:1") is None
+        # pattern with a different parameter name can now be added at the same position
+        router.add("ticket:close:{id}", handler)
+
+    def test_remove_keeps_other_handlers(self, router: routes.ComponentRouter) -> None:
+        first, second = mock.AsyncMock(), mock.AsyncMock()
+        router.add("ticket:close", first)
+        router.add("ticket:close:{ticket_id}", second)
+
+        router.remove("ticket:close")
+
+        assert router.resolve("ticket:close") is None
+        assert router.get("ticket:close:{ticket_id}") is second
+
+    def test_remove_unknown_pattern_returns_none(self, router: routes.ComponentRouter) -> None:
+        router.add("ticket:{ticket_id}", mock.AsyncMock())
+
+        assert router.remove("ticket:{id}") is None
+        assert router.remove("other") is None
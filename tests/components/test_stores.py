@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import pathlib
+import typing as t
+from collections.abc import Mapping
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+from lightbulb.components import menus
+from lightbulb.components import stores
+
+
+class CounterMenu(lightbulb.components.Menu):
+    def __init__(self, presses: int = 0) -> None:
+        self.presses = presses
+        self.button = self.add_interactive_button(hikari.ButtonStyle.PRIMARY, self.on_press, label="+1")
+        self.add_link_button("https://example.com", label="link")
+        self.select = self.add_text_select(["a", "stop"], self.on_select)
+
+    async def on_press(self, ctx: lightbulb.components.MenuContext) -> None:
+        self.presses += 1
+
+    async def on_select(self, ctx: lightbulb.components.MenuContext) -> None:
+        if "stop" in ctx.selected_values_for(self.select):
+            ctx.stop_interacting()
+
+    def to_state(self) -> dict[str, int]:
+        return {"presses": self.presses}
+
+    @classmethod
+    def from_state(cls, state: Mapping[str, t.Any]) -> "CounterMenu":
+        return cls(state["presses"])
+
+
+class ObservedMenuStore(stores.MenuStore):
+    """Wraps a store, setting an event each time a record is saved or deleted by a background task."""
+
+    __slots__ = ("_store", "deleted", "release_saves", "saved", "saves", "saving")
+
+    def __init__(self, store: stores.MenuStore) -> None:
+        self._store = store
+        self.saved = asyncio.Event()
+        self.deleted = asyncio.Event()
+        self.saving = asyncio.Event()
+        self.release_saves = asyncio.Event()
+        self.release_saves.set()
+        self.saves = 0
+
+    async def save(self, record: stores.MenuRecord) -> None:
+        self.saves += 1
+        self.saving.set()
+        await self.release_saves.wait()
+        await self._store.save(record)
+        self.saved.set()
+
+    async def get(self, custom_id: str) -> stores.MenuRecord | None:
+        return await self._store.get(custom_id)
+
+    async def delete(self, menu_id: str) -> None:
+        await self._store.delete(menu_id)
+        self.deleted.set()
+
+    async def close(self) -> None:
+        await self._store.close()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request: pytest.FixtureRequest, tmp_path: pathlib.Path) -> stores.MenuStore:
+    if request.param == "memory":
+        return stores.InMemoryMenuStore()
+    return stores.SQLiteMenuStore(tmp_path / "menus.db")
+
+
+class TestMenuStore:
+    @pytest.mark.asyncio
+    async def test_get_returns_saved_record_for_any_custom_id(self, store: stores.MenuStore) -> None:
+        record = stores.MenuRecord("menu", "module:Menu", ["a", "b"], {"foo": [1, 2]})
+        await store.save(record)
+
+        for custom_id in ("a", "b"):
+            fetched = await store.get(custom_id)
+            assert fetched is not None
+            assert (fetched.menu_id, fetched.menu_type, list(fetched.custom_ids), dict(fetched.state)) == (
+                "menu",
+                "module:Menu",
+                ["a", "b"],
+                {"foo": [1, 2]},
+            )
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_save_replaces_existing_record(self, store: stores.MenuStore) -> None:
+        await store.save(stores.MenuRecord("menu", "module:Menu", ["a", "b"], {}))
+        await store.save(stores.MenuRecord("menu", "module:Menu", ["c"], {"x": 1}))
+
+        assert await store.get("a") is None
+        fetched = await store.get("c")
+        assert fetched is not None and fetched.state == {"x": 1}
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_record(self, store: stores.MenuStore) -> None:
+        await store.save(stores.MenuRecord("menu", "module:Menu", ["a"], {}))
+        await store.delete("menu")
+        await store.delete("unknown")
+
+        assert await store.get("a") is None
+        await store.close()
+
+
+class TestMenuRehydration:
+    @staticmethod
+    def make_interaction(custom_id: str, *values: str) -> hikari.ComponentInteraction:
+        interaction = mock.Mock(spec=hikari.ComponentInteraction)
+        interaction.custom_id = custom_id
+        interaction.values = values
+        return interaction
+
+    @pytest.mark.asyncio
+    async def test_persisted_menu_is_rebuilt_on_first_interaction(self, store: stores.MenuStore) -> None:
+        store = ObservedMenuStore(store)
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, menu_store=store)
+        client._started = True
+
+        menu = CounterMenu(5)
+        menu.attach_persistent(client, timeout=None, persist=True)
+        await asyncio.wait_for(store.saved.wait(), 1)
+
+        # Simulate a restart
+        restarted = lightbulb.client_from_app(mock.Mock(), sync_commands=False, menu_store=store)
+        restarted._started = True
+
+        await restarted.handle_component_interaction(self.make_interaction(menu.button.custom_id), asyncio.Event())
+        handler = restarted._attached_menu(menu.button.custom_id)
+        assert handler is not None
+        rebuilt = handler._menu
+        assert isinstance(rebuilt, CounterMenu) and rebuilt is not menu
+        assert rebuilt.presses == 6
+        assert rebuilt.select.custom_id == menu.select.custom_id
+
+        record = await store.get(menu.button.custom_id)
+        assert record is not None and record.state == {"presses": 6}
+
+        await restarted.handle_component_interaction(
+            self.make_interaction(menu.select.custom_id, "stop"), asyncio.Event()
+        )
+        await asyncio.wait_for(store.deleted.wait(), 1)
+        assert menu.button.custom_id not in restarted._attached_menus
+        assert await store.get(menu.button.custom_id) is None
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_menu_not_saved_when_state_unchanged(self) -> None:
+        store = ObservedMenuStore(stores.InMemoryMenuStore())
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, menu_store=store)
+        client._started = True
+
+        menu = CounterMenu()
+        menu.attach_persistent(client, timeout=None, persist=True)
+        await asyncio.wait_for(store.saved.wait(), 1)
+
+        await client.handle_component_interaction(self.make_interaction(menu.select.custom_id, "a"), asyncio.Event())
+        assert store.saves == 1
+
+        await client.handle_component_interaction(self.make_interaction(menu.button.custom_id), asyncio.Event())
+        assert store.saves == 2
+
+        # A menu rebuilt after a restart is not saved until its state changes
+        restarted = lightbulb.client_from_app(mock.Mock(), sync_commands=False, menu_store=store)
+        restarted._started = True
+        await restarted.handle_component_interaction(self.make_interaction(menu.select.custom_id, "a"), asyncio.Event())
+        assert store.saves == 2
+
+    @pytest.mark.asyncio
+    async def test_stopped_menu_not_restored_by_pending_save(self, store: stores.MenuStore) -> None:
+        store = ObservedMenuStore(store)
+        store.release_saves.clear()
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, menu_store=store)
+        client._started = True
+
+        menu = CounterMenu()
+        handle = menu.attach_persistent(client, timeout=None, persist=True)
+        # Let the save start before the menu is stopped
+        await asyncio.wait_for(store.saving.wait(), 1)
+        handle.stop_interacting()
+
+        await asyncio.sleep(0.01)
+        store.release_saves.set()
+        await asyncio.wait_for(store.deleted.wait(), 1)
+        await asyncio.sleep(0)
+        assert not client._menu_writes
+        assert await store.get(menu.button.custom_id) is None
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_saves_finished_before_store_closed(self) -> None:
+        store = ObservedMenuStore(stores.InMemoryMenuStore())
+        store.release_saves.clear()
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, menu_store=store)
+        client._started = True
+
+        menu = CounterMenu()
+        menu.attach_persistent(client, timeout=None, persist=True)
+        await asyncio.wait_for(store.saving.wait(), 1)
+
+        asyncio.get_running_loop().call_later(0.01, store.release_saves.set)
+        await client.stop()
+
+        assert store.saved.is_set()
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_menu_is_evicted(self) -> None:
+        store = stores.InMemoryMenuStore()
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, menu_store=store, max_rehydrated_menus=2)
+        client._started = True
+
+        created = [CounterMenu() for _ in range(3)]
+        for menu in created:
+            handler = menus._MenuInteractionHandlerContainer(client, menu, None, asyncio.Event(), None, str(id(menu)))
+            await handler._persist()
+
+        for menu in created:
+            await client.handle_component_interaction(self.make_interaction(menu.button.custom_id), asyncio.Event())
+
+        assert created[0].button.custom_id not in client._attached_menus
+        assert all(menu.button.custom_id in client._attached_menus for menu in created[1:])
+        assert len(client._rehydrated_menus) == 2
+
+    def test_persist_requires_no_timeout(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, menu_store=stores.InMemoryMenuStore())
+
+        with pytest.raises(ValueError):
+            CounterMenu().attach_persistent(client, timeout=30, persist=True)
+
+    def test_persist_requires_menu_store(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        with pytest.raises(RuntimeError):
+            CounterMenu().attach_persistent(client, timeout=None, persist=True)
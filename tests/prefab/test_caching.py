@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import typing as t
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+from lightbulb.prefab import caching
+
+
+def _invocation(
+    client: lightbulb.Client, command: type[lightbulb.SlashCommand], guild_id: int = 1, value: str = "foo"
+) -> lightbulb.Context:
+    interaction = mock.AsyncMock(guild_id=hikari.Snowflake(guild_id))
+    option = mock.Mock(value=value)
+    option.name = "value"
+    return lightbulb.Context(client, interaction, [option], command(), asyncio.Event())
+
+
+class TestResponseCache:
+    def test_least_recently_used_response_is_evicted(self) -> None:
+        cache = caching.ResponseCache(max_size=2)
+        cache._put(("a",), [], 10)
+        cache._put(("b",), [], 10)
+        cache._get(("a",))
+        cache._put(("c",), [], 10)
+
+        assert cache._get(("a",)) is not None
+        assert cache._get(("b",)) is None
+        assert cache._get(("c",)) is not None
+
+    def test_expired_response_is_not_returned(self) -> None:
+        cache = caching.ResponseCache()
+        with mock.patch("time.monotonic", side_effect=[0, 5, 11]):
+            cache._put(("a",), [], 10)
+            assert cache._get(("a",)) is not None
+            assert cache._get(("a",)) is None
+
+        assert len(cache) == 0
+
+    def test_invalidate_by_prefix(self) -> None:
+        cache = caching.ResponseCache()
+        cache._put(("leaderboard", 1, ("page", 1)), [], 10)
+        cache._put(("leaderboard", 1), [], 10)
+        cache._put(("leaderboard", 2), [], 10)
+        cache._put(("stats", 1), [], 10)
+
+        assert cache.invalidate("leaderboard", 1) == 2
+        assert cache.invalidate("leaderboard") == 1
+        assert len(cache) == 1
+
+
+class TestCachedResponse:
+    @pytest.mark.asyncio
+    async def test_response_replayed_without_invoking(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        cache = caching.ResponseCache()
+        invocations = 0
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*caching.cached_response(60, "guild", cache=cache)],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                nonlocal invocations
+                invocations += 1
+                await ctx.respond("foo", ephemeral=True)
+                await ctx.respond("bar")
+
+        first = _invocation(client, Command)
+        await client._execute_command_context(first)
+        second = _invocation(client, Command)
+        await client._execute_command_context(second)
+
+        assert invocations == 1
+        assert cache.hits == 1 and cache.misses == 1
+        interaction: mock.AsyncMock = second.interaction  # type: ignore[reportAssignmentType]
+        interaction.create_initial_response.assert_awaited_once()
+        assert interaction.create_initial_response.await_args.args[1] == "foo"
+        assert interaction.create_initial_response.await_args.kwargs["flags"] == hikari.MessageFlag.EPHEMERAL
+        interaction.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_responses_keyed_by_bucket_and_options(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        cache = caching.ResponseCache()
+        invocations = 0
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*caching.cached_response(60, "guild", cache=cache)],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                nonlocal invocations
+                invocations += 1
+                await ctx.respond("foo")
+
+        for guild_id, value in [(1, "foo"), (2, "foo"), (1, "bar"), (1, "foo")]:
+            await client._execute_command_context(_invocation(client, Command, guild_id, value))
+
+        assert invocations == 3
+        assert cache.invalidate("command", 1) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_invocation_not_cached(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        cache = caching.ResponseCache()
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*caching.cached_response(60, cache=cache)],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                await ctx.respond("foo")
+                raise RuntimeError
+
+        await client._execute_command_context(_invocation(client, Command))
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"attachment": hikari.Bytes(b"data", "file.txt")},
+            {"attachments": [hikari.URL("https://example.com/a.png"), hikari.Bytes(b"data", "file.txt")]},
+            {"embed": hikari.Embed().set_image(hikari.Bytes(b"data", "image.png"))},
+            {"embeds": [hikari.Embed().set_footer("footer", icon=hikari.Bytes(b"data", "icon.png"))]},
+        ],
+    )
+    async def test_responses_uploading_files_not_cached(self, kwargs: dict[str, t.Any]) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        cache = caching.ResponseCache()
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*caching.cached_response(60, cache=cache)],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                await ctx.respond("foo")
+                await ctx.respond("bar", **kwargs)
+
+        await client._execute_command_context(_invocation(client, Command))
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_responses_with_urls_cached(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        cache = caching.ResponseCache()
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*caching.cached_response(60, cache=cache)],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                await ctx.respond(
+                    "foo",
+                    attachment=hikari.URL("https://example.com/a.png"),
+                    embed=hikari.Embed().set_image("https://example.com/b.png"),
+                )
+
+        await client._execute_command_context(_invocation(client, Command))
+
+        assert len(cache) == 1
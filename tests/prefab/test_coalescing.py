@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+from lightbulb.prefab import coalescing
+
+
+def _invocation(client: lightbulb.Client, command: type[lightbulb.SlashCommand], value: str) -> lightbulb.Context:
+    option = mock.Mock(value=value)
+    option.name = "value"
+    return lightbulb.Context(client, mock.AsyncMock(guild_id=hikari.Snowflake(1)), [option], command(), asyncio.Event())
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_invocations_share_one_invoke(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        release = asyncio.Event()
+        invocations: list[str] = []
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*coalescing.single_flight("guild")],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                invocations.append(ctx.options[0].value)  # type: ignore[reportArgumentType]
+                await release.wait()
+                await ctx.respond(f"result {ctx.options[0].value}")
+
+        contexts = [_invocation(client, Command, value) for value in ["foo", "foo", "foo", "bar"]]
+        tasks = [asyncio.create_task(client._execute_command_context(ctx)) for ctx in contexts]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert sorted(invocations) == ["bar", "foo"]
+        for ctx, value in zip(contexts, ["foo", "foo", "foo", "bar"]):
+            interaction: mock.AsyncMock = ctx.interaction  # type: ignore[reportAssignmentType]
+            interaction.create_initial_response.assert_awaited_once()
+            assert interaction.create_initial_response.await_args.args[1] == f"result {value}"
+
+    @pytest.mark.asyncio
+    async def test_waiting_invocation_takes_over_when_first_fails(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        release = asyncio.Event()
+        invocations = 0
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*coalescing.single_flight()],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                nonlocal invocations
+                invocations += 1
+                if invocations == 1:
+                    await release.wait()
+                    raise RuntimeError
+                await ctx.respond("foo")
+
+        contexts = [_invocation(client, Command, "foo") for _ in range(3)]
+        tasks = [asyncio.create_task(client._execute_command_context(ctx)) for ctx in contexts]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert invocations == 2
+        for ctx in contexts[1:]:
+            interaction: mock.AsyncMock = ctx.interaction  # type: ignore[reportAssignmentType]
+            assert interaction.create_initial_response.await_args.args[1] == "foo"
+
+    @pytest.mark.asyncio
+    async def test_waiting_invocations_deferred_when_first_defers(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        deferred = asyncio.Event()
+        release = asyncio.Event()
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*coalescing.single_flight()],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                await ctx.defer(ephemeral=True)
+                deferred.set()
+                await release.wait()
+                await ctx.respond("foo", ephemeral=True)
+
+        contexts = [_invocation(client, Command, "foo") for _ in range(2)]
+        tasks = [asyncio.create_task(client._execute_command_context(ctx)) for ctx in contexts]
+        await asyncio.wait_for(deferred.wait(), timeout=1)
+        await asyncio.sleep(0.01)
+
+        waiting: mock.AsyncMock = contexts[1].interaction  # type: ignore[reportAssignmentType]
+        waiting.create_initial_response.assert_awaited_once()
+        assert waiting.create_initial_response.await_args.args[0] == hikari.ResponseType.DEFERRED_MESSAGE_CREATE
+        assert waiting.create_initial_response.await_args.kwargs["flags"] == hikari.MessageFlag.EPHEMERAL
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        waiting.create_initial_response.assert_awaited_once()
+        waiting.execute.assert_awaited_once()
+        assert waiting.execute.await_args.args[0] == "foo"
+
+    @pytest.mark.asyncio
+    async def test_waiting_invocations_not_deferred_before_first_responds(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        release = asyncio.Event()
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*coalescing.single_flight()],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                await release.wait()
+                await ctx.respond("foo")
+
+        contexts = [_invocation(client, Command, "foo") for _ in range(2)]
+        tasks = [asyncio.create_task(client._execute_command_context(ctx)) for ctx in contexts]
+        await asyncio.sleep(0.01)
+
+        waiting: mock.AsyncMock = contexts[1].interaction  # type: ignore[reportAssignmentType]
+        waiting.create_initial_response.assert_not_awaited()
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        waiting.create_initial_response.assert_awaited_once()
+        assert waiting.create_initial_response.await_args.args[1] == "foo"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_invocation_releases_waiting_invocations(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        invocations = 0
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*coalescing.single_flight()],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                nonlocal invocations
+                invocations += 1
+                if invocations == 1:
+                    await asyncio.Event().wait()
+                await ctx.respond("foo")
+
+        first = asyncio.create_task(client._execute_command_context(_invocation(client, Command, "foo")))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(client._execute_command_context(_invocation(client, Command, "foo")))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        await asyncio.wait_for(second, timeout=1)
+        assert invocations == 2
+
+    @pytest.mark.asyncio
+    async def test_waiting_invocations_invoke_when_responses_upload_files(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        release = asyncio.Event()
+        invocations = 0
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[*coalescing.single_flight()],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                nonlocal invocations
+                invocations += 1
+                await release.wait()
+                await ctx.respond("foo", attachment=hikari.Bytes(b"data", "file.txt"))
+
+        contexts = [_invocation(client, Command, "foo") for _ in range(3)]
+        tasks = [asyncio.create_task(client._execute_command_context(ctx)) for ctx in contexts]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+
+        assert invocations == 3
+        for ctx in contexts:
+            interaction: mock.AsyncMock = ctx.interaction  # type: ignore[reportAssignmentType]
+            interaction.create_initial_response.assert_awaited_once()
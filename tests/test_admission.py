@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import time
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+from lightbulb import admission
+
+
+def make_controller(max_concurrency: int = 1, max_queued: int = 1, **kwargs: object) -> admission.AdmissionController:
+    return admission.AdmissionController(
+        {admission.Lane.COMMAND: admission.LaneLimits(max_concurrency, max_queued)},
+        **kwargs,  # type: ignore[reportArgumentType]
+    )
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_admits_up_to_max_concurrency_without_waiting(self) -> None:
+        controller = make_controller(max_concurrency=2)
+
+        assert await controller.acquire(admission.Lane.COMMAND)
+        assert await controller.acquire(admission.Lane.COMMAND)
+        assert controller.stats[admission.Lane.COMMAND].running == 2
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_queue_is_full(self) -> None:
+        controller = make_controller(max_concurrency=1, max_queued=1)
+        assert await controller.acquire(admission.Lane.COMMAND)
+
+        waiter = asyncio.create_task(controller.acquire(admission.Lane.COMMAND))
+        await asyncio.sleep(0)
+        assert controller.stats[admission.Lane.COMMAND].queued == 1
+
+        assert not await controller.acquire(admission.Lane.COMMAND)
+        assert controller.stats[admission.Lane.COMMAND].shed == 1
+
+        controller.release(admission.Lane.COMMAND, 0.1)
+        assert await waiter
+        assert controller.stats[admission.Lane.COMMAND].admitted == 2
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_estimated_wait_exceeds_deadline(self) -> None:
+        controller = make_controller(max_concurrency=1, max_queued=10, smoothing=1)
+        assert await controller.acquire(admission.Lane.COMMAND)
+        controller.release(admission.Lane.COMMAND, 5)
+        assert await controller.acquire(admission.Lane.COMMAND)
+
+        assert controller.estimated_wait(admission.Lane.COMMAND) == 5
+        assert not await controller.acquire(admission.Lane.COMMAND)
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_deadline_exceeded_while_queued(self) -> None:
+        controller = make_controller(max_concurrency=1, max_queued=10, deadline=0.01)
+        assert await controller.acquire(admission.Lane.COMMAND)
+
+        assert not await controller.acquire(admission.Lane.COMMAND)
+        assert controller.stats[admission.Lane.COMMAND].queued == 0
+        assert controller.stats[admission.Lane.COMMAND].shed == 1
+
+    @pytest.mark.asyncio
+    async def test_queued_interaction_rejected_before_deadline(self) -> None:
+        controller = make_controller(max_concurrency=1, max_queued=10, deadline=0.5, response_margin=0.45)
+        assert await controller.acquire(admission.Lane.COMMAND)
+
+        started = time.monotonic()
+        assert not await controller.acquire(admission.Lane.COMMAND)
+        assert time.monotonic() - started < 0.4
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_estimated_wait_exceeds_max_queue_wait(self) -> None:
+        controller = make_controller(max_concurrency=1, max_queued=10, smoothing=1)
+        assert await controller.acquire(admission.Lane.COMMAND)
+        controller.release(admission.Lane.COMMAND, 2.8)
+        assert await controller.acquire(admission.Lane.COMMAND)
+
+        assert controller.max_queue_wait == pytest.approx(2.5)
+        assert not await controller.acquire(admission.Lane.COMMAND)
+
+    @pytest.mark.asyncio
+    async def test_client_records_time_slot_is_held_as_service_time(self) -> None:
+        controller = make_controller(smoothing=1)
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, admission_controller=controller)
+
+        async def dispatch(_: hikari.PartialInteraction, initial_response_sent: asyncio.Event) -> None:
+            initial_response_sent.set()
+            await asyncio.sleep(0.2)
+
+        with mock.patch.object(lightbulb.Client, "_dispatch_interaction", side_effect=dispatch, autospec=False):
+            await client.handle_interaction_create(mock.Mock(spec=hikari.CommandInteraction))
+
+        assert controller.stats[admission.Lane.COMMAND].average_service_time >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_client_sheds_immediately_behind_work_after_response(self) -> None:
+        controller = make_controller(max_concurrency=1, max_queued=10, smoothing=1, deadline=0.5, response_margin=0.1)
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, admission_controller=controller)
+
+        async def dispatch(_: hikari.PartialInteraction, initial_response_sent: asyncio.Event) -> None:
+            initial_response_sent.set()
+            await asyncio.sleep(0.5)
+
+        with mock.patch.object(lightbulb.Client, "_dispatch_interaction", side_effect=dispatch, autospec=False):
+            await client.handle_interaction_create(mock.Mock(spec=hikari.CommandInteraction))
+            running = asyncio.create_task(client.handle_interaction_create(mock.Mock(spec=hikari.CommandInteraction)))
+            await asyncio.sleep(0)
+
+            started = time.monotonic()
+            await client.handle_interaction_create(mock.Mock(spec=hikari.CommandInteraction))
+            assert time.monotonic() - started < 0.1
+            await running
+
+        assert controller.stats[admission.Lane.COMMAND].shed == 1
+
+    def test_lanes_use_default_limits_when_unspecified(self) -> None:
+        controller = make_controller()
+
+        assert controller.stats.keys() == set(admission.Lane)
+        assert controller.estimated_wait(admission.Lane.AUTOCOMPLETE) == 0
+
+    def test_invalid_smoothing_raises(self) -> None:
+        with pytest.raises(ValueError):
+            admission.AdmissionController(smoothing=0)
+
+    @pytest.mark.asyncio
+    async def test_reject_responds_to_autocomplete_with_no_choices(self) -> None:
+        interaction = mock.Mock(spec=hikari.AutocompleteInteraction)
+        event = asyncio.Event()
+
+        await make_controller().reject(interaction, event)
+
+        interaction.create_response.assert_awaited_once_with(())
+        assert event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_reject_sends_busy_message(self) -> None:
+        interaction = mock.Mock(spec=hikari.CommandInteraction)
+        event = asyncio.Event()
+
+        await make_controller(busy_message="busy").reject(interaction, event)
+
+        interaction.create_initial_response.assert_awaited_once_with(
+            hikari.ResponseType.MESSAGE_CREATE, "busy", flags=hikari.MessageFlag.EPHEMERAL
+        )
+        assert event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_reject_does_not_respond_without_busy_message(self) -> None:
+        interaction = mock.Mock(spec=hikari.ComponentInteraction)
+        event = asyncio.Event()
+
+        await make_controller().reject(interaction, event)
+
+        interaction.create_initial_response.assert_not_called()
+        assert not event.is_set()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+
+
+def make_interaction(value: str, guild_id: int = 123) -> mock.Mock:
+    interaction = mock.Mock(spec=hikari.AutocompleteInteraction)
+    interaction.registered_guild_id = None
+    interaction.command_type = hikari.CommandType.SLASH
+    interaction.command_name = "command"
+    interaction.guild_id = guild_id
+    interaction.locale = hikari.Locale.EN_US
+    interaction.options = [
+        mock.Mock(
+            spec=hikari.AutocompleteInteractionOption, type=hikari.OptionType.STRING, is_focused=True, value=value
+        )
+    ]
+    interaction.options[0].name = "option"
+    return interaction
+
+
+class TestAutocompleteCache:
+    @pytest.fixture(scope="function")
+    def provider(self) -> mock.AsyncMock:
+        async def _provider(ctx: lightbulb.AutocompleteContext[str]) -> None:
+            await ctx.respond([str(ctx.focused.value) * 2])
+
+        return mock.AsyncMock(side_effect=_provider)
+
+    async def make_client(self, provider: mock.AsyncMock, cache: lightbulb.AutocompleteCache) -> lightbulb.Client:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", autocomplete=provider, autocomplete_cache=cache)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        await client.start()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_hit_does_not_call_provider(self, provider: mock.AsyncMock) -> None:
+        cache = lightbulb.AutocompleteCache()
+        client = await self.make_client(provider, cache)
+
+        first, second = make_interaction("foo"), make_interaction("foo")
+        await client.handle_autocomplete_interaction(first, asyncio.Event())
+        await client.handle_autocomplete_interaction(second, asyncio.Event())
+
+        assert provider.await_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+        first_choices, second_choices = first.create_response.await_args, second.create_response.await_args
+        assert first_choices is not None and second_choices is not None
+        assert first_choices.args == second_choices.args
+
+    @pytest.mark.asyncio
+    async def test_different_values_are_cached_separately(self, provider: mock.AsyncMock) -> None:
+        cache = lightbulb.AutocompleteCache()
+        client = await self.make_client(provider, cache)
+
+        await client.handle_autocomplete_interaction(make_interaction("foo"), asyncio.Event())
+        await client.handle_autocomplete_interaction(make_interaction("bar"), asyncio.Event())
+
+        assert provider.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_per_guild_caches_separately_for_each_guild(self, provider: mock.AsyncMock) -> None:
+        cache = lightbulb.AutocompleteCache(per_guild=True)
+        client = await self.make_client(provider, cache)
+
+        await client.handle_autocomplete_interaction(make_interaction("foo", 1), asyncio.Event())
+        await client.handle_autocomplete_interaction(make_interaction("foo", 2), asyncio.Event())
+        await client.handle_autocomplete_interaction(make_interaction("foo", 1), asyncio.Event())
+
+        assert provider.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_calls_provider(self, provider: mock.AsyncMock) -> None:
+        cache = lightbulb.AutocompleteCache(ttl=0)
+        client = await self.make_client(provider, cache)
+
+        await client.handle_autocomplete_interaction(make_interaction("foo"), asyncio.Event())
+        await client.handle_autocomplete_interaction(make_interaction("foo"), asyncio.Event())
+
+        assert provider.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, provider: mock.AsyncMock) -> None:
+        cache = lightbulb.AutocompleteCache(max_size=2)
+        client = await self.make_client(provider, cache)
+
+        for value in ("a", "b", "a", "c", "a", "b"):
+            await client.handle_autocomplete_interaction(make_interaction(value), asyncio.Event())
+
+        # 'b' is evicted when 'c' is added, as 'a' was used more recently
+        assert provider.await_count == 4
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import typing as t
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+
+
+def make_interaction(value: str, user_id: int) -> mock.Mock:
+    interaction = mock.Mock(spec=hikari.AutocompleteInteraction)
+    interaction.registered_guild_id = None
+    interaction.command_type = hikari.CommandType.SLASH
+    interaction.command_name = "command"
+    interaction.user.id = hikari.Snowflake(user_id)
+    interaction.options = [
+        mock.Mock(
+            spec=hikari.AutocompleteInteractionOption, type=hikari.OptionType.STRING, is_focused=True, value=value
+        )
+    ]
+    interaction.options[0].name = "option"
+    return interaction
+
+
+class TestAutocompleteCancellation:
+    @pytest.fixture(scope="function")
+    def provider_state(self) -> dict[str, list[str]]:
+        return {"started": [], "completed": []}
+
+    async def make_client(self, provider_state: dict[str, list[str]], app: t.Any = None) -> lightbulb.Client:
+        async def provider(ctx: lightbulb.AutocompleteContext[str]) -> None:
+            value = str(ctx.focused.value)
+            provider_state["started"].append(value)
+            await asyncio.sleep(0.05)
+            provider_state["completed"].append(value)
+            await ctx.respond([value])
+
+        client = lightbulb.client_from_app(app or mock.Mock(), sync_commands=False)
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", autocomplete=provider)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        await client.start()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_newer_interaction_cancels_stale_invocation(self, provider_state: dict[str, list[str]]) -> None:
+        client = await self.make_client(provider_state)
+        stale, latest = make_interaction("f", 1), make_interaction("fo", 1)
+
+        stale_event = asyncio.Event()
+        stale_task = asyncio.create_task(client.handle_autocomplete_interaction(stale, stale_event))
+        await asyncio.sleep(0.01)
+        await client.handle_autocomplete_interaction(latest, asyncio.Event())
+        await stale_task
+
+        assert provider_state == {"started": ["f", "fo"], "completed": ["fo"]}
+        stale.create_response.assert_not_called()
+        latest.create_response.assert_awaited_once()
+        assert client.autocomplete_cancellations == 1
+        assert not client._autocomplete_tasks
+        assert stale_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_superseded_rest_interaction_does_not_wait_for_timeout(
+        self, provider_state: dict[str, list[str]]
+    ) -> None:
+        client = await self.make_client(provider_state, mock.Mock(spec=hikari.RESTBot))
+        assert isinstance(client, lightbulb.RestEnabledClient)
+        stale, latest = make_interaction("f", 1), make_interaction("fo", 1)
+
+        async def handle(interaction: hikari.PartialInteraction) -> None:
+            async for _ in client.handle_rest_interaction(interaction):
+                pass
+
+        stale_task = asyncio.create_task(handle(stale))
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(asyncio.gather(handle(latest), stale_task), 1)
+
+        stale.create_response.assert_not_called()
+        latest.create_response.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_interactions_from_different_users_are_not_cancelled(
+        self, provider_state: dict[str, list[str]]
+    ) -> None:
+        client = await self.make_client(provider_state)
+
+        await asyncio.gather(
+            client.handle_autocomplete_interaction(make_interaction("a", 1), asyncio.Event()),
+            client.handle_autocomplete_interaction(make_interaction("b", 2), asyncio.Event()),
+        )
+
+        assert sorted(provider_state["completed"]) == ["a", "b"]
+        assert client.autocomplete_cancellations == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_handler_cancels_provider(self, provider_state: dict[str, list[str]]) -> None:
+        client = await self.make_client(provider_state)
+
+        task = asyncio.create_task(client.handle_autocomplete_interaction(make_interaction("a", 1), asyncio.Event()))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.06)
+
+        assert provider_state == {"started": ["a"], "completed": []}
+        assert client.autocomplete_cancellations == 0
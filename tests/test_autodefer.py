@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import typing as t
+from unittest import mock
+
+import pytest
+
+import lightbulb
+from lightbulb import autodefer
+from lightbulb.internal import responses
+
+
+def make_context(name: str = "command") -> mock.Mock:
+    context = mock.Mock(spec=lightbulb.Context)
+    context.command_data.qualified_name = name
+    context.initial_response_sent = responses.ResponseEvent()
+    context.client.safe_create_task.side_effect = asyncio.create_task
+    return context
+
+
+def set_response_sent(context: mock.Mock) -> t.Callable[..., None]:
+    def defer(**_: t.Any) -> None:
+        context.initial_response_sent.set()
+
+    return defer
+
+
+class TestAutoDeferrer:
+    def test_predicted_latency_requires_min_samples(self) -> None:
+        deferrer = autodefer.AutoDeferrer(min_samples=2, smoothing=0.5)
+        deferrer.record("command", 1)
+        assert deferrer.predicted_latency("command") is None
+
+        deferrer.record("command", 3)
+        assert deferrer.predicted_latency("command") == 2
+        assert deferrer.predicted_latency("other") is None
+
+    def test_invalid_smoothing_raises(self) -> None:
+        with pytest.raises(ValueError):
+            autodefer.AutoDeferrer(smoothing=1.5)
+
+    @pytest.mark.asyncio
+    async def test_defers_immediately_when_predicted_latency_exceeds_threshold(self) -> None:
+        deferrer = autodefer.AutoDeferrer(threshold=1, min_samples=1, ephemeral=True)
+        deferrer.record("command", 5)
+        context = make_context()
+
+        async with deferrer.watch(context):
+            context.defer.assert_awaited_once_with(ephemeral=True)
+
+    @pytest.mark.asyncio
+    async def test_defers_when_timer_expires(self) -> None:
+        deferrer = autodefer.AutoDeferrer(timeout=0.01)
+        context = make_context()
+
+        async with deferrer.watch(context):
+            await asyncio.sleep(0.05)
+
+        context.defer.assert_awaited_once_with(ephemeral=False)
+
+    @pytest.mark.asyncio
+    async def test_does_not_defer_fast_commands(self) -> None:
+        deferrer = autodefer.AutoDeferrer(timeout=0.05)
+        context = make_context()
+
+        async with deferrer.watch(context):
+            pass
+        await asyncio.sleep(0.1)
+
+        context.defer.assert_not_called()
+        assert deferrer.estimates["command"].samples == 1
+
+    @pytest.mark.asyncio
+    async def test_records_time_until_initial_response(self) -> None:
+        deferrer = autodefer.AutoDeferrer(timeout=1)
+        context = make_context()
+
+        async with deferrer.watch(context):
+            context.initial_response_sent.set()
+            await asyncio.sleep(0.1)
+
+        assert deferrer.estimates["command"].average < 0.05
+
+    @pytest.mark.asyncio
+    async def test_records_own_response_when_working_past_timeout(self) -> None:
+        deferrer = autodefer.AutoDeferrer(timeout=0.05, min_samples=1)
+        context = make_context()
+
+        async with deferrer.watch(context):
+            await asyncio.sleep(0.01)
+            context.initial_response_sent.set()
+            await asyncio.sleep(0.15)
+
+        context.defer.assert_not_called()
+        assert deferrer.estimates["command"].average < 0.05
+        assert (predicted := deferrer.predicted_latency("command")) is not None
+        assert predicted < deferrer.threshold
+
+    @pytest.mark.asyncio
+    async def test_records_whole_block_when_deferred_automatically(self) -> None:
+        deferrer = autodefer.AutoDeferrer(timeout=0.01)
+        context = make_context()
+        context.defer.side_effect = set_response_sent(context)
+
+        async with deferrer.watch(context):
+            await asyncio.sleep(0.1)
+
+        context.defer.assert_awaited_once()
+        assert deferrer.estimates["command"].average >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_excluded_commands_are_not_deferred_or_recorded(self) -> None:
+        deferrer = autodefer.AutoDeferrer(timeout=0.01, exclude=["command"])
+        context = make_context()
+
+        async with deferrer.watch(context):
+            await asyncio.sleep(0.05)
+
+        context.defer.assert_not_called()
+        assert "command" not in deferrer.estimates
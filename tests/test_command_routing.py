@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from collections.abc import Sequence
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+from lightbulb.commands import commands
+from lightbulb.internal import routing
+from lightbulb.internal import utils
+
+
+class Slash(lightbulb.SlashCommand, name="slash", description="description"):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+class User(lightbulb.UserCommand, name="slash"):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+class Sub(lightbulb.SlashCommand, name="sub", description="description"):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+class Nested(lightbulb.SlashCommand, name="nested", description="description"):
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+def make_option(
+    name: str,
+    type_: hikari.OptionType = hikari.OptionType.STRING,
+    options: Sequence[hikari.CommandInteractionOption] | None = None,
+) -> hikari.CommandInteractionOption:
+    return hikari.CommandInteractionOption(name=name, type=type_, value=None, options=options)
+
+
+def collection(*command_types: type[commands.CommandBase]) -> utils.CommandCollection:
+    out = utils.CommandCollection()
+    for command in command_types:
+        out.put(command)
+    return out
+
+
+ROUTES = routing.build_command_routes(
+    {
+        0: {
+            ("slash",): collection(Slash, User),
+            ("group", "sub"): collection(Sub),
+            ("group", "subgroup", "nested"): collection(Nested),
+        },
+        123: {("guild",): collection(Slash)},
+    }
+)
+
+
+class TestResolveCommandRoute:
+    def test_top_level_command(self) -> None:
+        options = [make_option("value")]
+
+        assert routing.resolve_command_route(ROUTES, 0, hikari.CommandType.SLASH, "slash", options) == (options, Slash)
+
+    def test_command_type_is_used(self) -> None:
+        assert routing.resolve_command_route(ROUTES, 0, hikari.CommandType.USER, "slash", None) == ((), User)
+        assert routing.resolve_command_route(ROUTES, 0, hikari.CommandType.MESSAGE, "slash", None) is None
+
+    def test_subcommand(self) -> None:
+        inner = [make_option("value")]
+        options = [make_option("sub", hikari.OptionType.SUB_COMMAND, inner)]
+
+        assert routing.resolve_command_route(ROUTES, 0, hikari.CommandType.SLASH, "group", options) == (inner, Sub)
+
+    def test_subgroup_subcommand(self) -> None:
+        inner = [make_option("value")]
+        options = [
+            make_option(
+                "subgroup",
+                hikari.OptionType.SUB_COMMAND_GROUP,
+                [make_option("nested", hikari.OptionType.SUB_COMMAND, inner)],
+            )
+        ]
+
+        assert routing.resolve_command_route(ROUTES, 0, hikari.CommandType.SLASH, "group", options) == (inner, Nested)
+
+    def test_subcommand_without_options(self) -> None:
+        options = [make_option("sub", hikari.OptionType.SUB_COMMAND)]
+
+        assert routing.resolve_command_route(ROUTES, 0, hikari.CommandType.SLASH, "group", options) == ((), Sub)
+
+    @pytest.mark.parametrize(
+        "name, options",
+        [
+            ("unknown", None),
+            ("group", None),
+            ("group", [make_option("value")]),
+            ("group", [make_option("unknown", hikari.OptionType.SUB_COMMAND)]),
+            ("group", [make_option("subgroup", hikari.OptionType.SUB_COMMAND_GROUP)]),
+        ],
+    )
+    def test_unknown_command_not_resolved(
+        self, name: str, options: Sequence[hikari.CommandInteractionOption] | None
+    ) -> None:
+        assert routing.resolve_command_route(ROUTES, 0, hikari.CommandType.SLASH, name, options) is None
+
+    def test_guild_commands_only_resolved_in_their_guild(self) -> None:
+        assert routing.resolve_command_route(ROUTES, 123, hikari.CommandType.SLASH, "guild", None) == ((), Slash)
+        assert routing.resolve_command_route(ROUTES, 0, hikari.CommandType.SLASH, "guild", None) is None
+        assert routing.resolve_command_route(ROUTES, 456, hikari.CommandType.SLASH, "slash", None) is None
+
+
+def make_interaction(name: str, options: Sequence[hikari.CommandInteractionOption] | None = None) -> mock.Mock:
+    return mock.Mock(
+        spec=hikari.CommandInteraction,
+        registered_guild_id=None,
+        command_type=hikari.CommandType.SLASH,
+        command_name=name,
+        options=options,
+    )
+
+
+class TestClientRoutes:
+    @pytest.mark.asyncio
+    async def test_routes_built_when_syncing(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        group = lightbulb.Group("group", "description")
+        group.register(Sub)
+        client.register(group)
+        interaction = make_interaction("group", [make_option("sub", hikari.OptionType.SUB_COMMAND)])
+
+        assert client._resolve_options_and_command(interaction) is None
+
+        await client.sync_application_commands()
+
+        assert client._resolve_options_and_command(interaction) == ((), Sub)
+
+    @pytest.mark.asyncio
+    async def test_unregistered_command_not_resolved(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        client.register(Slash)
+        await client.sync_application_commands()
+        assert client._resolve_options_and_command(make_interaction("slash")) == ((), Slash)
+
+        client.unregister(Slash)
+
+        assert client._resolve_options_and_command(make_interaction("slash")) is None
+
+    @pytest.mark.asyncio
+    async def test_unregistered_group_not_resolved(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        group = lightbulb.Group("group", "description")
+        subgroup = group.subgroup("subgroup", "description")
+        subgroup.register(Nested)
+        client.register(group)
+        client.register(Slash)
+        await client.sync_application_commands()
+
+        interaction = make_interaction(
+            "group",
+            [
+                make_option(
+                    "subgroup",
+                    hikari.OptionType.SUB_COMMAND_GROUP,
+                    [make_option("nested", hikari.OptionType.SUB_COMMAND)],
+                )
+            ],
+        )
+        assert client._resolve_options_and_command(interaction) == ((), Nested)
+
+        client.unregister(group)
+
+        assert client._resolve_options_and_command(interaction) is None
+        assert client._resolve_options_and_command(make_interaction("slash")) == ((), Slash)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+from unittest import mock
+
+import pytest
+
+import lightbulb
+
+
+def make_command(*hooks: lightbulb.ExecutionHook) -> type[lightbulb.SlashCommand]:
+    class Command(lightbulb.SlashCommand, name="command", description="description", hooks=hooks):
+        @lightbulb.invoke
+        async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+    return Command
+
+
+async def run(command: type[lightbulb.SlashCommand]) -> lightbulb.exceptions.ExecutionPipelineFailedException | None:
+    client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+    context = lightbulb.Context(client, mock.Mock(), [], command(), mock.Mock())
+    pipeline = lightbulb.ExecutionPipeline(
+        context, client.execution_step_order, plan=client._execution_plan_for(command)
+    )
+    try:
+        await pipeline._run()
+    except lightbulb.exceptions.ExecutionPipelineFailedException as e:
+        return e
+    return None
+
+
+class TestConcurrentHooks:
+    @pytest.mark.asyncio
+    async def test_concurrent_hooks_run_together(self) -> None:
+        running: list[int] = []
+        max_running = 0
+
+        def make_hook(i: int) -> lightbulb.ExecutionHook:
+            async def func(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+                nonlocal max_running
+                running.append(i)
+                max_running = max(max_running, len(running))
+                await asyncio.sleep(0.01)
+                running.remove(i)
+
+            return lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, name=f"hook{i}", concurrent=True)(func)
+
+        assert await run(make_command(*(make_hook(i) for i in range(4)))) is None
+        assert max_running == 4
+
+    @pytest.mark.asyncio
+    async def test_hooks_run_sequentially_by_default(self) -> None:
+        running: list[int] = []
+        max_running = 0
+
+        def make_hook(i: int) -> lightbulb.ExecutionHook:
+            async def func(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+                nonlocal max_running
+                running.append(i)
+                max_running = max(max_running, len(running))
+                await asyncio.sleep(0)
+                running.remove(i)
+
+            return lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, name=f"hook{i}")(func)
+
+        assert await run(make_command(*(make_hook(i) for i in range(3)))) is None
+        assert max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_reported_in_declaration_order(self) -> None:
+        def make_hook(i: int, delay: float) -> lightbulb.ExecutionHook:
+            async def func(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+                await asyncio.sleep(delay)
+                raise ValueError(i)
+
+            return lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, name=f"hook{i}", concurrent=True)(func)
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, concurrent=True)
+        def sync_hook(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+            raise ValueError(2)
+
+        hooks = [make_hook(0, 0.02), make_hook(1, 0), sync_hook]
+        exc = await run(make_command(*hooks))
+
+        assert exc is not None
+        assert exc.failed_hooks == hooks
+        assert [e.args[0] for e in exc.hook_failures] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_skip_when_failed_hook_waits_for_earlier_hooks(self) -> None:
+        called = False
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, concurrent=True)
+        async def failing(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, concurrent=True)
+        async def other(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None: ...
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, skip_when_failed=True, concurrent=True)
+        async def dependent(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+            nonlocal called
+            called = True
+
+        exc = await run(make_command(failing, other, dependent))
+
+        assert exc is not None
+        assert exc.failed_hooks == [failing]
+        assert called is False
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from unittest import mock
+
+import pytest
+
+import lightbulb
+from lightbulb.prefab import cooldowns
+
+
+class Database: ...
+
+
+class Cache: ...
+
+
+def make_client(validate_dependencies: bool = True) -> lightbulb.Client:
+    return lightbulb.client_from_app(mock.Mock(), sync_commands=False, validate_dependencies=validate_dependencies)
+
+
+class TestDependencyValidation:
+    @pytest.mark.asyncio
+    async def test_satisfied_dependencies_start(self) -> None:
+        client = make_client()
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(Database, Database)
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(
+                self, ctx: lightbulb.Context, db: Database, pipeline: lightbulb.ExecutionPipeline, cache: Cache | None
+            ) -> None: ...
+
+        await client.start()
+        assert client._started
+
+    @pytest.mark.asyncio
+    async def test_missing_dependency_raises(self) -> None:
+        client = make_client()
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context, db: Database) -> None: ...
+
+        with pytest.raises(lightbulb.di.DependencyNotSatisfiableException, match=r"command 'command', parameter 'db'"):
+            await client.start()
+        assert not client._started
+
+    @pytest.mark.asyncio
+    async def test_missing_factory_dependency_raises(self) -> None:
+        client = make_client()
+
+        def make_database(cache: Cache) -> Database:
+            return Database()
+
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(Database, make_database)
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context, db: Database) -> None: ...
+
+        with pytest.raises(lightbulb.di.DependencyNotSatisfiableException, match=r"Cache"):
+            await client.start()
+
+    @pytest.mark.asyncio
+    async def test_circular_dependency_raises(self) -> None:
+        client = make_client()
+
+        def make_database(cache: Cache) -> Database:
+            return Database()
+
+        def make_cache(db: Database) -> Cache:
+            return Cache()
+
+        registry = client.di.registry_for(lightbulb.di.Contexts.DEFAULT)
+        registry.register_factory(Database, make_database)
+        registry.register_factory(Cache, make_cache)
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context, db: Database) -> None: ...
+
+        with pytest.raises(lightbulb.di.CircularDependencyException, match=r"circular dependency"):
+            await client.start()
+
+    @pytest.mark.asyncio
+    async def test_dependency_from_other_context_raises(self) -> None:
+        client = make_client()
+        client.di.registry_for(lightbulb.di.Contexts.COMMAND).register_factory(Database, Database)
+
+        @client.task(lightbulb.uniformtrigger(seconds=60), auto_start=False)
+        async def task(db: Database) -> None: ...
+
+        with pytest.raises(lightbulb.di.DependencyNotSatisfiableException, match=r"task 'task'.*TASK or DEFAULT"):
+            await client.start()
+
+    @pytest.mark.asyncio
+    async def test_hooks_and_error_handlers_are_validated(self) -> None:
+        client = make_client()
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS)
+        def check(_: lightbulb.ExecutionPipeline, __: lightbulb.Context, db: Database) -> None: ...
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description", hooks=[check]):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        @client.error_handler
+        async def handler(_: lightbulb.exceptions.ExecutionPipelineFailedException, cache: Cache) -> bool:
+            return True
+
+        with pytest.raises(lightbulb.di.DependencyNotSatisfiableException) as exc_info:
+            await client.start()
+
+        assert "hook 'check', parameter 'db'" in str(exc_info.value)
+        assert "error handler 'handler', parameter 'cache'" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_values_added_at_runtime_are_satisfiable(self) -> None:
+        client = make_client()
+
+        @client.register
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[cooldowns.fixed_window(1, 1, "global")],
+        ):
+            @lightbulb.invoke
+            async def invoke(
+                self,
+                ctx: lightbulb.Context,
+                cooldown: cooldowns.CommandCooldown,
+                container: lightbulb.di.CommandContainer,
+            ) -> None: ...
+
+        await client.start()
+
+    @pytest.mark.asyncio
+    async def test_values_added_by_unused_hooks_are_not_satisfiable(self) -> None:
+        with_cooldown = make_client()
+        with_cooldown.hooks = [cooldowns.sliding_window(1, 1, "global")]
+        await with_cooldown.start()
+
+        client = make_client()
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context, cooldown: cooldowns.CommandCooldown) -> None: ...
+
+        with pytest.raises(lightbulb.di.DependencyNotSatisfiableException, match=r"CommandCooldown"):
+            await client.start()
+
+    @pytest.mark.asyncio
+    async def test_validation_disabled_by_default(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        assert not client.validate_dependencies
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context, db: Database) -> None: ...
+
+        await client.start()
+        assert client._started
+
+
+class TestResolutionPlanCaching:
+    @pytest.mark.asyncio
+    async def test_invoke_method_plan_cached_on_start(self) -> None:
+        client = make_client()
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(Database, Database)
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context, db: Database) -> None: ...
+
+        assert Command.invoke._dependency_func is None  # type: ignore[reportFunctionMemberAccess]
+        await client.start()
+
+        resolver = Command.invoke._dependency_func  # type: ignore[reportFunctionMemberAccess]
+        assert resolver is not None
+        # Bound copies of the wrapper share the cached plan instead of generating their own
+        assert Command().invoke._dependency_func is resolver  # type: ignore[reportFunctionMemberAccess]
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import time
+from unittest import mock
+
+import linkd
+import pytest
+
+import lightbulb
+
+
+class Pool: ...
+
+
+class Session: ...
+
+
+class Repository:
+    def __init__(self, pool: Pool) -> None:
+        self.pool = pool
+
+
+def make_client() -> tuple[lightbulb.Client, lightbulb.metrics.HistogramSink]:
+    sink = lightbulb.metrics.HistogramSink()
+    return lightbulb.client_from_app(mock.Mock(), sync_commands=False, metrics_sink=sink), sink
+
+
+class TestDependencyWarmup:
+    @pytest.mark.asyncio
+    async def test_declared_dependencies_created_on_start(self) -> None:
+        client, sink = make_client()
+        created: list[Pool] = []
+
+        def make_pool() -> Pool:
+            created.append(pool := Pool())
+            return pool
+
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(Pool, make_pool)
+        client.warm_up(Pool)
+
+        await client.start()
+
+        assert len(created) == 1
+        default = client.di.default_container
+        assert default is not None
+        assert await default.get(Pool) is created[0]
+        assert set(client.dependency_warmup_timings) == {"tests.test_dependency_warmup.Pool"}
+        assert sink.get(lightbulb.metrics.DEPENDENCY_WARMUP_DURATION, dependency="tests.test_dependency_warmup.Pool")
+
+    @pytest.mark.asyncio
+    async def test_independent_dependencies_created_concurrently(self) -> None:
+        client, _ = make_client()
+
+        async def make_pool() -> Pool:
+            await asyncio.sleep(0.1)
+            return Pool()
+
+        async def make_session() -> Session:
+            await asyncio.sleep(0.1)
+            return Session()
+
+        registry = client.di.registry_for(lightbulb.di.Contexts.DEFAULT)
+        registry.register_factory(Pool, make_pool)
+        registry.register_factory(Session, make_session)
+        client.warm_up(Pool, Session)
+
+        before = time.perf_counter()
+        await client.start()
+        assert time.perf_counter() - before < 0.19
+
+    @pytest.mark.asyncio
+    async def test_required_dependencies_created_first_and_torn_down_last(self) -> None:
+        client, _ = make_client()
+        events: list[str] = []
+
+        async def make_pool() -> Pool:
+            await asyncio.sleep(0.01)
+            events.append("create pool")
+            return Pool()
+
+        def make_repository(pool: Pool) -> Repository:
+            events.append("create repository")
+            return Repository(pool)
+
+        registry = client.di.registry_for(lightbulb.di.Contexts.DEFAULT)
+        registry.register_factory(Pool, make_pool, teardown=lambda _: events.append("teardown pool"))
+        registry.register_factory(Repository, make_repository, teardown=lambda _: events.append("teardown repository"))
+        # Only the repository is declared - the pool it requires is warmed up as well
+        client.warm_up(Repository)
+
+        await client.start()
+        assert events == ["create pool", "create repository"]
+        assert set(client.dependency_warmup_timings) == {
+            "tests.test_dependency_warmup.Pool",
+            "tests.test_dependency_warmup.Repository",
+        }
+
+        await client.stop()
+        assert events[2:] == ["teardown repository", "teardown pool"]
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_tears_down_created_dependencies(self) -> None:
+        client, _ = make_client()
+        teardown = mock.Mock()
+
+        async def make_session() -> Session:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("cannot connect")
+
+        registry = client.di.registry_for(lightbulb.di.Contexts.DEFAULT)
+        registry.register_factory(Pool, Pool, teardown=teardown)
+        registry.register_factory(Session, make_session)
+        client.warm_up(Pool, Session)
+
+        with pytest.raises(lightbulb.di.DependencyNotSatisfiableException):
+            await client.start()
+
+        assert not client._started
+        teardown.assert_called_once()
+        assert client.di.default_container is None
+
+    @pytest.mark.asyncio
+    async def test_failed_creation_closes_offloader_and_stall_detector(self) -> None:
+        offloader = lightbulb.offload.Offloader(max_processes=1, max_threads=1)
+        stall_detector = lightbulb.stalls.StallDetector()
+        client = lightbulb.client_from_app(
+            mock.Mock(), sync_commands=False, offloader=offloader, stall_detector=stall_detector
+        )
+
+        def make_pool() -> Pool:
+            raise RuntimeError("cannot connect")
+
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(Pool, make_pool)
+        client.warm_up(Pool)
+
+        with pytest.raises(lightbulb.di.DependencyNotSatisfiableException):
+            await client.start()
+
+        assert not offloader.started
+        assert not stall_detector.running
+
+        # Retrying starts them again from scratch
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(Pool, Pool)
+        await client.start()
+        assert offloader.started
+        assert stall_detector.running
+        await client.stop()
+
+    @pytest.mark.asyncio
+    async def test_prototype_dependencies_cannot_be_warmed_up(self) -> None:
+        client, _ = make_client()
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_factory(
+            Pool, Pool, lifetime=linkd.Lifetime.PROTOTYPE
+        )
+        client.warm_up(Pool)
+
+        with pytest.raises(ValueError):
+            await client.start()
+
+    @pytest.mark.asyncio
+    async def test_cannot_declare_after_start(self) -> None:
+        client, _ = make_client()
+        await client.start()
+
+        with pytest.raises(RuntimeError):
+            client.warm_up(Pool)
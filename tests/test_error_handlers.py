@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from unittest import mock
+
+import pytest
+
+import lightbulb
+
+
+def make_exception(*causes: Exception) -> lightbulb.exceptions.ExecutionPipelineFailedException:
+    return lightbulb.exceptions.ExecutionPipelineFailedException(
+        [(mock.Mock(), cause) for cause in causes[:-1]], causes[-1] if causes else None, mock.Mock(), mock.Mock()
+    )
+
+
+class TestErrorHandlerDispatch:
+    @pytest.mark.asyncio
+    async def test_handlers_without_types_receive_all_failures(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        @client.error_handler
+        async def handler(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            return True
+
+        assert list(client._error_handlers_for(make_exception(ValueError()))) == [handler]
+
+    @pytest.mark.asyncio
+    async def test_unrelated_handlers_are_excluded(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        @client.error_handler(on=KeyError)
+        async def key_handler(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            return True
+
+        @client.error_handler(on=(TypeError, LookupError))
+        async def lookup_handler(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            return True
+
+        assert list(client._error_handlers_for(make_exception(ValueError()))) == []
+        assert list(client._error_handlers_for(make_exception(IndexError()))) == [lookup_handler]
+        assert list(client._error_handlers_for(make_exception(KeyError()))) == [key_handler, lookup_handler]
+
+    @pytest.mark.asyncio
+    async def test_chain_respects_priority(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        @client.error_handler(on=ValueError)
+        async def low(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            return True
+
+        @client.error_handler(priority=10)
+        async def high(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            return True
+
+        assert list(client._error_handlers_for(make_exception(ValueError()))) == [high, low]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_cache_invalidated_when_handler_removed(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        @client.error_handler(on=ValueError)
+        async def handler(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            return True
+
+        assert list(client._error_handlers_for(make_exception(ValueError()))) == [handler]
+        client.remove_error_handler(handler)
+        assert list(client._error_handlers_for(make_exception(ValueError()))) == []
+        assert not client._error_handler_filters
+
+    @pytest.mark.asyncio
+    async def test_only_matching_handlers_awaited_on_failure(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        called: list[str] = []
+
+        @client.error_handler(on=KeyError)
+        async def unrelated(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            called.append("unrelated")
+            return True
+
+        @client.error_handler(on=ValueError)
+        async def related(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            called.append("related")
+            return True
+
+        @client.register
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                raise ValueError
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        assert called == ["related"]
+
+    @pytest.mark.asyncio
+    async def test_loader_error_handler_types(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        loader = lightbulb.Loader()
+
+        @loader.error_handler(on=ValueError)
+        async def handler(_: lightbulb.exceptions.ExecutionPipelineFailedException) -> bool:
+            return True
+
+        await loader.add_to_client(client)
+
+        assert len(client._error_handlers_for(make_exception(KeyError()))) == 0
+        assert len(client._error_handlers_for(make_exception(ValueError()))) == 1
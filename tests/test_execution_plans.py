@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import functools
+import typing as t
+from unittest import mock
+
+import pytest
+
+import lightbulb
+from lightbulb.commands import execution
+
+
+def make_hook(step: lightbulb.ExecutionStep, calls: list[str], name: str) -> lightbulb.ExecutionHook:
+    def func(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+        calls.append(name)
+
+    return lightbulb.hook(step, name=name)(func)
+
+
+class TestExecutionPlans:
+    def test_plan_groups_hooks_by_step_in_order(self) -> None:
+        calls: list[str] = []
+        check = make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "check")
+        post = make_hook(lightbulb.ExecutionSteps.POST_INVOKE, calls, "post")
+        cooldown = make_hook(lightbulb.ExecutionSteps.COOLDOWNS, calls, "cooldown")
+
+        plan = execution._compile_execution_plan(
+            [lightbulb.ExecutionSteps.CHECKS, lightbulb.ExecutionSteps.INVOKE, lightbulb.ExecutionSteps.POST_INVOKE],
+            [post, check, cooldown],
+        )
+
+        assert plan.steps == (
+            (lightbulb.ExecutionSteps.CHECKS, (check,)),
+            (lightbulb.ExecutionSteps.INVOKE, ()),
+            (lightbulb.ExecutionSteps.POST_INVOKE, (post,)),
+        )
+
+    def test_plan_is_cached_per_command(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        assert client._execution_plan_for(Command) is client._execution_plan_for(Command)
+
+    def test_plan_invalidated_when_client_hooks_change(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        plan = client._execution_plan_for(Command)
+        hook = make_hook(lightbulb.ExecutionSteps.CHECKS, [], "check")
+        client.hooks = [hook]
+
+        new_plan = client._execution_plan_for(Command)
+        assert new_plan is not plan
+        assert (lightbulb.ExecutionSteps.CHECKS, (hook,)) in new_plan.steps
+
+    def test_plan_invalidated_when_step_order_changes(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        client._execution_plan_for(Command)
+        client.execution_step_order = [lightbulb.ExecutionSteps.INVOKE]
+
+        assert client._execution_plan_for(Command).steps == ((lightbulb.ExecutionSteps.INVOKE, ()),)
+
+    def test_plan_invalidated_when_client_hooks_modified_in_place(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        plan = client._execution_plan_for(Command)
+        hook = make_hook(lightbulb.ExecutionSteps.CHECKS, [], "check")
+        client.hooks.append(hook)
+
+        new_plan = client._execution_plan_for(Command)
+        assert new_plan is not plan
+        assert (lightbulb.ExecutionSteps.CHECKS, (hook,)) in new_plan.steps
+
+        client.hooks.remove(hook)
+        assert (lightbulb.ExecutionSteps.CHECKS, (hook,)) not in client._execution_plan_for(Command).steps
+
+    def test_plan_invalidated_when_step_order_modified_in_place(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        client._execution_plan_for(Command)
+        client.execution_step_order[:] = [lightbulb.ExecutionSteps.INVOKE]
+
+        assert client._execution_plan_for(Command).steps == ((lightbulb.ExecutionSteps.INVOKE, ()),)
+
+    def test_plan_invalidated_when_command_hooks_change(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        plan = client._execution_plan_for(Command)
+        hook = make_hook(lightbulb.ExecutionSteps.CHECKS, [], "check")
+        Command._command_data.hooks = (hook,)
+
+        new_plan = client._execution_plan_for(Command)
+        assert new_plan is not plan
+        assert (lightbulb.ExecutionSteps.CHECKS, (hook,)) in new_plan.steps
+
+    @pytest.mark.asyncio
+    async def test_pipeline_runs_global_hooks_before_command_hooks(self) -> None:
+        calls: list[str] = []
+        client = lightbulb.client_from_app(
+            mock.Mock(),
+            sync_commands=False,
+            hooks=[
+                make_hook(lightbulb.ExecutionSteps.POST_INVOKE, calls, "global_post"),
+                make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "global_check"),
+            ],
+        )
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[
+                make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "command_check"),
+                make_hook(lightbulb.ExecutionSteps.PRE_INVOKE, calls, "command_pre"),
+            ],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                calls.append("invoke")
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        assert calls == ["global_check", "command_check", "command_pre", "invoke", "global_post"]
+
+    def test_plan_records_inject_all_params_feature(self) -> None:
+        client = lightbulb.client_from_app(
+            mock.Mock(), sync_commands=False, features=[lightbulb.features.HOOK_INJECT_ALL_PARAMS]
+        )
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        assert client._execution_plan_for(Command).inject_all_params is True
+
+
+class TestHookClassification:
+    def test_sync_hook_without_dependencies(self) -> None:
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS)
+        def hook(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None: ...
+
+        assert hook._is_async is False
+        assert hook._requires_injection is False
+        assert hook._requires_injection_all_params is True
+
+    def test_async_hook_with_dependencies(self) -> None:
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS)
+        async def hook(
+            _: lightbulb.ExecutionPipeline, __: lightbulb.Context, value: str = lightbulb.di.INJECTED
+        ) -> None: ...
+
+        assert hook._is_async is True
+        assert hook._requires_injection is True
+
+    def test_callable_instance_hook(self) -> None:
+        class Hook:
+            async def __call__(self, _: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None: ...
+
+        hook = lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, name="hook")(Hook())
+
+        assert hook._is_async is True
+        assert hook._requires_injection is False
+
+    def test_sync_hook_called_without_awaitable(self) -> None:
+        calls: list[str] = []
+        hook = make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "check")
+
+        assert hook._call(mock.Mock(), mock.Mock(), False) is None
+        assert calls == ["check"]
+
+    @pytest.mark.asyncio
+    async def test_sync_wrapper_around_async_check_is_awaited(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        async def check(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+            raise RuntimeError("check failed")
+
+        @functools.wraps(check)
+        def wrapper(pipeline: lightbulb.ExecutionPipeline, context: lightbulb.Context) -> t.Any:
+            return check(pipeline, context)
+
+        hook = lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, name="check")(wrapper)
+        assert hook._is_async is False
+
+        class Command(lightbulb.SlashCommand, name="command", description="description", hooks=[hook]):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        pipeline = lightbulb.ExecutionPipeline(
+            context, client.execution_step_order, plan=client._execution_plan_for(Command)
+        )
+        with pytest.raises(lightbulb.exceptions.ExecutionPipelineFailedException) as exc_info:
+            await pipeline._run()
+
+        assert isinstance(exc_info.value.causes[0], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_hook_with_dependencies_is_injected(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_value(str, "foo")
+        values: list[str] = []
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS)
+        def hook(_: lightbulb.ExecutionPipeline, __: lightbulb.Context, value: str = lightbulb.di.INJECTED) -> None:
+            values.append(value)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description", hooks=[hook]):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        assert values == ["foo"]
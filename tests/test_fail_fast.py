@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from unittest import mock
+
+import pytest
+
+import lightbulb
+
+
+def make_hook(
+    step: lightbulb.ExecutionStep, calls: list[str], name: str, fail: bool = False, always_run: bool = False
+) -> lightbulb.ExecutionHook:
+    def func(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+        calls.append(name)
+        if fail:
+            raise RuntimeError(name)
+
+    return lightbulb.hook(step, name=name, always_run=always_run)(func)
+
+
+async def run(client: lightbulb.Client, command: type[lightbulb.SlashCommand]) -> None:
+    context = lightbulb.Context(client, mock.Mock(), [], command(), mock.Mock())
+    pipeline = lightbulb.ExecutionPipeline(
+        context, client.execution_step_order, plan=client._execution_plan_for(command)
+    )
+    with pytest.raises(lightbulb.exceptions.ExecutionPipelineFailedException):
+        await pipeline._run()
+
+
+class TestFailFast:
+    @pytest.mark.asyncio
+    async def test_all_hooks_run_by_default(self) -> None:
+        calls: list[str] = []
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[
+                make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "check", fail=True),
+                make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "other_check"),
+                make_hook(lightbulb.ExecutionSteps.POST_INVOKE, calls, "post"),
+            ],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        await run(client, Command)
+        assert calls == ["check", "other_check", "post"]
+
+    @pytest.mark.asyncio
+    async def test_client_fail_fast_stops_at_first_failure(self) -> None:
+        calls: list[str] = []
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, fail_fast=True)
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[
+                make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "check", fail=True),
+                make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "other_check"),
+                make_hook(lightbulb.ExecutionSteps.COOLDOWNS, calls, "cooldown"),
+                make_hook(lightbulb.ExecutionSteps.POST_INVOKE, calls, "post"),
+                make_hook(lightbulb.ExecutionSteps.POST_INVOKE, calls, "cleanup", always_run=True),
+            ],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                calls.append("invoke")
+
+        await run(client, Command)
+        assert calls == ["check", "cleanup"]
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_after_invocation_failure(self) -> None:
+        calls: list[str] = []
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, fail_fast=True)
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            hooks=[
+                make_hook(lightbulb.ExecutionSteps.POST_INVOKE, calls, "post"),
+                make_hook(lightbulb.ExecutionSteps.POST_INVOKE, calls, "cleanup", always_run=True),
+            ],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                raise RuntimeError
+
+        await run(client, Command)
+        assert calls == ["cleanup"]
+
+    @pytest.mark.asyncio
+    async def test_command_overrides_client_default(self) -> None:
+        calls: list[str] = []
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, fail_fast=True)
+
+        class Command(
+            lightbulb.SlashCommand,
+            name="command",
+            description="description",
+            fail_fast=False,
+            hooks=[
+                make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "check", fail=True),
+                make_hook(lightbulb.ExecutionSteps.CHECKS, calls, "other_check"),
+            ],
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        await run(client, Command)
+        assert calls == ["check", "other_check"]
+
+    def test_changing_client_default_invalidates_plans(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        assert client._execution_plan_for(Command).fail_fast is False
+        client.fail_fast = True
+        assert client._execution_plan_for(Command).fail_fast is True
+
+    def test_max_concurrency_decrement_always_runs(self) -> None:
+        _, decrement = lightbulb.prefab.max_concurrency(1, "global")
+        assert decrement.always_run is True
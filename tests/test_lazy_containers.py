@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from unittest import mock
+
+import linkd
+import pytest
+
+import lightbulb
+from lightbulb import tracing
+from lightbulb.internal import di as i_di
+
+
+class Dependency:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+class TestDirectCallable:
+    def test_uninjected_coroutine_function_is_unwrapped(self) -> None:
+        async def func(ctx: lightbulb.Context) -> None: ...
+
+        assert i_di.direct_callable(lightbulb.di.with_di(func), 1) is func
+
+    def test_injected_function_is_not_unwrapped(self) -> None:
+        async def func(ctx: lightbulb.Context, dep: Dependency) -> None: ...
+
+        assert i_di.direct_callable(lightbulb.di.with_di(func), 1) is None
+
+    def test_sync_function_is_not_unwrapped(self) -> None:
+        def func(ctx: lightbulb.Context) -> None: ...
+
+        assert i_di.direct_callable(lightbulb.di.with_di(func), 1) is None
+
+
+class TestLazyContainers:
+    @pytest.mark.asyncio
+    async def test_no_containers_created_when_nothing_is_injected(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        invoked = False
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                nonlocal invoked
+                invoked = True
+
+        assert client._execution_plan_for(Command).invoke_func is not None
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        with mock.patch.object(linkd, "Container", wraps=linkd.Container) as container_cls:
+            await client._execute_command_context(context)
+
+        assert invoked
+        container_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_containers_created_on_first_resolution(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        client.di.registry_for(lightbulb.di.Contexts.COMMAND).register_factory(
+            Dependency, Dependency, teardown=lambda d: setattr(d, "closed", True)
+        )
+        resolved: list[tuple[Dependency, lightbulb.Context]] = []
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context, dep: Dependency, context: lightbulb.Context) -> None:
+                resolved.append((dep, context))
+
+        assert client._execution_plan_for(Command).invoke_func is None
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        ((dep, injected_context),) = resolved
+        assert injected_context is context
+        assert dep.closed
+        assert client.di.default_container is not None
+
+    @pytest.mark.asyncio
+    async def test_dynamic_resolution_creates_containers(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        dependency = Dependency()
+        client.di.registry_for(lightbulb.di.Contexts.DEFAULT).register_value(Dependency, dependency)
+
+        @lightbulb.di.with_di
+        async def helper(dep: Dependency = lightbulb.di.INJECTED) -> Dependency:
+            return dep
+
+        resolved: list[Dependency] = []
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                resolved.append(await helper())
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        assert resolved == [dependency]
+
+    @pytest.mark.asyncio
+    async def test_values_added_before_creation_are_kept(self) -> None:
+        manager = linkd.DependencyInjectionManager()
+        container = i_di.LazyContainer(manager, lightbulb.di.Contexts.COMMAND, [])
+        dependency = Dependency()
+
+        async with container:
+            container.add_value(Dependency, dependency, teardown=lambda d: setattr(d, "closed", True))
+            assert not container.created
+
+            assert await container.get(Dependency) is dependency
+            assert container.created
+            command_container = await container.get(lightbulb.di.CommandContainer)
+            assert command_container._tag is lightbulb.di.Contexts.COMMAND
+
+        assert dependency.closed
+        with pytest.raises(linkd.ContainerClosedException):
+            await container.get(Dependency)
+
+    @pytest.mark.asyncio
+    async def test_container_is_child_of_current_container(self) -> None:
+        manager = linkd.DependencyInjectionManager()
+        dependency = Dependency()
+        manager.registry_for(lightbulb.di.Contexts.TASK).register_value(Dependency, dependency)
+
+        async with (
+            manager.enter_context(lightbulb.di.Contexts.DEFAULT),
+            manager.enter_context(lightbulb.di.Contexts.TASK) as task_container,
+            i_di.LazyContainer(manager, lightbulb.di.Contexts.COMMAND, []) as container,
+        ):
+            assert await container.get(Dependency) is dependency
+            command_container = await container.get(lightbulb.di.CommandContainer)
+            assert await command_container.get(lightbulb.di.TaskContainer) is task_container
+
+    @pytest.mark.asyncio
+    async def test_current_container_for_same_context_is_reused(self) -> None:
+        manager = linkd.DependencyInjectionManager()
+        dependency = Dependency()
+
+        async with (
+            manager.enter_context(lightbulb.di.Contexts.DEFAULT),
+            manager.enter_context(lightbulb.di.Contexts.COMMAND) as command_container,
+        ):
+            async with i_di.LazyContainer(
+                manager, lightbulb.di.Contexts.COMMAND, [(Dependency, dependency)]
+            ) as container:
+                assert container.created
+                assert await command_container.get(Dependency) is dependency
+
+            # The container belongs to the outer context, so it is still usable
+            assert await command_container.get(Dependency) is dependency
+
+    @pytest.mark.asyncio
+    async def test_teardown_of_values_when_never_created(self) -> None:
+        container = i_di.LazyContainer(linkd.DependencyInjectionManager(), lightbulb.di.Contexts.TASK, [])
+        dependency = Dependency()
+
+        async with container:
+            container.add_value(Dependency, dependency, teardown=lambda d: setattr(d, "closed", True))
+
+        assert not container.created
+        assert dependency.closed
+
+    @pytest.mark.asyncio
+    async def test_container_creation_is_traced(self) -> None:
+        buffer = tracing.RingBufferExporter()
+        tracer = tracing.Tracer(buffer)
+        container = i_di.LazyContainer(linkd.DependencyInjectionManager(), lightbulb.di.Contexts.COMMAND, [])
+
+        with tracer.span("root"):
+            async with container:
+                await container.get(lightbulb.di.CommandContainer)
+
+        contexts = [s.attributes["context"] for s in buffer.spans if s.name == "lightbulb.di_enter"]
+        assert contexts == ["DEFAULT", "COMMAND"]
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import warnings
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+from lightbulb.commands import commands
+
+
+def make_option(name: str, value: object) -> mock.Mock:
+    option = mock.Mock(spec=hikari.CommandInteractionOption, value=value)
+    option.name = name
+    return option
+
+
+async def resolve(command: commands.CommandBase, **values: object) -> None:
+    await type(command).as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+
+    context = mock.Mock(options=[make_option(name, value) for name, value in values.items()])
+    context.interaction.resolved = None
+    command._set_context(context)
+    await command._resolve_options()
+
+
+class TestLazyOptions:
+    @pytest.mark.asyncio
+    async def test_eager_converter_called_when_resolving(self) -> None:
+        converter = mock.Mock(return_value="converted")
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", converter=converter)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, option="raw")
+
+        converter.assert_called_once()
+        assert command.option == "converted"
+
+    @pytest.mark.asyncio
+    async def test_lazy_converter_not_called_unless_accessed(self) -> None:
+        converter = mock.Mock(return_value="converted")
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", converter=converter, lazy=True)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        await resolve(Command(), option="raw")
+
+        converter.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lazy_converter_called_once_on_access(self) -> None:
+        converter = mock.Mock(return_value="converted")
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", converter=converter, lazy=True)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, option="raw")
+
+        assert command.option == "converted"
+        assert command.option == "converted"
+        converter.assert_called_once_with(command._current_context, "raw")
+
+    @pytest.mark.asyncio
+    async def test_lazy_options_set_on_command(self) -> None:
+        first, second = mock.Mock(return_value=1), mock.Mock(return_value=2)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description", lazy_options=True):
+            first_ = lightbulb.string("first", "description", converter=first)
+            second_ = lightbulb.string("second", "description", converter=second, lazy=False)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, first="a", second="b")
+
+        first.assert_not_called()
+        second.assert_called_once()
+        assert command.first_ == 1
+
+    @pytest.mark.asyncio
+    async def test_lazy_conversion_failure_raises(self) -> None:
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", converter=mock.Mock(side_effect=ValueError), lazy=True)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, option="raw")
+
+        with pytest.raises(lightbulb.exceptions.ConversionFailedException):
+            _ = command.option
+
+    @pytest.mark.asyncio
+    async def test_async_lazy_converter_requires_resolve(self) -> None:
+        converter = mock.AsyncMock(return_value="converted")
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", converter=converter, lazy=True)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, option="raw")
+
+        with pytest.raises(RuntimeError):
+            _ = command.option
+        converter.assert_not_called()
+
+        assert await command.resolve("option") == "converted"
+        assert await command.resolve("option") == "converted"
+        assert command.option == "converted"
+        converter.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_async_callable_converter_not_called_on_access(self) -> None:
+        calls: list[object] = []
+
+        class Converter:
+            async def __call__(self, ctx: lightbulb.Context, value: str) -> str:
+                calls.append(value)
+                return "converted"
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", converter=Converter(), lazy=True)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, option="raw")
+
+        with pytest.raises(RuntimeError):
+            _ = command.option
+
+        assert calls == []
+        assert await command.resolve("option") == "converted"
+        assert calls == ["raw"]
+
+    @pytest.mark.asyncio
+    async def test_sync_converter_returning_coroutine_requires_resolve(self) -> None:
+        calls: list[object] = []
+
+        async def convert(ctx: lightbulb.Context, value: str) -> str:
+            calls.append(value)
+            return "converted"
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description", converter=lambda c, v: convert(c, v), lazy=True)
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, option="raw")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            with pytest.raises(RuntimeError, match="resolve"):
+                _ = command.option
+            with pytest.raises(RuntimeError, match="resolve"):
+                _ = command.option
+
+        assert calls == []
+        assert await command.resolve("option") == "converted"
+        assert calls == ["raw"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_returns_eager_value(self) -> None:
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description")
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, option="raw")
+
+        assert await command.resolve("option") == "raw"
+
+    @pytest.mark.asyncio
+    async def test_resolve_unknown_option_raises(self) -> None:
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description")
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        await resolve(command, option="raw")
+
+        with pytest.raises(KeyError):
+            await command.resolve("unknown")
+
+    @pytest.mark.asyncio
+    async def test_resolve_before_options_resolved_raises(self) -> None:
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            option = lightbulb.string("option", "description")
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        command = Command()
+        command._set_context(mock.Mock())
+
+        with pytest.raises(RuntimeError):
+            await command.resolve("option")
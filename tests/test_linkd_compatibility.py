@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+import typing as t
+from unittest import mock
+
+import linkd
+import pytest
+from linkd import conditions as linkd_conditions
+from linkd import graph as linkd_graph
+from linkd import solver as linkd_solver
+from linkd import utils as linkd_utils
+
+import lightbulb
+from lightbulb.internal import di as i_di
+
+# The internals of linkd that dependency validation, dependency warm-up and the lazily created containers rely on.
+# If any of these fail after upgrading linkd, lightbulb falls back to using only linkd's public API - the fallbacks
+# are tested below - and lightbulb.internal.di should be updated to work with the new version.
+
+
+class Pool: ...
+
+
+class Cache: ...
+
+
+class Repository:
+    def __init__(self, pool: Pool) -> None:
+        self.pool = pool
+
+
+class Services(linkd.Compose):
+    pool: Pool
+
+
+def make_registry() -> linkd.Registry:
+    registry = linkd.Registry()
+    registry.register_factory(Pool, Pool)
+    registry.register_factory(Repository, Repository)
+    return registry
+
+
+class TestLinkdCompatibility:
+    def test_parameter_parsing(self) -> None:
+        def func(ctx: lightbulb.Context, pool: Pool, *, cache: linkd.Try[Cache]) -> None: ...
+
+        positional, keyword_only = linkd_solver._parse_injectable_params(func)
+
+        assert [name for name, _ in positional] == ["ctx", "pool"]
+        pool_expression: t.Any = positional[1][1]
+        assert [condition.inner_id for condition in pool_expression._order] == [linkd_utils.get_dependency_id(Pool)]
+        assert pool_expression._required
+        cache_expression: t.Any = keyword_only["cache"]
+        assert isinstance(cache_expression._order[0], linkd_conditions._Try)
+
+    def test_parameters_that_cannot_be_injected(self) -> None:
+        def func(pool: Pool = Pool()) -> None: ...
+
+        ((_, expression),), _ = linkd_solver._parse_injectable_params(func)
+        assert expression is linkd_solver.CANNOT_INJECT
+
+    def test_compose_classes(self) -> None:
+        def func(services: Services) -> None: ...
+
+        ((_, expression),), _ = linkd_solver._parse_injectable_params(func)
+
+        assert linkd_utils._is_compose_class(expression)
+        assert list(getattr(expression, linkd_utils._DEPS_ATTR)) == ["pool"]
+
+    def test_registry_graph(self) -> None:
+        data: t.Any = make_registry()._graph.nodes.get(linkd_utils.get_dependency_id(Repository))
+
+        assert data.lifetime is linkd_graph.Lifetime.SINGLETON
+        (expression,) = data.factory_params.values()
+        assert [condition.inner_id for condition in expression._order] == [linkd_utils.get_dependency_id(Pool)]
+
+    @pytest.mark.asyncio
+    async def test_container_internals(self) -> None:
+        parent = linkd.Container(linkd.Registry(), tag=lightbulb.di.Contexts.DEFAULT)
+        container = linkd.Container(make_registry(), parent=parent, tag=lightbulb.di.Contexts.COMMAND)
+        dependency_id = linkd_utils.get_dependency_id(Repository)
+
+        assert container._tag is lightbulb.di.Contexts.COMMAND
+        assert container._parent is parent
+        assert dependency_id in container._graph.nodes
+        assert dependency_id not in container._instances
+
+        repository, cacheable = await container._get(dependency_id)
+        assert isinstance(repository, Repository) and cacheable
+        assert container._instances[dependency_id] is repository
+
+    def test_resolver_generation(self) -> None:
+        @linkd.inject
+        async def func(pool: Pool = linkd.INJECTED) -> None: ...
+
+        assert isinstance(func, linkd.AutoInjecting)
+        assert func._dependency_func is None
+        assert callable(func._codegen_dependency_func())
+
+    def test_internals_detected(self) -> None:
+        assert i_di._linkd_internals_available()
+
+
+@pytest.fixture
+def without_internals() -> t.Iterator[None]:
+    with mock.patch.object(i_di, "_USE_LINKD_INTERNALS", False):
+        yield
+
+
+@pytest.mark.usefixtures("without_internals")
+class TestPublicApiFallback:
+    @pytest.mark.asyncio
+    async def test_command_dependencies_resolved(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        client.di.registry_for(lightbulb.di.Contexts.COMMAND).register_factory(Pool, Pool)
+        resolved: list[tuple[Pool, lightbulb.Context]] = []
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context, pool: Pool, context: lightbulb.Context) -> None:
+                resolved.append((pool, context))
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        ((pool, injected_context),) = resolved
+        assert isinstance(pool, Pool)
+        assert injected_context is context
+        assert client.di.default_container is not None
+
+    @pytest.mark.asyncio
+    async def test_dependencies_warmed_up(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        registry = client.di.registry_for(lightbulb.di.Contexts.DEFAULT)
+        registry.register_factory(Pool, Pool)
+        registry.register_factory(Repository, Repository)
+        client.warm_up(Repository)
+
+        await client.start()
+
+        assert set(client.dependency_warmup_timings) == {linkd_utils.get_dependency_id(Repository)}
+        default = client.di.default_container
+        assert default is not None
+        assert isinstance(await default.get(Repository), Repository)
+        await client.stop()
+
+    def test_validation_skipped(self, caplog: pytest.LogCaptureFixture) -> None:
+        async def func(pool: Pool) -> None: ...
+
+        manager = linkd.DependencyInjectionManager()
+        with caplog.at_level(logging.WARNING, logger=i_di.__name__):
+            i_di.validate_dependencies(manager, [(lightbulb.di.Contexts.COMMAND, "func", func, 0)], {})
+
+        assert "cannot validate dependencies" in caplog.text
+
+    def test_resolution_plan_not_generated(self) -> None:
+        @linkd.inject
+        async def func(pool: Pool = linkd.INJECTED) -> None: ...
+
+        assert isinstance(func, linkd.AutoInjecting)
+        i_di.cache_resolution_plan(func)
+        assert func._dependency_func is None
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from unittest import mock
+
+import pytest
+
+import lightbulb
+from lightbulb import metrics
+
+
+class TestHistogram:
+    def test_observe_places_durations_in_buckets(self) -> None:
+        histogram = metrics.Histogram([0.001, 0.01])
+        histogram.observe(500_000)
+        histogram.observe(1_000_000)
+        histogram.observe(5_000_000)
+        histogram.observe(50_000_000)
+
+        assert histogram.count == 4
+        assert histogram.sum_ns == 56_500_000
+        assert list(histogram.cumulative_counts()) == [2, 3, 4]
+
+
+class TestHistogramSink:
+    def test_record_groups_by_name_and_labels(self) -> None:
+        sink = metrics.HistogramSink()
+        sink.record(metrics.INVOKE_DURATION, 10, {"command": "foo"})
+        sink.record(metrics.INVOKE_DURATION, 20, {"command": "foo"})
+        sink.record(metrics.INVOKE_DURATION, 30, {"command": "bar"})
+
+        foo = sink.get(metrics.INVOKE_DURATION, command="foo")
+        assert foo is not None and foo.count == 2
+        bar = sink.get(metrics.INVOKE_DURATION, command="bar")
+        assert bar is not None and bar.count == 1
+        assert sink.get(metrics.HOOK_DURATION, command="foo") is None
+
+    def test_render_openmetrics(self) -> None:
+        sink = metrics.HistogramSink(buckets=[0.5, 1])
+        sink.record(metrics.HOOK_DURATION, 250_000_000, {"command": 'say "hi"', "step": "CHECKS", "hook": "check"})
+
+        assert metrics.render_openmetrics(sink) == (
+            "# TYPE lightbulb_hook_duration_seconds histogram\n"
+            "# UNIT lightbulb_hook_duration_seconds seconds\n"
+            'lightbulb_hook_duration_seconds_bucket{command="say \\"hi\\"",hook="check",step="CHECKS",le="0.5"} 1\n'
+            'lightbulb_hook_duration_seconds_bucket{command="say \\"hi\\"",hook="check",step="CHECKS",le="1.0"} 1\n'
+            'lightbulb_hook_duration_seconds_bucket{command="say \\"hi\\"",hook="check",step="CHECKS",le="+Inf"} 1\n'
+            'lightbulb_hook_duration_seconds_count{command="say \\"hi\\"",hook="check",step="CHECKS"} 1\n'
+            'lightbulb_hook_duration_seconds_sum{command="say \\"hi\\"",hook="check",step="CHECKS"} 0.25\n'
+            "# EOF\n"
+        )
+
+    def test_render_empty_sink(self) -> None:
+        assert metrics.render_openmetrics(metrics.HistogramSink()) == "# EOF\n"
+
+
+class TestPipelineMetrics:
+    @pytest.mark.asyncio
+    async def test_pipeline_records_timings(self) -> None:
+        sink = metrics.HistogramSink()
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, metrics_sink=sink)
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS)
+        def sync_check(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None: ...
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, concurrent=True)
+        async def first(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None: ...
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS, concurrent=True)
+        async def second(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+            raise RuntimeError
+
+        class Command(
+            lightbulb.SlashCommand, name="command", description="description", hooks=[sync_check, first, second]
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        for hook in ["sync_check", "first", "second"]:
+            histogram = sink.get(metrics.HOOK_DURATION, command="command", step="CHECKS", hook=hook)
+            assert histogram is not None and histogram.count == 1
+        # The invocation is skipped because a hook failed
+        assert sink.get(metrics.INVOKE_DURATION, command="command") is None
+
+    @pytest.mark.asyncio
+    async def test_pipeline_records_invoke_and_option_resolution(self) -> None:
+        sink = metrics.HistogramSink()
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, metrics_sink=sink)
+
+        class Command(lightbulb.SlashCommand, name="command", description="description"):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        for name in [metrics.OPTION_RESOLUTION_DURATION, metrics.INVOKE_DURATION]:
+            histogram = sink.get(name, command="command")
+            assert histogram is not None and histogram.count == 1
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import multiprocessing
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+import lightbulb
+from lightbulb import offload
+
+
+@offload.offloaded
+def process_info(value: int) -> tuple[int, int]:
+    return os.getpid(), value * 2
+
+
+@offload.offloaded(kind="thread")
+def thread_info(value: int) -> tuple[int, int]:
+    return threading.get_ident(), value * 2
+
+
+# Avoid forking the multi-threaded test process
+SPAWN = multiprocessing.get_context("spawn")
+
+
+def square(value: int) -> int:
+    return value**2
+
+
+class TestOffloader:
+    @pytest.mark.asyncio
+    async def test_run_before_start_raises(self) -> None:
+        with pytest.raises(RuntimeError):
+            await offload.Offloader().run_in_thread(square, 2)
+
+    @pytest.mark.asyncio
+    async def test_run_in_thread_and_process(self) -> None:
+        offloader = offload.Offloader(max_processes=1, max_threads=1, mp_context=SPAWN)
+        offloader.start()
+        try:
+            assert await offloader.run_in_thread(square, 3) == 9
+            assert await offloader.run_in_process(square, 4) == 16
+        finally:
+            await offloader.close()
+
+        assert not offloader.started
+        assert offloader.stats("thread") == offload.PoolStats(1, 0, 0, 1)
+        assert offloader.stats("process") == offload.PoolStats(1, 0, 0, 1)
+
+    @pytest.mark.asyncio
+    async def test_stats_report_queued_calls(self) -> None:
+        offloader = offload.Offloader(max_threads=1)
+        offloader.start()
+        release = threading.Event()
+        first = asyncio.ensure_future(offloader.run_in_thread(release.wait))
+        second = asyncio.ensure_future(offloader.run_in_thread(release.wait))
+        try:
+            await asyncio.sleep(0.01)
+
+            stats = offloader.stats("thread")
+            assert stats.in_flight == 2 and stats.queued == 1
+        finally:
+            release.set()
+            await asyncio.gather(first, second)
+            await offloader.close()
+
+
+class TestOffloaded:
+    @pytest.mark.asyncio
+    async def test_offloaded_functions_use_client_offloader(self) -> None:
+        client = lightbulb.client_from_app(
+            mock.Mock(),
+            sync_commands=False,
+            offloader=offload.Offloader(max_processes=1, max_threads=1, mp_context=SPAWN),
+        )
+        await client.start()
+        try:
+            async with client.di.enter_context(lightbulb.di.Contexts.DEFAULT):
+                pid, value = await process_info(2)
+                assert pid != os.getpid() and value == 4
+
+                ident, value = await thread_info(3)
+                assert ident != threading.get_ident() and value == 6
+        finally:
+            await client.stop()
+
+        assert client.offloader is not None and not client.offloader.started
+
+    @pytest.mark.asyncio
+    async def test_offloaded_function_without_offloader_raises(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        async with client.di.enter_context(lightbulb.di.Contexts.DEFAULT):
+            with pytest.raises(RuntimeError):
+                await thread_info(1)
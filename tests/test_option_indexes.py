@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import typing as t
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+from lightbulb.commands import options as options_
+
+
+class Command(lightbulb.SlashCommand, name="command", description="description"):
+    first = lightbulb.string("first", "description")
+    second = lightbulb.integer("second", "description", default=5)
+    third = lightbulb.string("third", "description", default="default")
+
+    @lightbulb.invoke
+    async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+
+def descriptor(command: type[lightbulb.SlashCommand], name: str) -> options_.Option[t.Any, t.Any]:
+    option = command.__dict__[name]
+    assert isinstance(option, options_.Option)
+    return t.cast("options_.Option[t.Any, t.Any]", option)
+
+
+def make_option(name: str, value: object, is_focused: bool = False) -> mock.Mock:
+    option = mock.Mock(spec=hikari.AutocompleteInteractionOption, value=value, is_focused=is_focused)
+    option.name = name
+    return option
+
+
+class TestOptionIndexes:
+    @pytest.mark.asyncio
+    async def test_indexes_built_when_command_builder_created(self) -> None:
+        await Command.as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+
+        data = Command._command_data
+        assert dict(data._option_positions) == {"first": 0, "second": 1, "third": 2}
+        assert data._options_by_localized_name["second"] is data.options["second"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_options_in_any_order(self) -> None:
+        await Command.as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+
+        command = Command()
+        context = mock.Mock(options=[make_option("second", 10), make_option("first", "foo")])
+        context.interaction.resolved = None
+        command._set_context(context)
+        await command._resolve_options()
+
+        assert (command.first, command.second, command.third) == ("foo", 10, "default")
+
+    @pytest.mark.asyncio
+    async def test_resolve_options_raises_for_missing_required_option(self) -> None:
+        await Command.as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+
+        command = Command()
+        context = mock.Mock(options=[make_option("second", 10)])
+        context.interaction.resolved = None
+        command._set_context(context)
+
+        with pytest.raises(ValueError):
+            await command._resolve_options()
+
+    @pytest.mark.asyncio
+    async def test_autocomplete_context_focused_and_get_option(self) -> None:
+        await Command.as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+
+        options = [make_option("first", "foo"), make_option("second", 1, is_focused=True)]
+        context: lightbulb.AutocompleteContext[t.Any] = lightbulb.AutocompleteContext(
+            mock.Mock(), mock.Mock(), options, Command, mock.Mock()
+        )
+
+        assert context.focused is options[1]
+        assert context.get_option("first") is options[0]
+        assert context.get_option("third") is None
+        assert context.get_option("unknown") is None
+
+    def test_autocomplete_context_focused_raises_without_focused_option(self) -> None:
+        context: lightbulb.AutocompleteContext[t.Any] = lightbulb.AutocompleteContext(
+            mock.Mock(), mock.Mock(), [make_option("first", "foo")], Command, mock.Mock()
+        )
+
+        with pytest.raises(RuntimeError):
+            _ = context.focused
+
+
+class TestOptionSlots:
+    def test_slots_assigned_in_declaration_order(self) -> None:
+        assert [descriptor(Command, name)._index for name in ("first", "second", "third")] == [0, 1, 2]
+
+    def test_shared_option_copied_when_slot_differs(self) -> None:
+        shared = lightbulb.string("shared", "description")
+
+        class First(lightbulb.SlashCommand, name="first", description="description"):
+            option = shared
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        class Second(lightbulb.SlashCommand, name="second", description="description"):
+            other = lightbulb.string("other", "description")
+            option = shared
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        assert descriptor(First, "option") is shared
+        assert descriptor(First, "option")._index == 0
+        assert descriptor(Second, "option") is not shared
+        assert descriptor(Second, "option")._index == 1
+        assert descriptor(Second, "option")._data is descriptor(First, "option")._data
+
+    def test_option_returns_unbound_default_without_context(self) -> None:
+        assert Command().first is lightbulb.utils.EMPTY
+
+    @pytest.mark.asyncio
+    async def test_option_without_slot_raises(self) -> None:
+        class Mixin:
+            option = lightbulb.string("option", "description")
+
+        class MixedCommand(Mixin, lightbulb.SlashCommand, name="mixed", description="description"):
+            first = lightbulb.string("first", "description")
+
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        await MixedCommand.as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+
+        command = MixedCommand()
+        context = mock.Mock(options=[make_option("first", "foo")])
+        context.interaction.resolved = None
+        command._set_context(context)
+        await command._resolve_options()
+
+        assert command.first == "foo"
+        with pytest.raises(RuntimeError, match="not an option"):
+            _ = command.option
+
+    def test_option_access_before_resolving_raises(self) -> None:
+        command = Command()
+        command._set_context(mock.Mock())
+
+        with pytest.raises(RuntimeError):
+            _ = command.first
+
+    @pytest.mark.asyncio
+    async def test_resolved_values_stored_in_slots(self) -> None:
+        await Command.as_command_builder(hikari.Locale.EN_US, lightbulb.localization_unsupported)
+
+        command = Command()
+        context = mock.Mock(options=[make_option("third", "bar"), make_option("first", "foo")])
+        context.interaction.resolved = None
+        command._set_context(context)
+        await command._resolve_options()
+
+        assert command._resolved_options == ["foo", 5, "bar"]
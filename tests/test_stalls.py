@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+import lightbulb
+from lightbulb import stalls
+
+
+def _block(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestStallDetector:
+    @pytest.mark.asyncio
+    async def test_monitor_records_blocking_step(self) -> None:
+        detector = stalls.StallDetector(threshold=0.01)
+
+        async def work() -> int:
+            await asyncio.sleep(0.05)
+            _block(0.02)
+            return 1
+
+        assert await detector.monitor(work(), "task", "work") == 1
+        assert [(s.kind, s.name) for s in detector.stalls] == [("task", "work")]
+        # The time spent suspended in 'sleep' is not counted
+        assert detector.stalls[0].duration_ns < 50_000_000
+
+    @pytest.mark.asyncio
+    async def test_monitor_attributes_to_innermost_callable(self) -> None:
+        detector = stalls.StallDetector(threshold=0.01)
+
+        async def inner() -> None:
+            _block(0.02)
+
+        async def outer() -> None:
+            await detector.monitor(inner(), "hook", "inner")
+
+        await detector.monitor(outer(), "command", "outer")
+        assert [(s.kind, s.name) for s in detector.stalls] == [("hook", "inner")]
+
+    @pytest.mark.asyncio
+    async def test_monitor_propagates_exceptions_and_cancellation(self) -> None:
+        detector = stalls.StallDetector(threshold=0.01)
+
+        async def fails() -> None:
+            await asyncio.sleep(0)
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            await detector.monitor(fails(), "task", "fails")
+
+        cancelled = False
+
+        async def waits() -> None:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        task = asyncio.ensure_future(detector.monitor(waits(), "task", "waits"))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled
+
+    def test_section_records_synchronous_block(self) -> None:
+        detector = stalls.StallDetector(threshold=0.01)
+        with detector.section("hook", "fast"):
+            pass
+        with detector.section("hook", "slow"):
+            _block(0.02)
+
+        assert [(s.kind, s.name) for s in detector.stalls] == [("hook", "slow")]
+
+    @pytest.mark.asyncio
+    async def test_sampler_records_unattributed_lag(self) -> None:
+        detector = stalls.StallDetector(threshold=0.02, sample_interval=0.01)
+        detector.start()
+        try:
+            await asyncio.sleep(0.02)
+            _block(0.05)
+            await asyncio.sleep(0.03)
+        finally:
+            await detector.close()
+
+        assert not detector.running
+        assert detector.max_lag >= 0.02
+        assert any(s.kind == stalls.UNATTRIBUTED for s in detector.stalls)
+
+    def test_top_offenders_and_report(self) -> None:
+        detector = stalls.StallDetector()
+        detector._record("command", "a", 10_000_000)
+        detector._record("command", "a", 30_000_000)
+        detector._record("task", "b", 35_000_000)
+        detector._record("listener", "c", 1_000_000)
+
+        offenders = detector.top_offenders(2)
+        assert [(o.name, o.count, o.total_ns, o.max_ns) for o in offenders] == [
+            ("a", 2, 40_000_000, 30_000_000),
+            ("b", 1, 35_000_000, 35_000_000),
+        ]
+        assert detector.top_offenders(window=-1) == []
+
+        report = detector.report(1)
+        assert "command" in report and "40.0" in report and "task" not in report
+
+    def test_history_is_bounded(self) -> None:
+        detector = stalls.StallDetector(history=2)
+        for name in "abc":
+            detector._record("task", name, 1)
+
+        assert [s.name for s in detector.stalls] == ["b", "c"]
+
+
+class TestPipelineStalls:
+    @pytest.mark.asyncio
+    async def test_pipeline_attributes_stalls_to_hooks_and_invoke(self) -> None:
+        detector = stalls.StallDetector(threshold=0.01)
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, stall_detector=detector)
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS)
+        def sync_check(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+            _block(0.02)
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS)
+        async def async_check(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+            _block(0.02)
+
+        class Command(
+            lightbulb.SlashCommand, name="command", description="description", hooks=[sync_check, async_check]
+        ):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None:
+                _block(0.02)
+
+        context = lightbulb.Context(client, mock.Mock(), [], Command(), mock.Mock())
+        await client._execute_command_context(context)
+
+        assert [(s.kind, s.name) for s in detector.stalls] == [
+            ("hook", "sync_check"),
+            ("hook", "async_check"),
+            ("command", "command"),
+        ]
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2023-present tandemdude
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+import json
+import logging
+import pathlib
+from unittest import mock
+
+import hikari
+import pytest
+
+import lightbulb
+from lightbulb import tracing
+
+
+class TestTracer:
+    def test_nested_spans_share_trace(self) -> None:
+        buffer = tracing.RingBufferExporter()
+        tracer = tracing.Tracer(buffer)
+
+        with tracer.span("outer", foo="bar") as outer:
+            assert tracing.current_span() is outer
+            with tracing.span("inner") as inner:
+                assert inner is not None
+                assert tracing.current_trace_id() == outer.trace_id
+
+        assert tracing.current_span() is None
+        assert [s.name for s in buffer.spans] == ["inner", "outer"]
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_id == outer.span_id
+        assert outer.parent_id is None
+        assert outer.attributes == {"foo": "bar"}
+
+    def test_separate_root_spans_start_new_traces(self) -> None:
+        tracer = tracing.Tracer()
+
+        with tracer.span("first") as first:
+            pass
+        with tracer.span("second") as second:
+            pass
+
+        assert first.trace_id != second.trace_id
+
+    def test_span_records_error(self) -> None:
+        buffer = tracing.RingBufferExporter()
+        tracer = tracing.Tracer(buffer)
+
+        with pytest.raises(ValueError), tracer.span("failing"):
+            raise ValueError
+
+        assert buffer.spans[0].error == "ValueError"
+
+    def test_exporter_failure_does_not_propagate(self) -> None:
+        broken = mock.Mock(export=mock.Mock(side_effect=RuntimeError))
+        buffer = tracing.RingBufferExporter()
+
+        with tracing.Tracer(broken, buffer).span("span"):
+            pass
+
+        assert len(buffer.spans) == 1
+
+    def test_module_span_is_noop_without_active_trace(self) -> None:
+        with tracing.span("nothing") as span:
+            assert span is None
+
+
+class TestRingBufferExporter:
+    def test_oldest_spans_are_discarded(self) -> None:
+        buffer = tracing.RingBufferExporter(capacity=2)
+        for i in range(3):
+            buffer.export(tracing.Span(str(i), "trace", str(i), None, 0))
+
+        assert [s.name for s in buffer.spans] == ["1", "2"]
+
+    def test_slowest(self) -> None:
+        buffer = tracing.RingBufferExporter()
+        for i, duration in enumerate([5, 50, 20, 1]):
+            buffer.export(tracing.Span("a" if i % 2 else "b", "trace", str(i), None, 0, duration_ns=duration))
+
+        assert [s.duration_ns for s in buffer.slowest(2)] == [50, 20]
+        assert [s.duration_ns for s in buffer.slowest(name="b")] == [20, 5]
+
+
+class TestJsonLinesExporter:
+    def test_spans_written_as_json_lines(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "spans.jsonl"
+        exporter = tracing.JsonLinesExporter(path, flush_every=10)
+        tracer = tracing.Tracer(exporter)
+
+        with tracer.span("outer", locale=hikari.Locale.EN_US, user=hikari.Snowflake(123)), tracing.span("inner"):
+            pass
+        tracer.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["inner", "outer"]
+        assert lines[1]["attributes"] == {"locale": "en-US", "user": 123}
+        assert lines[0]["parent_id"] == lines[1]["span_id"]
+
+
+class TestTraceIdFilter:
+    def test_filter_adds_trace_id(self) -> None:
+        log_filter = tracing.TraceIdFilter()
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, "message", (), None)
+
+        assert log_filter.filter(record) and record.trace_id == "-"  # type: ignore[reportAttributeAccessIssue]
+        with tracing.Tracer().span("span") as span:
+            log_filter.filter(record)
+        assert record.trace_id == span.trace_id  # type: ignore[reportAttributeAccessIssue]
+
+
+class TestClientTracing:
+    @pytest.mark.asyncio
+    async def test_command_execution_spans(self) -> None:
+        buffer = tracing.RingBufferExporter()
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, tracer=tracing.Tracer(buffer))
+
+        @lightbulb.hook(lightbulb.ExecutionSteps.CHECKS)
+        def check(_: lightbulb.ExecutionPipeline, __: lightbulb.Context) -> None:
+            raise RuntimeError
+
+        class Command(lightbulb.SlashCommand, name="command", description="description", hooks=[check]):
+            @lightbulb.invoke
+            async def invoke(self, ctx: lightbulb.Context) -> None: ...
+
+        interaction = mock.AsyncMock()
+        context = lightbulb.Context(client, interaction, [], Command(), asyncio.Event())
+        assert client.tracer is not None
+        with client.tracer.span("root"):
+            await client._execute_command_context(context)
+            await context.respond("foo")
+            await context.respond("bar")
+
+        by_name: dict[str, list[tracing.Span]] = {}
+        for span in buffer.spans:
+            by_name.setdefault(span.name, []).append(span)
+
+        (command_span,) = by_name["lightbulb.command"]
+        assert command_span.attributes["command"] == "command"
+        # Nothing requests a dependency, so only the default container is created
+        assert [s.attributes["context"] for s in by_name["lightbulb.di_enter"]] == ["DEFAULT"]
+
+        steps = {s.attributes["step"]: s for s in by_name["lightbulb.execution_step"]}
+        assert set(steps) == {step.name for step in client.execution_step_order}
+        assert all(s.parent_id == command_span.span_id for s in steps.values())
+        assert steps["CHECKS"].error == "RuntimeError"
+        assert steps["INVOKE"].error is None
+
+        assert [s.attributes["response_type"] for s in by_name["lightbulb.initial_response"]] == ["MESSAGE_CREATE"]
+        assert len(by_name["lightbulb.followup"]) == 1
+        assert len({s.trace_id for s in buffer.spans}) == 1
+
+    @pytest.mark.asyncio
+    async def test_modal_interaction_spans(self) -> None:
+        buffer = tracing.RingBufferExporter()
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False, tracer=tracing.Tracer(buffer))
+        client._started = True
+
+        trace_ids: list[str | None] = []
+
+        async def handler(_: hikari.ModalInteraction, __: object) -> None:
+            trace_ids.append(tracing.current_trace_id())
+
+        client._attached_modals["foo"] = handler
+        await client.handle_interaction_create(mock.Mock(spec=hikari.ModalInteraction, custom_id="foo"))
+
+        modal, root = buffer.spans
+        assert root.name == "lightbulb.interaction" and root.parent_id is None
+        assert modal.name == "lightbulb.modal" and modal.parent_id == root.span_id
+        assert trace_ids == [root.trace_id]
+
+    @pytest.mark.asyncio
+    async def test_no_spans_without_tracer(self) -> None:
+        client = lightbulb.client_from_app(mock.Mock(), sync_commands=False)
+        client._started = True
+
+        async def handler(_: hikari.ModalInteraction, __: object) -> None:
+            assert tracing.current_span() is None
+
+        client._attached_modals["foo"] = handler
+        await client.handle_interaction_create(mock.Mock(spec=hikari.ModalInteraction, custom_id="foo"))